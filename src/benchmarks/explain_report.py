@@ -0,0 +1,82 @@
+import argparse
+import json
+import sys
+from typing import List
+
+from src.clients.sql_client.explain import BUILTIN_TARGETS, PlanTarget
+from src.clients.sql_client.seeding import SeedPlan
+
+
+def parse_seed_plan(value: str) -> SeedPlan:
+    """SeedPlan из строки вида users=100000,posts=1000000,comments=5000000,votes=2000000."""
+    try:
+        counts = dict(item.split("=", 1) for item in value.split(","))
+        return SeedPlan(**{name: int(count) for name, count in counts.items()})
+    except (TypeError, ValueError) as e:
+        raise argparse.ArgumentTypeError(f"Ожидается users=N,posts=N,comments=N,votes=N: {e}")
+
+
+def parse_custom_query(value: str) -> PlanTarget:
+    """Запрос без параметров из строки name=SQL."""
+    name, _, sql = value.partition("=")
+    if not sql:
+        raise argparse.ArgumentTypeError("Ожидается name=SQL")
+    return PlanTarget(name.strip(), sql, source="custom")
+
+
+def main() -> None:
+    """Снять планы запросов на засеянной базе, вывести проблемы и недостающие индексы."""
+    builtin = {target.name: target for target in BUILTIN_TARGETS}
+    parser = argparse.ArgumentParser(description="EXPLAIN (ANALYZE, BUFFERS) горячих запросов: Seq Scan и "
+                                                 "ошибки оценки строк")
+    parser.add_argument("--queries", nargs="*", default=list(builtin), choices=list(builtin),
+                        help="Встроенные запросы (выборки проверок и запросы сервиса)")
+    parser.add_argument("--sql", action="append", type=parse_custom_query, default=[],
+                        help="Дополнительный запрос name=SQL (можно несколько)")
+    parser.add_argument("--harvest", type=int, default=20,
+                        help="Сколько самых дорогих запросов взять из pg_stat_statements (0 — не брать)")
+    parser.add_argument("--snapshot", default=None, help="Восстановить базу из снапшота перед замером")
+    parser.add_argument("--seed-plan", type=parse_seed_plan, default=None,
+                        help="Засеять базу перед замером: users=N,posts=N,comments=N,votes=N")
+    parser.add_argument("--min-table-rows", type=int, default=10_000,
+                        help="Seq Scan таблиц меньше этого размера не считается проблемой")
+    parser.add_argument("--estimate-ratio", type=float, default=10.0,
+                        help="Во сколько раз оценка строк может расходиться с фактом")
+    parser.add_argument("--baseline", default=None, help="JSON предыдущего прогона для сравнения")
+    parser.add_argument("--json", dest="json_path", default=None, help="Сохранить отчёт в JSON-файл")
+    parser.add_argument("--fail-on-issues", action="store_true",
+                        help="Завершиться с кодом 1, если найдены Seq Scan или ошибки оценки")
+    args = parser.parse_args()
+
+    from src.clients.sql_client.sqlalchemy_client import SqlAlchemyClient
+
+    sql_client = SqlAlchemyClient()
+    try:
+        if args.snapshot:
+            sql_client.restore_snapshot(args.snapshot)
+        if args.seed_plan:
+            sql_client.seed_dataset(args.seed_plan)
+        if args.harvest and not sql_client.enable_pg_stat_statements():
+            sys.stderr.write("pg_stat_statements недоступен (нужен shared_preload_libraries=pg_stat_statements): "
+                             "запросы из статистики не берутся\n")
+            args.harvest = 0
+        targets: List[PlanTarget] = [builtin[name] for name in args.queries] + args.sql
+        report = sql_client.explain_queries(targets, harvest=args.harvest, min_table_rows=args.min_table_rows,
+                                            estimate_ratio=args.estimate_ratio)
+    finally:
+        sql_client.disconnect()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    sys.stdout.write(report.format_table(baseline) + "\n")
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report.to_dict(), f, ensure_ascii=False, indent=2, default=str)
+    if args.fail_on_issues and report.issues:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
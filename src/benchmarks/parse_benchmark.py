@@ -0,0 +1,154 @@
+import argparse
+import json
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Type
+
+from pydantic import BaseModel
+
+from src.benchmarks import payloads
+from src.models.api_model import PostDataResponse, PostsResponse, ProfileResponse
+from src.models.validation import ValidationMode, fast_adapter, validate_response
+from src.utils.comment_tree import CommentTreeIndex
+
+
+@dataclass
+class BenchmarkCase:
+    """Тело ответа и модель, которой оно валидируется; items — количество объектов в теле."""
+
+    name: str
+    model: Type[BaseModel]
+    body: bytes
+    items: int
+
+
+@dataclass
+class BenchmarkResult:
+    """Время одного разбора тела ответа в выбранном режиме (медиана и минимум по раундам), в микросекундах."""
+
+    case: str
+    model: str
+    mode: str
+    items: int
+    bytes: int
+    median_us: float
+    min_us: float
+    per_item_us: float
+    mb_per_s: float
+
+
+def default_cases() -> List[BenchmarkCase]:
+    """Профиль, страницы постов разного размера и посты с широкими и глубокими деревьями комментариев.
+
+    Цепочка из 500 ответов глубже лимита вложенности парсера pydantic-core и разбирается итеративно.
+    """
+    cases = [BenchmarkCase("profile", ProfileResponse, payloads.profile(), 1)]
+    for size in (10, 100, 1000, 5000):
+        cases.append(BenchmarkCase(f"posts_page[{size}]", PostsResponse, payloads.posts_page(size), size))
+    for breadth, depth in ((50, 1), (10, 3), (2, 10), (1, 500)):
+        items = sum(breadth ** level for level in range(1, depth + 1)) + 1
+        cases.append(BenchmarkCase(f"post_comments[{breadth}x{depth}]", PostDataResponse,
+                                   payloads.post_with_comments(breadth, depth), items))
+    return cases
+
+
+def _time_call(func: Callable[[], object], rounds: int, min_round_time: float) -> List[float]:
+    """Замерить func: в каждом раунде вызывать её, пока раунд не займёт min_round_time; вернуть время одного вызова."""
+    func()
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_round_time or number >= 1_000_000:
+            break
+        number *= 2
+    samples = [elapsed / number]
+    for _ in range(rounds - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    return samples
+
+
+def check_equivalence(case: BenchmarkCase) -> None:
+    """Убедиться, что быстрый режим даёт те же данные, что и строгий, на корректном теле ответа."""
+    strict = validate_response(case.model, case.body, ValidationMode.STRICT)
+    fast = validate_response(case.model, case.body, ValidationMode.FAST)
+    if issubclass(case.model, PostDataResponse):
+        # model_dump рекурсивен и не проходит глубокие цепочки ответов, деревья сравниваются по индексу.
+        same = (CommentTreeIndex.from_api(strict.responseData.comments).nodes
+                == CommentTreeIndex.from_api(fast.responseData.comments).nodes
+                and strict.responseData.post.model_dump() == fast.responseData.post.model_dump())
+    else:
+        same = strict.model_dump() == fast.model_dump()
+    if not same:
+        raise AssertionError(f"Режим fast расходится со strict на {case.name}")
+
+
+def run(cases: Sequence[BenchmarkCase], modes: Sequence[ValidationMode], rounds: int = 5,
+        min_round_time: float = 0.05) -> List[BenchmarkResult]:
+    """Прогнать каждый случай в каждом режиме валидации."""
+    results = []
+    for case in cases:
+        check_equivalence(case)
+        fast_adapter(case.model)
+        for mode in modes:
+            samples = _time_call(lambda: validate_response(case.model, case.body, mode), rounds, min_round_time)
+            median = statistics.median(samples)
+            results.append(BenchmarkResult(
+                case=case.name,
+                model=case.model.__name__,
+                mode=mode.value,
+                items=case.items,
+                bytes=len(case.body),
+                median_us=round(median * 1e6, 1),
+                min_us=round(min(samples) * 1e6, 1),
+                per_item_us=round(median * 1e6 / max(case.items, 1), 2),
+                mb_per_s=round(len(case.body) / median / 1e6, 1),
+            ))
+    return results
+
+
+def format_table(results: Sequence[BenchmarkResult]) -> str:
+    """Текстовая таблица результатов с ускорением относительно режима strict."""
+    strict: Dict[str, float] = {r.case: r.median_us for r in results if r.mode == ValidationMode.STRICT.value}
+    header = (f"{'case':<24}{'mode':<9}{'items':>7}{'bytes':>10}{'median us':>12}"
+              f"{'min us':>11}{'us/item':>9}{'MB/s':>8}{'speedup':>9}")
+    lines = [header, "-" * len(header)]
+    for r in results:
+        base: Optional[float] = strict.get(r.case)
+        speedup = f"{base / r.median_us:.1f}x" if base and r.median_us else "-"
+        lines.append(f"{r.case:<24}{r.mode:<9}{r.items:>7}{r.bytes:>10}{r.median_us:>12.1f}"
+                     f"{r.min_us:>11.1f}{r.per_item_us:>9.2f}{r.mb_per_s:>8.1f}{speedup:>9}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Запустить бенчмарк разбора ответов и вывести таблицу."""
+    parser = argparse.ArgumentParser(description="Бенчмарк валидации ответов API моделями Pydantic")
+    parser.add_argument("--modes", nargs="+", default=[m.value for m in ValidationMode],
+                        choices=[m.value for m in ValidationMode], help="Режимы валидации")
+    parser.add_argument("--cases", nargs="+", default=None, help="Подстроки имён случаев для запуска")
+    parser.add_argument("--rounds", type=int, default=5, help="Количество раундов замера")
+    parser.add_argument("--min-round-time", type=float, default=0.05, help="Минимальная длительность раунда, с")
+    parser.add_argument("--json", dest="json_path", default=None, help="Сохранить результаты в JSON-файл")
+    args = parser.parse_args()
+
+    cases = default_cases()
+    if args.cases:
+        cases = [c for c in cases if any(pattern in c.name for pattern in args.cases)]
+    results = run(cases, [ValidationMode(m) for m in args.modes], rounds=args.rounds,
+                  min_round_time=args.min_round_time)
+    sys.stdout.write(format_table(results) + "\n")
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump([asdict(r) for r in results], f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
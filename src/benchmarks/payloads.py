@@ -0,0 +1,127 @@
+import json
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+_BASE_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def _uuid(prefix: int, index: int) -> str:
+    """Детерминированный UUID, чтобы тела ответов были одинаковыми от прогона к прогону."""
+    return str(uuid.UUID(int=(prefix << 96) | index))
+
+
+def _timestamp(index: int) -> str:
+    return (_BASE_TIME + timedelta(seconds=index)).isoformat()
+
+
+def post_item(index: int) -> Dict[str, Any]:
+    """Пост в формате PostPublishComponent."""
+    return {
+        "id": _uuid(1, index),
+        "title": f"Post title {index}",
+        "content": f"Post content {index} " * 8,
+        "author": f"author{index % 97}@example.com",
+        "createdAt": _timestamp(index),
+    }
+
+
+def comment_tree(breadth: int, depth: int) -> List[Dict[str, Any]]:
+    """Дерево комментариев: breadth ответов на каждом уровне, depth уровней вложенности.
+
+    Строится без рекурсии, чтобы можно было получить цепочки ответов глубиной в тысячи уровней.
+    """
+    counter = 0
+    roots: List[Dict[str, Any]] = []
+    stack = [(roots, 0)]
+    while stack:
+        siblings, level = stack.pop()
+        if level >= depth:
+            continue
+        for _ in range(breadth):
+            counter += 1
+            node = {
+                "id": _uuid(2, counter),
+                "text": f"Comment {counter}",
+                "author": f"commenter{counter % 89}@example.com",
+                "createdAt": _timestamp(counter),
+                "replies": [],
+            }
+            siblings.append(node)
+            stack.append((node["replies"], level + 1))
+    return roots
+
+
+def dumps_comments(comments: List[Dict[str, Any]]) -> str:
+    """Сериализовать дерево комментариев в JSON без рекурсии (json.dumps падает на глубоких цепочках)."""
+    parts = ["["]
+    stack = [iter(comments)]
+    first = [True]
+    while stack:
+        node = next(stack[-1], None)
+        if node is None:
+            stack.pop()
+            first.pop()
+            parts.append("]}" if stack else "]")
+            continue
+        if not first[-1]:
+            parts.append(",")
+        first[-1] = False
+        head = json.dumps({key: value for key, value in node.items() if key != "replies"})
+        parts.append(head[:-1] + ', "replies": [')
+        stack.append(iter(node["replies"]))
+        first.append(True)
+    return "".join(parts)
+
+
+def count_comments(comments: List[Dict[str, Any]]) -> int:
+    """Количество комментариев в дереве, включая вложенные ответы."""
+    total = 0
+    stack = list(comments)
+    while stack:
+        node = stack.pop()
+        total += 1
+        stack.extend(node["replies"])
+    return total
+
+
+def posts_page(size: int) -> bytes:
+    """Тело ответа GET /api/v1/posts со страницей из size постов."""
+    return json.dumps({
+        "status": "ok",
+        "responseData": {
+            "content": [post_item(i) for i in range(size)],
+            "pageNumber": 0,
+            "pageSize": max(size, 1),
+            "totalElements": size,
+            "totalPages": 1,
+        },
+    }).encode()
+
+
+def post_with_comments(breadth: int, depth: int) -> bytes:
+    """Тело ответа GET /api/v1/posts/{postId} с деревом комментариев."""
+    envelope = json.dumps({
+        "status": "ok",
+        "responseData": {
+            "post": post_item(0),
+            "comments": "__COMMENTS__",
+            "voteScore": 1,
+            "hasMoreComments": False,
+        },
+    })
+    return envelope.replace('"__COMMENTS__"', dumps_comments(comment_tree(breadth, depth))).encode()
+
+
+def profile() -> bytes:
+    """Тело ответа POST /api/v1/profile/info."""
+    return json.dumps({
+        "status": "ok",
+        "responseData": {
+            "id": 1,
+            "email": "user@example.com",
+            "username": "user",
+            "bannedUntil": None,
+            "authorities": ["USER"],
+        },
+    }).encode()
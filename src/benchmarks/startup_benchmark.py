@@ -0,0 +1,120 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Что импортирует процесс при старте: conftest (каждый воркер xdist), клиенты и генератор нагрузки.
+IMPORT_TARGETS = {
+    "conftest": "import sys; sys.path[:0] = ['tests', '.']; import conftest",
+    "http_clients": "import src.clients.http_client.post_controller",
+    "load_runner": "import src.load.runner",
+}
+COLLECT_ARGS = ["-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider"]
+
+
+@dataclass
+class StartupResult:
+    """Время старта процесса (медиана и минимум по раундам), в миллисекундах.
+
+    kind — import (python -X importtime -c ...) или collect (pytest --collect-only). Для импорта packages —
+    собственное время импорта модулей, сгруппированное по пакету верхнего уровня (медиана по раундам).
+    """
+
+    name: str
+    kind: str
+    median_ms: float
+    min_ms: float
+    rounds: int
+    packages: Dict[str, float] = field(default_factory=dict)
+
+
+def parse_importtime(stderr: str) -> Tuple[float, Dict[str, float]]:
+    """Разобрать вывод -X importtime: суммарное время импорта и собственное время по пакетам, в мс."""
+    total_us = 0
+    packages: Dict[str, int] = defaultdict(int)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        packages[name.strip().split(".")[0]] += int(self_us)
+        # Модули верхнего уровня записаны без отступа: их cumulative покрывает все вложенные импорты.
+        if name.startswith(" ") and not name.startswith("  "):
+            total_us += int(cumulative_us)
+    return total_us / 1000, {package: value / 1000 for package, value in packages.items()}
+
+
+def measure_import(name: str, code: str, rounds: int = 5, top: int = 10) -> StartupResult:
+    """Замерить импорт code в новом процессе интерпретатора rounds раз."""
+    totals: List[float] = []
+    per_package: Dict[str, List[float]] = defaultdict(list)
+    for _ in range(rounds):
+        completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT,
+                                   capture_output=True, text=True, check=True)
+        total, packages = parse_importtime(completed.stderr)
+        totals.append(total)
+        for package, value in packages.items():
+            per_package[package].append(value)
+    medians = {package: round(statistics.median(values), 1) for package, values in per_package.items()}
+    heaviest = dict(sorted(medians.items(), key=lambda item: item[1], reverse=True)[:top])
+    return StartupResult(name, "import", round(statistics.median(totals), 1), round(min(totals), 1), rounds, heaviest)
+
+
+def measure_collection(rounds: int = 5, pytest_args: Sequence[str] = ()) -> StartupResult:
+    """Замерить полное время pytest --collect-only (старт интерпретатора, плагины, conftest, модули тестов)."""
+    samples: List[float] = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *COLLECT_ARGS, *pytest_args], cwd=ROOT, capture_output=True, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return StartupResult("pytest_collect", "collect", round(statistics.median(samples), 1),
+                         round(min(samples), 1), rounds)
+
+
+def format_table(results: Sequence[StartupResult], baseline: Optional[Dict[str, float]] = None) -> str:
+    """Текстовая таблица результатов; с baseline — изменение медианы относительно сохранённого прогона."""
+    header = f"{'target':<18}{'kind':<9}{'median ms':>11}{'min ms':>9}{'delta':>9}  heaviest packages (self ms)"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        base = (baseline or {}).get(r.name)
+        delta = f"{(r.median_ms - base) / base * 100:+.0f}%" if base else "-"
+        heaviest = ", ".join(f"{package} {value:.0f}" for package, value in list(r.packages.items())[:5])
+        lines.append(f"{r.name:<18}{r.kind:<9}{r.median_ms:>11.1f}{r.min_ms:>9.1f}{delta:>9}  {heaviest}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Замерить импорт и сбор тестов и вывести таблицу."""
+    parser = argparse.ArgumentParser(description="Бенчмарк времени старта: -X importtime и pytest --collect-only")
+    parser.add_argument("--targets", nargs="+", default=list(IMPORT_TARGETS), choices=list(IMPORT_TARGETS),
+                        help="Что импортировать")
+    parser.add_argument("--rounds", type=int, default=5, help="Количество запусков каждого замера")
+    parser.add_argument("--no-collect", action="store_true", help="Не замерять pytest --collect-only")
+    parser.add_argument("--pytest-args", nargs=argparse.REMAINDER, default=[],
+                        help="Дополнительные аргументы pytest для замера сбора (например, -n 4)")
+    parser.add_argument("--baseline", default=None, help="JSON предыдущего прогона для сравнения")
+    parser.add_argument("--json", dest="json_path", default=None, help="Сохранить результаты в JSON-файл")
+    args = parser.parse_args()
+
+    results = [measure_import(name, IMPORT_TARGETS[name], rounds=args.rounds) for name in args.targets]
+    if not args.no_collect:
+        results.append(measure_collection(rounds=args.rounds, pytest_args=args.pytest_args))
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = {item["name"]: item["median_ms"] for item in json.load(f)}
+    sys.stdout.write(format_table(results, baseline) + "\n")
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump([asdict(r) for r in results], f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
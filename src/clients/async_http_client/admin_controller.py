@@ -0,0 +1,84 @@
+import time
+from typing import Optional
+
+from src.clients.async_http_client.base_client import AsyncBaseClient
+from src.clients.async_http_client.profile_controller import AsyncProfileController
+from src.config.api_endpoints import ApiEndpoints
+from src.models.api_model import (
+    AdminUserResponse,
+    BanUserResponse,
+    UnbanUserResponse,
+)
+
+
+class AsyncAdminController:
+    """Асинхронный клиент для работы с админскими операциями через API."""
+
+    def __init__(self, api_client: AsyncBaseClient, cache_role_check: bool = True, role_cache_ttl: float = 300.0):
+        """Проверка роли ADMIN кешируется на role_cache_ttl секунд для текущего токена клиента.
+
+        Кеш сбрасывается при смене токена (set_token/clear_token), отключается cache_role_check=False —
+        например, когда тест намеренно меняет роль пользователя.
+        """
+        self.api = api_client
+        self.cache_role_check = cache_role_check
+        self.role_cache_ttl = role_cache_ttl
+        self._admin_token: Optional[str] = None
+        self._admin_checked_at = 0.0
+
+    async def get_user_profile(self, user_id: int) -> AdminUserResponse:
+        """Получить профиль пользователя по ID."""
+        await self._check_admin()
+        endpoint = ApiEndpoints.ADMIN_PROFILE_INFO.format(user_id=str(user_id))
+        response = await self.api.post_parse_request(
+            path=endpoint,
+            response_model=AdminUserResponse
+        )
+        return response
+
+    async def ban_user(self, email: str, ban_duration: int) -> BanUserResponse:
+        """Заблокировать пользователя по email на заданный период."""
+        await self._check_admin()
+        endpoint = ApiEndpoints.ADMIN_BAN_USER.format(email=str(email))
+        params = {"email": email, "forSeconds": ban_duration}
+        response = await self.api.post_parse_request(
+            path=endpoint,
+            response_model=BanUserResponse,
+            params=params)
+
+        return response
+
+    async def unban_user(self, email: str) -> UnbanUserResponse:
+        """Разблокировать пользователя по email."""
+        await self._check_admin()
+        endpoint = ApiEndpoints.ADMIN_UNBAN_USER.format(email=str(email))
+        params = {"email": email}
+        response = await self.api.post_parse_request(
+            path=endpoint,
+            response_model=UnbanUserResponse,
+            params=params)
+
+        return response
+
+    def invalidate_role_cache(self) -> None:
+        """Сбросить закешированную проверку роли ADMIN."""
+        self._admin_token = None
+        self._admin_checked_at = 0.0
+
+    def _role_cached(self) -> bool:
+        return (self.cache_role_check and self.api.token is not None and self._admin_token == self.api.token
+                and time.monotonic() - self._admin_checked_at < self.role_cache_ttl)
+
+    async def _check_admin(self) -> None:
+        """Проверить роль ADMIN (запросом профиля, если для текущего токена нет свежей проверки)."""
+        if self._role_cached():
+            return
+        self.invalidate_role_cache()
+        token = self.api.token
+        profile_controller = AsyncProfileController(self.api)
+        profile_response = await profile_controller.get_profile_info()
+        if not profile_response.responseData or "ROLE_ADMIN" not in profile_response.responseData.authorities:
+            raise PermissionError("Доступ запрещён: требуется роль ADMIN")
+        if self.cache_role_check and token is not None and token == self.api.token:
+            self._admin_token = token
+            self._admin_checked_at = time.monotonic()
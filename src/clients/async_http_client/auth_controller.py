@@ -0,0 +1,31 @@
+from src.clients.async_http_client.base_client import AsyncBaseClient
+from src.config.api_endpoints import ApiEndpoints
+from src.models.api_model import ApiResponse, LoginRequest, RegistrationRequest
+
+
+class AsyncAuthController:
+    """Асинхронный клиент для работы с регистрацией и авторизацией через API."""
+
+    def __init__(self, base_client: AsyncBaseClient) -> None:
+        self.api = base_client
+
+    async def register(self, data: RegistrationRequest) -> ApiResponse:
+        """Регистрация нового пользователя с валидацией данных через Pydantic."""
+        response = await self.api.post_parse_request(
+            path=ApiEndpoints.AUTH_REGISTER,
+            response_model=ApiResponse,
+            json=data.model_dump()
+        )
+        return response
+
+    async def login(self, data: LoginRequest) -> ApiResponse:
+        """Авторизация пользователя с валидацией данных через Pydantic."""
+        response = await self.api.post_parse_request(
+            path=ApiEndpoints.AUTH_LOGIN,
+            response_model=ApiResponse,
+            json=data.model_dump()
+        )
+        token = (response.responseData or {}).get("jwt")
+        if token:
+            self.api.set_token(token)
+        return response
@@ -0,0 +1,136 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional, Type
+
+import httpx
+
+from src.clients.http_client.base_client import BaseClient, T
+from src.clients.http_client.transport import keepalive_socket_options
+from src.config.api_endpoints import ApiEndpoints
+from src.config.http_config import HttpClientConfig
+from src.models.validation import ValidationMode
+from src.utils.request_timing import timing_collector
+
+# httpx пишет INFO-запись на каждый запрос; под нагрузкой это заметная доля времени клиента.
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
+class AsyncBaseClient:
+    """Асинхронный HTTP-клиент на httpx с тем же контрактом, что и BaseClient.
+
+    Один экземпляр держит пул соединений и позволяет выполнять сотни запросов одновременно
+    в одном событийном цикле. Шаги Allure здесь не создаются: стек шагов Allure привязан к потоку
+    и ломается при конкурентных задачах asyncio.
+    """
+
+    def __init__(self, max_connections: Optional[int] = None, timeout: Optional[float] = 30.0,
+                 validation_mode: Optional[str] = None) -> None:
+        """Инициализация клиента с базовым URL и асинхронной сессией httpx.
+
+        Размер пула и режим валидации ответов по умолчанию берутся из HttpClientConfig.
+        """
+        self.base_url = ApiEndpoints.BASE_URL
+        if max_connections is None:
+            max_connections = HttpClientConfig.ASYNC_MAX_CONNECTIONS
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        self.session = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(limits=limits, socket_options=keepalive_socket_options()),
+            timeout=timeout,
+        )
+        self.validation_mode = ValidationMode(validation_mode or HttpClientConfig.RESPONSE_VALIDATION_MODE)
+        self._token: Optional[str] = None
+
+    async def warmup(self, connections: Optional[int] = None) -> int:
+        """Открыть соединения с сервисом заранее параллельными HEAD-запросами к базовому URL.
+
+        По умолчанию количество соединений берётся из HttpClientConfig.PREWARM_CONNECTIONS.
+        Статус ответа не важен: нужно только, чтобы соединения остались в пуле.
+        """
+        connections = HttpClientConfig.PREWARM_CONNECTIONS if connections is None else connections
+        if connections <= 0:
+            return 0
+        results = await asyncio.gather(
+            *(self.session.head(self.base_url) for _ in range(connections)), return_exceptions=True)
+        return sum(1 for result in results if not isinstance(result, Exception))
+
+    async def __aenter__(self) -> "AsyncBaseClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close_session()
+
+    def set_token(self, token: str) -> None:
+        """Установить JWT токен для авторизации.
+
+        Токен добавляется в заголовок Authorization для всех последующих запросов.
+        """
+        self._token = token
+        self.session.headers.update({"Authorization": f"Bearer {token}"})
+
+    @property
+    def token(self) -> Optional[str]:
+        """Текущий JWT токен, используемый для авторизации."""
+        return self._token
+
+    def clear_token(self) -> None:
+        """Очистить JWT токен из заголовков сессии."""
+        self._token = None
+        self.session.headers.pop('Authorization', None)
+
+    def _url(self, path: str) -> str:
+        """Сформировать полный URL, объединяя базовый URL и путь эндпоинта."""
+        return f"{self.base_url}{path}"
+
+    async def _send(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Выполнить запрос и записать замеры в timing_collector (см. BaseClient._send)."""
+        start = time.perf_counter()
+        request = self.session.build_request(method, self._url(path), **kwargs)
+        response = await self.session.send(request, stream=True)
+        headers_at = time.perf_counter()
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        body_at = time.perf_counter()
+        response.timing = timing_collector.add(
+            method, path, response.status_code, start, headers_at, body_at,
+            bytes_out=len(request.content), decoded_bytes_in=len(content))
+        return response
+
+    async def post_request(self, path: str, json: Optional[Dict[str, Any]] = None,
+                           params: Optional[Dict[str, Any]] = None, expected_status: int = 200) -> httpx.Response:
+        """Отправить POST-запрос по указанному пути с JSON-данными и проверить статус."""
+        response = await self._send("POST", path, json=json, params=params)
+        BaseClient._check_status(response, expected_status)
+        return response
+
+    async def get_request(self, path: str, params: Optional[Dict[str, Any]] = None,
+                          expected_status: int = 200) -> httpx.Response:
+        """Отправить GET-запрос по указанному пути с параметрами запроса и проверить статус."""
+        response = await self._send("GET", path, params=params)
+        BaseClient._check_status(response, expected_status)
+        return response
+
+    async def post_parse_request(self, path: str, response_model: Optional[Type[T]] = None,
+                                 json: Optional[Dict[str, Any]] = None,
+                                 params: Optional[Dict[str, Any]] = None,
+                                 expected_status: int = 200) -> T | Dict[str, Any]:
+        try:
+            response = await self.post_request(path=path, json=json, params=params, expected_status=expected_status)
+            return BaseClient._parse_response(response, response_model, self.validation_mode)
+        except Exception as e:
+            return response_model(status="error", error=str(e), responseData=None)
+
+    async def get_parse_request(self, path: str, response_model: Optional[Type[T]] = None,
+                                params: Optional[Dict[str, Any]] = None,
+                                expected_status: int = 200) -> T | Dict[str, Any]:
+        try:
+            response = await self.get_request(path, params=params, expected_status=expected_status)
+            return BaseClient._parse_response(response, response_model, self.validation_mode)
+        except Exception as e:
+            return response_model(status="error", error=str(e), responseData=None)
+
+    async def close_session(self) -> None:
+        """Закрыть сессию httpx."""
+        await self.session.aclose()
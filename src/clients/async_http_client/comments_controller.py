@@ -0,0 +1,28 @@
+from uuid import UUID
+
+from src.clients.async_http_client.base_client import AsyncBaseClient
+from src.config.api_endpoints import ApiEndpoints
+from src.models.api_model import CommentApiResponse, NewCommentRequest
+
+
+class AsyncCommentsController:
+    def __init__(self, base_client: AsyncBaseClient):
+        """Асинхронный клиент для работы с комментариями через API."""
+        self.api = base_client
+
+    async def reply_to_comment(self, parent_comment_id: str, comment_text: str) -> CommentApiResponse:
+        """Отправляет ответ на комментарий с указанным parent_comment_id."""
+        try:
+            UUID(parent_comment_id)
+        except ValueError:
+            raise ValueError(f"post_id '{parent_comment_id}' не является валидным UUID")
+        data = NewCommentRequest(text=comment_text)
+        endpoint = ApiEndpoints.COMMENT_REPLY.format(parentCommentId=str(parent_comment_id))
+        params = {"text": data}
+        response = await self.api.post_parse_request(
+            path=endpoint,
+            response_model=CommentApiResponse,
+            json=data.model_dump(),
+            params=params)
+
+        return response
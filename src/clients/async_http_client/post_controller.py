@@ -0,0 +1,120 @@
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional
+from uuid import UUID
+
+from src.clients.async_http_client.base_client import AsyncBaseClient
+from src.config.api_endpoints import ApiEndpoints
+from src.models.api_model import (
+    ApiResponse,
+    NewCommentRequest,
+    Pageable,
+    PostDataResponse,
+    PostPublishComponent,
+    PostPublishResponse,
+    PostsResponse,
+    PublishRequest,
+)
+from src.utils.pagination import aiter_pages
+
+
+class AsyncPostsController:
+    def __init__(self, base_client: AsyncBaseClient):
+        """Асинхронный клиент для работы с постами через API."""
+        self.api = base_client
+
+    async def publish_post(self, data: PublishRequest) -> PostPublishResponse:
+        """Публикация нового поста."""
+        response = await self.api.post_parse_request(
+            path=ApiEndpoints.POST_PUBLISH,
+            response_model=PostPublishResponse,
+            json=data.model_dump())
+
+        return response
+
+    async def get_post(self, post_id: str, params: Optional[Dict[str, Any]] = None) -> PostDataResponse:
+        """Получить информацию о посте по id с пагинацией комментариев."""
+        try:
+            UUID(post_id)
+        except ValueError:
+            raise ValueError(f"post_id '{post_id}' не является валидным UUID")
+
+        if params is not None:
+            params = Pageable.model_validate(params)
+            params_dict = params.model_dump()
+        else:
+            params_dict = None
+
+        endpoint = ApiEndpoints.POST.format(post_id=post_id)
+        response = await self.api.get_parse_request(
+            path=endpoint,
+            response_model=PostDataResponse,
+            params=params_dict)
+
+        return response
+
+    async def add_comment(self, post_id: str, comment_text: str) -> ApiResponse:
+        """Публикация нового комментария к посту."""
+        try:
+            UUID(post_id)
+        except ValueError:
+            raise ValueError(f"post_id '{post_id}' не является валидным UUID")
+        data = NewCommentRequest(text=comment_text)
+        endpoint = ApiEndpoints.POST_ADD_COMMENT.format(post_id=post_id)
+        response = await self.api.post_parse_request(
+            path=endpoint,
+            response_model=ApiResponse,
+            json=data.model_dump())
+
+        return response
+
+    async def vote_post(self, post_id: str, value: Literal[-1, 1]) -> ApiResponse:
+        """Голосование за пост."""
+        try:
+            UUID(post_id)
+        except ValueError:
+            raise ValueError(f"post_id '{post_id}' не является валидным UUID")
+        endpoint = ApiEndpoints.POST_VOTE.format(post_id=post_id)
+        params = {"value": value}
+        response = await self.api.post_parse_request(
+            path=endpoint,
+            response_model=ApiResponse,
+            params=params)
+
+        return response
+
+    async def get_posts_list(self, params: Optional[Dict[str, Any]] = None) -> PostsResponse:
+        """Получение списка постов, с разбивкой на страницы."""
+        if params is not None:
+            params = Pageable.model_validate(params)
+            params_dict = params.model_dump()
+        else:
+            params_dict = None
+        response = await self.api.get_parse_request(
+            path=ApiEndpoints.POSTS,
+            response_model=PostsResponse,
+            params=params_dict)
+
+        return response
+
+    def iter_posts_pages(self, size: int = 100, sort: Optional[List[str]] = None, start_page: int = 0,
+                         prefetch: int = 1, max_pages: Optional[int] = None) -> AsyncIterator[PostsResponse]:
+        """Лениво обойти страницы ленты постов до totalPages, загружая следующую страницу фоновой задачей."""
+        async def fetch(page: int) -> PostsResponse:
+            return await self.get_posts_list(self._page_params(page, size, sort))
+
+        return aiter_pages(fetch, start_page=start_page, prefetch=prefetch, max_pages=max_pages)
+
+    async def iter_posts(self, size: int = 100, sort: Optional[List[str]] = None, start_page: int = 0,
+                         prefetch: int = 1, max_pages: Optional[int] = None) -> AsyncIterator[PostPublishComponent]:
+        """Лениво обойти все посты ленты по одному; ошибочная страница прерывает обход исключением."""
+        async for page in self.iter_posts_pages(size, sort, start_page, prefetch, max_pages):
+            if page.status != "ok":
+                raise Exception(f"API error: {page.error}")
+            for post in page.responseData.content:
+                yield post
+
+    @staticmethod
+    def _page_params(page: int, size: int, sort: Optional[List[str]]) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"page": page, "size": size}
+        if sort:
+            params["sort"] = sort
+        return params
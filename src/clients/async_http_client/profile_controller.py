@@ -0,0 +1,17 @@
+from src.clients.async_http_client.base_client import AsyncBaseClient
+from src.config.api_endpoints import ApiEndpoints
+from src.models.api_model import ProfileResponse
+
+
+class AsyncProfileController:
+    """Асинхронный клиент для работы с профилем через API."""
+
+    def __init__(self, base_client: AsyncBaseClient):
+        self.api = base_client
+
+    async def get_profile_info(self) -> ProfileResponse:
+        """Получение профиля пользователя."""
+        return await self.api.post_parse_request(
+            path=ApiEndpoints.PROFILE_INFO,
+            response_model=ProfileResponse
+        )
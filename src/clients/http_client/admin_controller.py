@@ -1,4 +1,5 @@
-import allure
+import time
+from typing import Optional
 
 from src.clients.http_client.base_client import BaseClient
 from src.clients.http_client.profile_controller import ProfileController
@@ -8,15 +9,25 @@ from src.models.api_model import (
     BanUserResponse,
     UnbanUserResponse,
 )
+from src.utils.reporting import step
 
 
 class AdminController:
     """Клиент для работы с админскими операциями через API."""
 
-    def __init__(self, api_client: BaseClient):
+    def __init__(self, api_client: BaseClient, cache_role_check: bool = True, role_cache_ttl: float = 300.0):
+        """Проверка роли ADMIN кешируется на role_cache_ttl секунд для текущего токена клиента.
+
+        Кеш сбрасывается при смене токена (set_token/clear_token), отключается cache_role_check=False —
+        например, когда тест намеренно меняет роль пользователя.
+        """
         self.api = api_client
+        self.cache_role_check = cache_role_check
+        self.role_cache_ttl = role_cache_ttl
+        self._admin_token: Optional[str] = None
+        self._admin_checked_at = 0.0
 
-    @allure.step("Получение профиля пользователя по ID: {user_id}")
+    @step("Получение профиля пользователя по ID: {user_id}")
     def get_user_profile(self, user_id: int) -> AdminUserResponse:
         """Получить профиль пользователя по ID."""
         self._check_admin()
@@ -27,7 +38,7 @@ class AdminController:
         )
         return response
 
-    @allure.step("Блокировка пользователя с email: {email} на {ban_duration} секунд")
+    @step("Блокировка пользователя с email: {email} на {ban_duration} секунд")
     def ban_user(self, email: str, ban_duration: int) -> BanUserResponse:
         """Заблокировать пользователя по email на заданный период."""
         self._check_admin()
@@ -40,7 +51,7 @@ class AdminController:
 
         return response
 
-    @allure.step("Разблокировка пользователя с email: {email}")
+    @step("Разблокировка пользователя с email: {email}")
     def unban_user(self, email: str) -> UnbanUserResponse:
         """Разблокировать пользователя по email."""
         self._check_admin()
@@ -53,9 +64,29 @@ class AdminController:
 
         return response
 
-    @allure.step("Проверка роли ADMIN у текущего пользователя")
+    def invalidate_role_cache(self) -> None:
+        """Сбросить закешированную проверку роли ADMIN."""
+        self._admin_token = None
+        self._admin_checked_at = 0.0
+
+    def _role_cached(self) -> bool:
+        return (self.cache_role_check and self.api.token is not None and self._admin_token == self.api.token
+                and time.monotonic() - self._admin_checked_at < self.role_cache_ttl)
+
     def _check_admin(self) -> None:
-        """Проверить роль ADMIN."""
+        """Проверить роль ADMIN (запросом профиля, если для текущего токена нет свежей проверки)."""
+        if self._role_cached():
+            return
+        self.invalidate_role_cache()
+        token = self.api.token
+        self._fetch_admin_role()
+        if self.cache_role_check and token is not None:
+            self._admin_token = token
+            self._admin_checked_at = time.monotonic()
+
+    @step("Проверка роли ADMIN у текущего пользователя")
+    def _fetch_admin_role(self) -> None:
+        """Запросить профиль и проверить роль ADMIN."""
         profile_controller = ProfileController(self.api)
         profile_response = profile_controller.get_profile_info()
         if not profile_response.responseData or "ROLE_ADMIN" not in profile_response.responseData.authorities:
@@ -1,8 +1,7 @@
-import allure
-
 from src.clients.http_client.base_client import BaseClient
 from src.config.api_endpoints import ApiEndpoints
 from src.models.api_model import ApiResponse, LoginRequest, RegistrationRequest
+from src.utils.reporting import step
 
 
 class AuthController:
@@ -11,7 +10,7 @@ class AuthController:
     def __init__(self, base_client: BaseClient) -> None:
         self.api = base_client
 
-    @allure.step("Регистрация нового пользователя с данными: {data}")
+    @step("Регистрация нового пользователя с данными: {data}")
     def register(self, data: RegistrationRequest) -> ApiResponse:
         """Регистрация нового пользователя с валидацией данных через Pydantic."""
         response = self.api.post_parse_request(
@@ -21,7 +20,7 @@ class AuthController:
         )
         return response
 
-    @allure.step("Авторизация пользователя с данными: {data}")
+    @step("Авторизация пользователя с данными: {data}")
     def login(self, data: LoginRequest) -> ApiResponse:
         """Авторизация пользователя с валидацией данных через Pydantic."""
         response = self.api.post_parse_request(
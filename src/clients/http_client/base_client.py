@@ -1,20 +1,75 @@
+import copy
+import time
 from typing import Any, Dict, Optional, Type, TypeVar
 
-import allure
 import requests
 from pydantic import BaseModel
 
+from src.clients.http_client.cassette import Cassette, CassetteAdapter, CassetteMode
+from src.clients.http_client.transport import TunedHTTPAdapter
 from src.config.api_endpoints import ApiEndpoints
+from src.config.http_config import HttpClientConfig
+from src.models.validation import ValidationMode, validate_response
+from src.utils.reporting import step
+from src.utils.request_timing import timing_collector
 
 T = TypeVar('T', bound=BaseModel)
 
 class BaseClient:
-    def __init__(self):
-        """Инициализация клиента с базовым URL и сессией requests."""
+    def __init__(self, pool_connections: Optional[int] = None, pool_maxsize: Optional[int] = None,
+                 pool_block: Optional[bool] = None, validation_mode: Optional[str] = None,
+                 cassette_path: Optional[str] = None, cassette_mode: Optional[str] = None):
+        """Инициализация клиента с базовым URL и сессией requests.
+
+        Параметры пула соединений и режим валидации ответов по умолчанию берутся из HttpClientConfig.
+        С cassette_path и режимом record/replay (по умолчанию HttpClientConfig.CASSETTE_MODE) обмены
+        записываются в кассету или отдаются из неё без сети.
+        """
         self.base_url = ApiEndpoints.BASE_URL
         self.session = requests.Session()
+        self.adapter = TunedHTTPAdapter(
+            pool_connections=pool_connections if pool_connections is not None else HttpClientConfig.POOL_CONNECTIONS,
+            pool_maxsize=pool_maxsize if pool_maxsize is not None else HttpClientConfig.POOL_MAXSIZE,
+            pool_block=pool_block if pool_block is not None else HttpClientConfig.POOL_BLOCK,
+        )
+        self.cassette_mode = CassetteMode((cassette_mode or HttpClientConfig.CASSETTE_MODE).lower())
+        if cassette_path is None:
+            self.cassette_mode = CassetteMode.OFF
+        transport = self.adapter
+        if self.cassette_mode != CassetteMode.OFF:
+            transport = CassetteAdapter(Cassette.load(cassette_path), self.cassette_mode, inner=self.adapter)
+        self.session.mount("http://", transport)
+        self.session.mount("https://", transport)
+        self.validation_mode = ValidationMode(validation_mode or HttpClientConfig.RESPONSE_VALIDATION_MODE)
         self._token: Optional[str] = None
 
+    def warmup(self, connections: Optional[int] = None) -> int:
+        """Открыть соединения с сервисом заранее, чтобы установка TCP не попала в замеры.
+
+        По умолчанию количество соединений берётся из HttpClientConfig.PREWARM_CONNECTIONS.
+        Возвращает количество открытых соединений.
+        """
+        connections = HttpClientConfig.PREWARM_CONNECTIONS if connections is None else connections
+        if connections <= 0 or self.cassette_mode == CassetteMode.REPLAY:
+            return 0
+        settings = self.session.merge_environment_settings(self.base_url, {}, None, None, None)
+        return self.adapter.warmup(self.base_url, connections, verify=settings["verify"], cert=settings["cert"],
+                                   proxies=settings["proxies"])
+
+    def clone(self) -> "BaseClient":
+        """Клиент с тем же транспортом, режимом валидации и токеном, но с отдельной сессией requests.
+
+        requests.Session не потокобезопасна, поэтому фоновым потокам нужна своя сессия; пул соединений
+        адаптера (urllib3) потокобезопасен и остаётся общим. Сессию копии не закрывают: это закрыло бы
+        общий адаптер.
+        """
+        clone = copy.copy(self)
+        clone.session = requests.Session()
+        clone.session.headers.update(self.session.headers)
+        for prefix, adapter in self.session.adapters.items():
+            clone.session.mount(prefix, adapter)
+        return clone
+
     def set_token(self, token: str) -> None:
         """Установить JWT токен для авторизации.
 
@@ -37,60 +92,86 @@ class BaseClient:
         """Сформировать полный URL, объединяя базовый URL и путь эндпоинта."""
         return f"{self.base_url}{path}"
 
-    @allure.step("Отправить POST-запрос на {path}")
+    @step("Отправить POST-запрос на {path}")
     def post_request(self, path: str, json: Optional[Dict[str, Any]] = None,
                      params: Optional[Dict[str, Any]] = None, expected_status: int = 200) -> requests.Response:
         """Отправить POST-запрос по указанному пути с JSON-данными и проверить статус."""
-        url = self._url(path)
-        response = self.session.post(url, json=json, params=params)
+        response = self._send("POST", path, json=json, params=params)
         self._check_status(response, expected_status)
         return response
 
-    @allure.step("Отправить GET-запрос на {path}")
+    @step("Отправить GET-запрос на {path}")
     def get_request(self, path: str, params: Optional[Dict[str, Any]] = None,
                     expected_status: int = 200) -> requests.Response:
         """Отправить GET-запрос по указанному пути с параметрами запроса и проверить статус."""
-        url = self._url(path)
-        response = self.session.get(url, params=params)
+        response = self._send("GET", path, params=params)
         self._check_status(response, expected_status)
         return response
 
-    def _check_status(self, response: requests.Response, expected_status: int):
+    def _send(self, method: str, path: str, **kwargs) -> requests.Response:
+        """Выполнить запрос и записать замеры в timing_collector.
+
+        Тело читается отдельно от заголовков (stream=True), чтобы разделить время до первого байта
+        и время чтения тела. Запись замеров доступна в атрибуте timing ответа.
+        """
+        start = time.perf_counter()
+        response = self.session.request(method, self._url(path), stream=True, **kwargs)
+        headers_at = time.perf_counter()
+        content = response.content
+        body_at = time.perf_counter()
+        body = response.request.body
+        response.timing = timing_collector.add(
+            method, path, response.status_code, start, headers_at, body_at,
+            bytes_out=len(body) if body else 0, decoded_bytes_in=len(content))
+        return response
+
+    @staticmethod
+    def _check_status(response: requests.Response, expected_status: int):
         """Проверяет, что HTTP-статус ответа совпадает с ожидаемым."""
         if response.status_code != expected_status:
             raise requests.HTTPError(
                 f"Ожидался статус {expected_status}, получен {response.status_code}: {response.text}")
 
-    @allure.step("POST-запрос с парсингом и обработкой ошибок")
+    @staticmethod
+    def _parse_response(response: requests.Response, response_model: Optional[Type[T]] = None,
+                        validation_mode: ValidationMode = ValidationMode.STRICT) -> T | Dict[str, Any]:
+        """Разобрать тело ответа в модель Pydantic и проверить статус конверта ответа.
+
+        Без модели возвращает тело ответа как словарь. Валидируются байты тела, а не response.text:
+        декодирование текста с угадыванием кодировки на больших ответах стоит дороже самой валидации.
+        Время валидации дописывается в замер запроса.
+        """
+        if response_model:
+            start = time.perf_counter()
+            parsed_response = validate_response(response_model, response.content, validation_mode)
+            timing = getattr(response, "timing", None)
+            if timing is not None:
+                timing.parse = time.perf_counter() - start
+                timing.model = response_model.__name__
+                timing.validation = validation_mode.value
+            if parsed_response.status != "ok":
+                raise Exception(f"API error: {parsed_response.error}")
+            return parsed_response
+        return response.json()
+
+    @step("POST-запрос с парсингом и обработкой ошибок")
     def post_parse_request(self, path: str, response_model: Optional[Type[T]] = None,
                             json: Optional[Dict[str, Any]] = None,
                             params: Optional[Dict[str, Any]] = None,
                             expected_status: int = 200) -> T | Dict[str, Any]:
         try:
             response = self.post_request(path=path, json=json, params=params, expected_status=expected_status)
-            if response_model:
-                parsed_response = response_model.model_validate_json(response.text)
-                if parsed_response.status != "ok":
-                    raise Exception(f"API error: {parsed_response.error}")
-                return parsed_response
-            else:
-                return response.json()
+            return self._parse_response(response, response_model, self.validation_mode)
         except Exception as e:
             return response_model(status="error", error=str(e), responseData=None)
 
-    @allure.step("GET-запрос с парсингом и обработкой ошибок")
+    @step("GET-запрос с парсингом и обработкой ошибок")
     def get_parse_request(self, path: str, response_model: Optional[Type[T]] = None,
                           params: Optional[Dict[str, Any]] = None,
                           expected_status: int = 200) -> T | Dict[str, Any]:
         try:
             response = self.get_request(path, params=params, expected_status=expected_status)
-            if response_model:
-                parsed_response = response_model.model_validate_json(response.text)
-                if parsed_response.status != "ok":
-                    raise Exception(f"API error: {parsed_response.error}")
-                return parsed_response
-            else:
-                return response.json()
+            return self._parse_response(response, response_model, self.validation_mode)
         except Exception as e:
             return response_model(status="error", error=str(e), responseData=None)
 
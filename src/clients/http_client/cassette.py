@@ -0,0 +1,196 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import defaultdict
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from src.utils.custom_logger import CustomLogger
+from src.utils.request_timing import path_template
+
+custom_logger = CustomLogger(__name__)
+
+_UUID = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+_JWT = re.compile(r"eyJ[\w-]+\.[\w-]+\.[\w-]*")
+_TIMESTAMP = re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?")
+# Поля, значения которых меняются от запуска к запуску и не участвуют в хеше тела запроса.
+DYNAMIC_FIELDS = frozenset({"createdAt", "bannedUntil", "jwt", "token"})
+
+
+class CassetteMode(str, Enum):
+    """Режим кассеты: off — обычная работа, record — запись обменов, replay — ответы только из кассеты."""
+
+    OFF = "off"
+    RECORD = "record"
+    REPLAY = "replay"
+
+
+class CassetteMissError(requests.exceptions.ConnectionError):
+    """В кассете нет записанного ответа на запрос (в режиме replay сеть не используется)."""
+
+
+def normalize_value(value: Any) -> Any:
+    """Заменить динамические части значения (UUID, JWT, метки времени) на заполнители."""
+    if isinstance(value, str):
+        value = _JWT.sub("{jwt}", value)
+        value = _UUID.sub("{uuid}", value)
+        return _TIMESTAMP.sub("{timestamp}", value)
+    if isinstance(value, dict):
+        return {key: "{dynamic}" if key in DYNAMIC_FIELDS else normalize_value(item)
+                for key, item in value.items()}
+    if isinstance(value, list):
+        return [normalize_value(item) for item in value]
+    return value
+
+
+def body_hash(body: Optional[bytes | str]) -> str:
+    """Хеш тела запроса без динамических полей; пустое тело — пустая строка."""
+    if not body:
+        return ""
+    if isinstance(body, str):
+        body = body.encode()
+    try:
+        normalized = json.dumps(normalize_value(json.loads(body)), sort_keys=True, separators=(",", ":"))
+    except ValueError:
+        normalized = normalize_value(body.decode("utf-8", errors="replace"))
+    return hashlib.sha1(normalized.encode()).hexdigest()[:16]
+
+
+def request_key(method: str, url: str, body: Optional[bytes | str]) -> Tuple[str, str]:
+    """Ключи поиска обмена: точный (метод, шаблон пути, параметры, хеш тела) и общий (метод, шаблон пути)."""
+    parts = urlsplit(url)
+    endpoint = f"{method} {path_template(parts.path)}"
+    params = "&".join(f"{name}={normalize_value(value)}" for name, value in sorted(parse_qsl(parts.query)))
+    return f"{endpoint}?{params}#{body_hash(body)}", endpoint
+
+
+class Cassette:
+    """Записанные обмены запрос/ответ в сжатом JSON-файле.
+
+    Ответ ищется сначала по точному ключу (метод, шаблон пути, параметры, хеш тела), затем — по методу и
+    шаблону пути: тела запросов в тестах содержат случайные данные Faker и не совпадают между запусками.
+    Обмены с одним ключом отдаются в порядке записи, последний повторяется, когда записи закончились.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.entries: List[Dict[str, Any]] = []
+        self._by_key: Dict[str, List[int]] = defaultdict(list)
+        self._by_endpoint: Dict[str, List[int]] = defaultdict(list)
+        self._cursors: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        """Загрузить кассету из файла; если файла нет — пустая кассета."""
+        cassette = cls(path)
+        if os.path.exists(path):
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                for entry in json.load(f)["interactions"]:
+                    cassette._index(entry)
+        return cassette
+
+    def _index(self, entry: Dict[str, Any]) -> None:
+        position = len(self.entries)
+        self.entries.append(entry)
+        self._by_key[entry["key"]].append(position)
+        self._by_endpoint[entry["endpoint"]].append(position)
+
+    def record(self, request: requests.PreparedRequest, response: requests.Response) -> None:
+        """Добавить обмен в кассету. Заголовки запроса (в том числе Authorization) не сохраняются."""
+        key, endpoint = request_key(request.method, request.url, request.body)
+        entry = {
+            "key": key,
+            "endpoint": endpoint,
+            "status": response.status_code,
+            "reason": response.reason,
+            "content_type": response.headers.get("Content-Type"),
+            "body": response.content.decode("utf-8", errors="replace"),
+        }
+        with self._lock:
+            self._index(entry)
+            self.dirty = True
+
+    def _next(self, index: Dict[str, List[int]], key: str) -> Optional[Dict[str, Any]]:
+        positions = index.get(key)
+        if not positions:
+            return None
+        cursor = self._cursors[key]
+        self._cursors[key] = cursor + 1
+        return self.entries[positions[min(cursor, len(positions) - 1)]]
+
+    def find(self, request: requests.PreparedRequest) -> Optional[Dict[str, Any]]:
+        """Найти записанный ответ на запрос: по точному ключу, затем по порядку вызовов эндпоинта."""
+        key, endpoint = request_key(request.method, request.url, request.body)
+        with self._lock:
+            if key in self._by_key:
+                return self._next(self._by_key, key)
+            return self._next(self._by_endpoint, endpoint)
+
+    def save(self) -> None:
+        """Сохранить кассету, если в неё добавлялись обмены."""
+        with self._lock:
+            if not self.dirty:
+                return
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with gzip.open(self.path, "wt", encoding="utf-8") as f:
+                json.dump({"version": 1, "interactions": self.entries}, f, ensure_ascii=False,
+                          separators=(",", ":"))
+            self.dirty = False
+        custom_logger.log_with_context("Кассета %s сохранена: %d обменов", self.path, len(self.entries))
+
+
+class CassetteAdapter(BaseAdapter):
+    """Транспорт requests, который записывает обмены в кассету или отдаёт их из неё без сети.
+
+    В режиме record запросы уходят через вложенный адаптер (TunedHTTPAdapter); кассета сохраняется при
+    закрытии сессии (BaseClient.close_session).
+    """
+
+    def __init__(self, cassette: Cassette, mode: CassetteMode, inner: Optional[BaseAdapter] = None) -> None:
+        super().__init__()
+        if mode == CassetteMode.RECORD and inner is None:
+            raise ValueError("Для записи кассеты нужен вложенный адаптер")
+        self.cassette = cassette
+        self.mode = mode
+        self.inner = inner
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        if self.mode == CassetteMode.RECORD:
+            response = self.inner.send(request, **kwargs)
+            self.cassette.record(request, response)
+            return response
+        entry = self.cassette.find(request)
+        if entry is None:
+            raise CassetteMissError(f"Нет записи в кассете {self.cassette.path} для {request.method} {request.url}",
+                                    request=request)
+        return self._build_response(request, entry)
+
+    def _build_response(self, request: requests.PreparedRequest, entry: Dict[str, Any]) -> requests.Response:
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = entry.get("reason")
+        response.headers = CaseInsensitiveDict()
+        if entry.get("content_type"):
+            response.headers["Content-Type"] = entry["content_type"]
+        response._content = entry["body"].encode("utf-8")
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self) -> None:
+        if self.mode == CassetteMode.RECORD:
+            self.cassette.save()
+        if self.inner is not None:
+            self.inner.close()
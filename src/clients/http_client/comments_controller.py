@@ -1,10 +1,9 @@
 from uuid import UUID
 
-import allure
-
 from src.clients.http_client.base_client import BaseClient
 from src.config.api_endpoints import ApiEndpoints
 from src.models.api_model import CommentApiResponse, NewCommentRequest
+from src.utils.reporting import step
 
 
 class CommentsController:
@@ -12,7 +11,7 @@ class CommentsController:
         """Клиент для работы с комментариями через API."""
         self.api = base_client
 
-    @allure.step("Ответить на комментарий с id: {parent_comment_id} текстом: {comment_text}")
+    @step("Ответить на комментарий с id: {parent_comment_id} текстом: {comment_text}")
     def reply_to_comment(self, parent_comment_id: str, comment_text: str) -> CommentApiResponse:
         """Отправляет ответ на комментарий с указанным parent_comment_id."""
         try:
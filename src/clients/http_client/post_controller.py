@@ -1,8 +1,6 @@
-from typing import Any, Dict, Literal, Optional
+from typing import Any, Dict, Iterator, List, Literal, Optional
 from uuid import UUID
 
-import allure
-
 from src.clients.http_client.base_client import BaseClient
 from src.config.api_endpoints import ApiEndpoints
 from src.models.api_model import (
@@ -10,10 +8,13 @@ from src.models.api_model import (
     NewCommentRequest,
     Pageable,
     PostDataResponse,
+    PostPublishComponent,
     PostPublishResponse,
     PostsResponse,
     PublishRequest,
 )
+from src.utils.pagination import iter_pages
+from src.utils.reporting import step
 
 
 class PostsController:
@@ -21,7 +22,7 @@ class PostsController:
         """Клиент для работы с постами через API."""
         self.api = base_client
 
-    @allure.step("Публикация нового поста с данными: {data}")
+    @step("Публикация нового поста с данными: {data}")
     def publish_post(self, data: PublishRequest) -> PostPublishResponse:
         """Публикация нового поста."""
         response = self.api.post_parse_request(
@@ -31,7 +32,7 @@ class PostsController:
 
         return response
 
-    @allure.step("Получение информации о посте по id: {post_id} с параметрами: {params}")
+    @step("Получение информации о посте по id: {post_id} с параметрами: {params}")
     def get_post(self, post_id: str, params: Optional[Dict[str, Any]] = None) -> PostDataResponse:
         """Получить информацию о посте по id с пагинацией комментариев."""
         try:
@@ -53,7 +54,7 @@ class PostsController:
 
         return response
 
-    @allure.step("Добавление комментария к посту {post_id} с текстом: {comment_text}")
+    @step("Добавление комментария к посту {post_id} с текстом: {comment_text}")
     def add_comment(self, post_id: str, comment_text: str) -> ApiResponse:
         """Публикация нового комментария к посту."""
         try:
@@ -69,7 +70,7 @@ class PostsController:
 
         return response
 
-    @allure.step("Голосование за пост {post_id} с значением: {value}")
+    @step("Голосование за пост {post_id} с значением: {value}")
     def vote_post(self, post_id: str, value: Literal[-1, 1]) -> ApiResponse:
         """Голосование за пост."""
         try:
@@ -85,7 +86,7 @@ class PostsController:
 
         return response
 
-    @allure.step("Получение списка постов с параметрами: {params}")
+    @step("Получение списка постов с параметрами: {params}")
     def get_posts_list(self, params: Optional[Dict[str, Any]] = None) -> PostsResponse:
         """Получение списка постов, с разбивкой на страницы."""
         if params is not None:
@@ -98,4 +99,35 @@ class PostsController:
             response_model=PostsResponse,
             params=params_dict)
 
-        return response
\ No newline at end of file
+        return response
+
+    def iter_posts_pages(self, size: int = 100, sort: Optional[List[str]] = None, start_page: int = 0,
+                         prefetch: int = 1, max_pages: Optional[int] = None) -> Iterator[PostsResponse]:
+        """Лениво обойти страницы ленты постов до totalPages.
+
+        Следующие prefetch страниц загружаются в фоновом потоке, пока вызывающий код обрабатывает текущую,
+        поэтому в памяти держится ограниченное число страниц (см. iter_pages). Ошибочная страница отдаётся
+        последней. Фоновый поток работает через копию клиента со своей сессией (BaseClient.clone) и токеном
+        на момент начала обхода.
+        """
+        posts = PostsController(self.api.clone()) if prefetch > 0 else self
+
+        def fetch(page: int) -> PostsResponse:
+            return posts.get_posts_list(self._page_params(page, size, sort))
+
+        return iter_pages(fetch, start_page=start_page, prefetch=prefetch, max_pages=max_pages)
+
+    def iter_posts(self, size: int = 100, sort: Optional[List[str]] = None, start_page: int = 0,
+                   prefetch: int = 1, max_pages: Optional[int] = None) -> Iterator[PostPublishComponent]:
+        """Лениво обойти все посты ленты по одному; ошибочная страница прерывает обход исключением."""
+        for page in self.iter_posts_pages(size, sort, start_page, prefetch, max_pages):
+            if page.status != "ok":
+                raise Exception(f"API error: {page.error}")
+            yield from page.responseData.content
+
+    @staticmethod
+    def _page_params(page: int, size: int, sort: Optional[List[str]]) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"page": page, "size": size}
+        if sort:
+            params["sort"] = sort
+        return params
@@ -0,0 +1,63 @@
+import socket
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+from src.config.http_config import HttpClientConfig
+
+# Таймаут HEAD-запроса прогрева, секунды.
+WARMUP_TIMEOUT = 5
+
+
+def keepalive_socket_options() -> List[Tuple[int, int, int]]:
+    """Опции сокета по умолчанию (TCP_NODELAY) плюс TCP keep-alive, если он включён в конфигурации."""
+    options = list(HTTPConnection.default_socket_options)
+    if not HttpClientConfig.TCP_KEEPALIVE:
+        return options
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    for name, value in (("TCP_KEEPIDLE", HttpClientConfig.TCP_KEEPIDLE),
+                        ("TCP_KEEPINTVL", HttpClientConfig.TCP_KEEPINTVL),
+                        ("TCP_KEEPCNT", HttpClientConfig.TCP_KEEPCNT)):
+        # TCP_KEEPIDLE и др. есть не на всех платформах (например, на macOS их нет в старых версиях Python).
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class TunedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter с настраиваемым пулом соединений и TCP keep-alive."""
+
+    def __init__(self, pool_connections: int, pool_maxsize: int, pool_block: bool) -> None:
+        self.socket_options = keepalive_socket_options()
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        kwargs["socket_options"] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+    def warmup(self, url: str, connections: int, verify: Union[bool, str] = True, cert: Any = None,
+               proxies: Optional[Dict[str, str]] = None) -> int:
+        """Открыть заранее до connections соединений к хосту url и оставить их в пуле.
+
+        Соединения открываются HEAD-запросами через сам адаптер (stream=True держит соединение занятым до
+        чтения ответа). verify, cert и proxies входят в ключ пула urllib3, поэтому передаются те же, что у
+        сессии (Session.merge_environment_settings): иначе прогретым окажется чужой пул. Статус ответа
+        не важен. Возвращает количество открытых соединений (не больше размера пула).
+        """
+        request = requests.Request("HEAD", url).prepare()
+        responses = []
+        try:
+            for _ in range(min(connections, self._pool_maxsize)):
+                try:
+                    responses.append(self.send(request, stream=True, timeout=WARMUP_TIMEOUT, verify=verify,
+                                               cert=cert, proxies=proxies))
+                except requests.RequestException:
+                    break
+        finally:
+            for response in responses:
+                # Ответ на HEAD без тела: после чтения close() возвращает соединение в пул, а не закрывает его.
+                response.content
+                response.close()
+        return len(responses)
@@ -0,0 +1,313 @@
+import json
+import re
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from src.utils.custom_logger import CustomLogger
+
+custom_logger = CustomLogger(__name__)
+
+# Столбец из условия Filter узла плана: "(post_id = '…'::uuid)", "(comments.author_id = $1)".
+_FILTER_COLUMN = re.compile(r"\(?(?:\w+\.)?(\w+)\s*(?:=|<|>|<=|>=|= ANY)\s")
+
+HARVEST_SQL = r"""
+    SELECT queryid, query, sum(calls) AS calls, sum(total_exec_time) AS total_ms
+    FROM pg_stat_statements
+    WHERE dbid = (SELECT oid FROM pg_database WHERE datname = current_database())
+      AND query ~* '^\s*(select|with|update|delete)\s' AND query !~* 'pg_(stat|catalog|class)'
+    GROUP BY queryid, query
+    ORDER BY sum(total_exec_time) DESC
+    LIMIT %(limit)s
+"""
+TABLE_ROWS_SQL = """
+    SELECT relname, reltuples::bigint FROM pg_class
+    WHERE relkind = 'r' AND relnamespace = 'public'::regnamespace
+"""
+
+
+@dataclass
+class PlanTarget:
+    """Запрос для EXPLAIN.
+
+    sql — текст с параметрами psycopg2 (%(name)s), значения которых берёт sample_sql из засеянных данных
+    (одна строка, имена столбцов — имена параметров). Запросы из pg_stat_statements содержат $1, $2, ... и
+    объясняются как обобщённый план (GENERIC_PLAN, PostgreSQL 16+) без выполнения. Изменяющие запросы без
+    параметров тоже не выполняются (EXPLAIN без ANALYZE): DELETE по всей таблице заблокировал бы её для сервиса.
+    """
+
+    name: str
+    sql: str
+    sample_sql: Optional[str] = None
+    source: str = "builtin"
+
+    @property
+    def generic(self) -> bool:
+        return re.search(r"\$\d+", self.sql) is not None
+
+    @property
+    def read_only(self) -> bool:
+        return re.search(r"\b(insert|update|delete)\b", self.sql, re.IGNORECASE) is None
+
+
+# Выборки проверок SqlAlchemyClient и запросы, которые сервис выполняет на GET /posts/{id} и GET /posts.
+BUILTIN_TARGETS = [
+    PlanTarget("comments_by_post_id", "SELECT * FROM comments WHERE post_id = %(post_id)s",
+               "SELECT post_id FROM comments LIMIT 1"),
+    PlanTarget("comments_by_author_id", "SELECT * FROM comments WHERE author_id = %(author_id)s",
+               "SELECT author_id FROM comments LIMIT 1"),
+    PlanTarget("posts_by_author_id", "SELECT * FROM posts WHERE author_id = %(author_id)s",
+               "SELECT author_id FROM posts LIMIT 1"),
+    PlanTarget("votes_by_user_id", "SELECT * FROM votes WHERE user_id = %(user_id)s",
+               "SELECT user_id FROM votes LIMIT 1"),
+    PlanTarget("post_vote_sum", "SELECT sum(value) FROM votes WHERE post_id = %(post_id)s",
+               "SELECT post_id FROM votes LIMIT 1"),
+    PlanTarget("posts_page_by_created_at",
+               "SELECT * FROM posts ORDER BY created_at DESC LIMIT 20 OFFSET %(skip)s",
+               "SELECT 1000 AS skip"),
+    PlanTarget("comment_tree",
+               """WITH RECURSIVE tree AS (
+                      SELECT id, parent_id, author_id, created_at, 0 AS depth FROM comments
+                      WHERE post_id = %(post_id)s AND parent_id IS NULL
+                      UNION ALL
+                      SELECT c.id, c.parent_id, c.author_id, c.created_at, tree.depth + 1 FROM comments c
+                      JOIN tree ON c.parent_id = tree.id)
+                  SELECT tree.*, users.email FROM tree JOIN users ON users.id = tree.author_id
+                  ORDER BY depth, created_at""",
+               "SELECT post_id FROM comments WHERE parent_id IS NOT NULL LIMIT 1"),
+]
+
+
+@dataclass
+class PlanIssue:
+    """Проблема узла плана.
+
+    seq_scan — последовательное чтение большой таблицы, row_estimate — оценка строк планировщика расходится
+    с фактом в ratio раз. suggestion — индекс, который закрыл бы условие Filter.
+    """
+
+    kind: str
+    node_type: str
+    relation: Optional[str] = None
+    table_rows: Optional[int] = None
+    plan_rows: Optional[float] = None
+    actual_rows: Optional[float] = None
+    ratio: Optional[float] = None
+    rows_removed_by_filter: Optional[int] = None
+    filter: Optional[str] = None
+    suggestion: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self.kind == "seq_scan":
+            text = f"Seq Scan {self.relation} (~{self.table_rows} строк)"
+            if self.filter:
+                text += f" по {self.filter}"
+            return text + (f" → {self.suggestion}" if self.suggestion else "")
+        return (f"{self.node_type}{' ' + self.relation if self.relation else ''}: оценка {self.plan_rows:.0f} строк, "
+                f"факт {self.actual_rows:.0f} (×{self.ratio:.1f})")
+
+
+@dataclass
+class QueryPlan:
+    """План запроса с временем выполнения, буферами и найденными проблемами."""
+
+    name: str
+    source: str
+    sql: str
+    analyzed: bool
+    params: Dict[str, Any] = field(default_factory=dict)
+    planning_ms: Optional[float] = None
+    execution_ms: Optional[float] = None
+    total_cost: Optional[float] = None
+    shared_hit: int = 0
+    shared_read: int = 0
+    issues: List[PlanIssue] = field(default_factory=list)
+    error: Optional[str] = None
+    plan: Optional[Dict[str, Any]] = None
+
+
+def iter_nodes(node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Обойти узлы плана EXPLAIN (FORMAT JSON) без рекурсии."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        yield current
+        stack.extend(reversed(current.get("Plans", [])))
+
+
+def _suggest_index(relation: str, condition: Optional[str]) -> Optional[str]:
+    columns = list(dict.fromkeys(_FILTER_COLUMN.findall(condition or "")))
+    return f"CREATE INDEX ON {relation} ({', '.join(columns)})" if columns else None
+
+
+def find_issues(plan: Dict[str, Any], table_rows: Dict[str, int], min_table_rows: int = 10_000,
+                estimate_ratio: float = 10.0, min_estimate_rows: int = 100) -> List[PlanIssue]:
+    """Проблемы плана: Seq Scan больших таблиц и ошибки оценки строк.
+
+    Seq Scan считается проблемой для таблиц от min_table_rows строк, ошибка оценки — для узлов, где оценка
+    расходится с фактом в estimate_ratio и более раз (только для EXPLAIN ANALYZE; расхождения меньше
+    min_estimate_rows строк — шум).
+    """
+    issues = []
+    for node in iter_nodes(plan):
+        relation = node.get("Relation Name")
+        if node["Node Type"] == "Seq Scan" and table_rows.get(relation, 0) >= min_table_rows:
+            condition = node.get("Filter")
+            issues.append(PlanIssue(
+                kind="seq_scan", node_type=node["Node Type"], relation=relation, table_rows=table_rows[relation],
+                plan_rows=node.get("Plan Rows"), actual_rows=node.get("Actual Rows"),
+                rows_removed_by_filter=node.get("Rows Removed by Filter"), filter=condition,
+                suggestion=_suggest_index(relation, condition)))
+        if "Actual Rows" not in node or not node.get("Actual Loops"):
+            continue
+        estimated, actual = float(node["Plan Rows"]), float(node["Actual Rows"])
+        ratio = max(estimated, actual) / max(min(estimated, actual), 1.0)
+        if ratio >= estimate_ratio and max(estimated, actual) >= min_estimate_rows:
+            issues.append(PlanIssue(kind="row_estimate", node_type=node["Node Type"], relation=relation,
+                                    plan_rows=estimated, actual_rows=actual, ratio=round(ratio, 1)))
+    return issues
+
+
+class PlanCapture:
+    """Снимает EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) через курсор psycopg2.
+
+    Каждый запрос выполняется в отдельной транзакции, которая откатывается: EXPLAIN ANALYZE выполняет запрос,
+    и изменяющие запросы не должны менять данные. statement_timeout ограничивает время одного запроса.
+    """
+
+    def __init__(self, raw_connection, min_table_rows: int = 10_000, estimate_ratio: float = 10.0,
+                 statement_timeout_ms: int = 60_000) -> None:
+        self.raw_connection = raw_connection
+        self.min_table_rows = min_table_rows
+        self.estimate_ratio = estimate_ratio
+        self.statement_timeout_ms = statement_timeout_ms
+        self.table_rows = self._fetch(TABLE_ROWS_SQL)
+
+    def _fetch(self, sql: str, params: Optional[Dict[str, Any]] = None) -> Dict[Any, Any]:
+        cursor = self.raw_connection.cursor()
+        try:
+            cursor.execute(sql, params)
+            return {row[0]: row[1] for row in cursor.fetchall()}
+        finally:
+            cursor.close()
+            self.raw_connection.rollback()
+
+    def harvest(self, limit: int = 20) -> List[PlanTarget]:
+        """Самые дорогие по суммарному времени SELECT/UPDATE/DELETE из pg_stat_statements."""
+        cursor = self.raw_connection.cursor()
+        try:
+            cursor.execute(HARVEST_SQL, {"limit": limit})
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+            self.raw_connection.rollback()
+        return [PlanTarget(f"pgss_{queryid}", query, source="pg_stat_statements")
+                for queryid, query, _, _ in rows]
+
+    def _sample(self, cursor, target: PlanTarget) -> Optional[Dict[str, Any]]:
+        if target.sample_sql is None:
+            return {}
+        cursor.execute(target.sample_sql)
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return {column.name: value for column, value in zip(cursor.description, row)}
+
+    def capture(self, target: PlanTarget) -> QueryPlan:
+        """План одного запроса; ошибка выполнения записывается в QueryPlan.error."""
+        analyzed = not target.generic and target.read_only
+        result = QueryPlan(target.name, target.source, target.sql, analyzed)
+        if analyzed:
+            options = "ANALYZE, BUFFERS, FORMAT JSON"
+        else:
+            options = "GENERIC_PLAN, FORMAT JSON" if target.generic else "FORMAT JSON"
+        cursor = self.raw_connection.cursor()
+        try:
+            cursor.execute(f"SET LOCAL statement_timeout = {int(self.statement_timeout_ms)}")
+            params = self._sample(cursor, target)
+            if params is None:
+                result.error = "нет данных для параметров запроса (sample_sql вернул пустой результат)"
+                return result
+            result.params = {name: str(value) for name, value in params.items()}
+            cursor.execute(f"EXPLAIN ({options}) {target.sql}", params or None)
+            explained = cursor.fetchone()[0]
+            explained = (json.loads(explained) if isinstance(explained, str) else explained)[0]
+        except Exception as e:
+            result.error = str(e).strip()
+            custom_logger.log_with_context("EXPLAIN %s не выполнен: %s", target.name, result.error)
+            return result
+        finally:
+            cursor.close()
+            self.raw_connection.rollback()
+
+        plan = explained["Plan"]
+        result.plan = plan
+        result.planning_ms = explained.get("Planning Time")
+        result.execution_ms = explained.get("Execution Time")
+        result.total_cost = plan.get("Total Cost")
+        result.shared_hit = plan.get("Shared Hit Blocks", 0)
+        result.shared_read = plan.get("Shared Read Blocks", 0)
+        result.issues = find_issues(plan, self.table_rows, self.min_table_rows, self.estimate_ratio)
+        return result
+
+    def capture_all(self, targets: Sequence[PlanTarget]) -> "PlanReport":
+        return PlanReport(dict(self.table_rows), [self.capture(target) for target in targets],
+                          self.min_table_rows, self.estimate_ratio)
+
+
+@dataclass
+class PlanReport:
+    """Планы набора запросов и размеры таблиц, на которых они сняты; сравнивается с отчётом прошлого прогона."""
+
+    table_rows: Dict[str, int]
+    plans: List[QueryPlan]
+    min_table_rows: int
+    estimate_ratio: float
+
+    @property
+    def issues(self) -> List[PlanIssue]:
+        return [issue for plan in self.plans for issue in plan.issues]
+
+    def suggested_indexes(self) -> Dict[str, List[str]]:
+        """Предлагаемые индексы и запросы, которым они нужны."""
+        result: Dict[str, List[str]] = {}
+        for plan in self.plans:
+            for issue in plan.issues:
+                if issue.suggestion:
+                    result.setdefault(issue.suggestion, []).append(plan.name)
+        return result
+
+    def to_dict(self, include_plans: bool = True) -> Dict[str, Any]:
+        return {
+            "table_rows": self.table_rows,
+            "min_table_rows": self.min_table_rows,
+            "estimate_ratio": self.estimate_ratio,
+            "suggested_indexes": self.suggested_indexes(),
+            "queries": [{**asdict(plan), "plan": plan.plan if include_plans else None} for plan in self.plans],
+        }
+
+    def format_table(self, baseline: Optional[Dict[str, Any]] = None) -> str:
+        """Текстовый отчёт; с baseline (to_dict прошлого прогона) — изменение времени и числа проблем."""
+        previous = {item["name"]: item for item in (baseline or {}).get("queries", [])}
+        header = f"{'query':<32}{'exec ms':>10}{'delta':>8}{'hit':>9}{'read':>8}{'issues':>8}"
+        lines = ["Размер таблиц: " + ", ".join(f"{name} {rows}" for name, rows in sorted(self.table_rows.items())),
+                 header, "-" * len(header)]
+        for plan in self.plans:
+            if plan.error:
+                lines.append(f"{plan.name[:31]:<32}  ошибка: {plan.error[:100]}")
+                continue
+            base = previous.get(plan.name, {})
+            execution = f"{plan.execution_ms:.2f}" if plan.execution_ms is not None else "generic"
+            delta = "-"
+            if plan.execution_ms is not None and base.get("execution_ms"):
+                delta = f"{(plan.execution_ms - base['execution_ms']) / base['execution_ms'] * 100:+.0f}%"
+            issues = f"{len(plan.issues)}"
+            if base and len(base.get("issues", [])) != len(plan.issues):
+                issues += f" ({len(plan.issues) - len(base.get('issues', [])):+d})"
+            lines.append(f"{plan.name[:31]:<32}{execution:>10}{delta:>8}{plan.shared_hit:>9}{plan.shared_read:>8}"
+                         f"{issues:>8}")
+            lines.extend(f"    {issue}" for issue in plan.issues)
+        suggestions = self.suggested_indexes()
+        if suggestions:
+            lines.append("Недостающие индексы:")
+            lines.extend(f"  {index};  -- {', '.join(names)}" for index, names in suggestions.items())
+        return "\n".join(lines)
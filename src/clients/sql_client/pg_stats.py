@@ -0,0 +1,180 @@
+import json
+import time
+from dataclasses import asdict, dataclass, fields
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+
+# Запросы самого снапшота в отчёт не попадают.
+_OWN_QUERY_MARKERS = ("pg_stat_statements", "pg_stat_user_tables")
+
+STATEMENTS_SQL = text("""
+    SELECT queryid, min(query) AS query, sum(calls) AS calls, sum(total_exec_time) AS total_ms,
+           sum(rows) AS rows, sum(shared_blks_hit) AS shared_blks_hit, sum(shared_blks_read) AS shared_blks_read,
+           sum(temp_blks_written) AS temp_blks_written
+    FROM pg_stat_statements
+    WHERE dbid = (SELECT oid FROM pg_database WHERE datname = current_database()) AND queryid IS NOT NULL
+    GROUP BY queryid
+""")
+TABLES_SQL = text("""
+    SELECT relname, seq_scan, seq_tup_read, coalesce(idx_scan, 0) AS idx_scan,
+           coalesce(idx_tup_fetch, 0) AS idx_tup_fetch, n_tup_ins, n_tup_upd, n_tup_del, n_live_tup
+    FROM pg_stat_user_tables
+""")
+
+# Метрики, по которым строятся топы запросов.
+TOP_METRICS = ("total_ms", "calls", "rows", "shared_blks_hit", "shared_blks_read")
+
+
+@dataclass
+class StatementStat:
+    """Накопленные счётчики pg_stat_statements одного запроса (по queryid, суммарно по пользователям)."""
+
+    queryid: int
+    query: str
+    calls: int = 0
+    total_ms: float = 0.0
+    rows: int = 0
+    shared_blks_hit: int = 0
+    shared_blks_read: int = 0
+    temp_blks_written: int = 0
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+    @property
+    def hit_ratio(self) -> Optional[float]:
+        blocks = self.shared_blks_hit + self.shared_blks_read
+        return self.shared_blks_hit / blocks if blocks else None
+
+
+@dataclass
+class TableStat:
+    """Счётчики pg_stat_user_tables одной таблицы: сканирования и изменения строк."""
+
+    relname: str
+    seq_scan: int = 0
+    seq_tup_read: int = 0
+    idx_scan: int = 0
+    idx_tup_fetch: int = 0
+    n_tup_ins: int = 0
+    n_tup_upd: int = 0
+    n_tup_del: int = 0
+    n_live_tup: int = 0
+
+
+def _counters_delta(after, before, keep: tuple):
+    """Разность счётчиков двух записей; поля keep берутся из after как есть."""
+    values = {}
+    for item in fields(after):
+        value = getattr(after, item.name)
+        values[item.name] = value if item.name in keep or before is None else value - getattr(before, item.name)
+    return type(after)(**values)
+
+
+@dataclass
+class PgStatsSnapshot:
+    """Снимок pg_stat_statements и pg_stat_user_tables текущей базы."""
+
+    taken_at: float
+    statements: Dict[int, StatementStat]
+    tables: Dict[str, TableStat]
+
+    @classmethod
+    def take(cls, connection) -> "PgStatsSnapshot":
+        """Снять снимок через соединение или сессию SQLAlchemy."""
+        statements = {}
+        for row in connection.execute(STATEMENTS_SQL).mappings():
+            if any(marker in row["query"] for marker in _OWN_QUERY_MARKERS):
+                continue
+            statements[row["queryid"]] = StatementStat(
+                queryid=row["queryid"], query=row["query"], calls=int(row["calls"]), total_ms=float(row["total_ms"]),
+                rows=int(row["rows"]), shared_blks_hit=int(row["shared_blks_hit"]),
+                shared_blks_read=int(row["shared_blks_read"]), temp_blks_written=int(row["temp_blks_written"]))
+        tables = {row["relname"]: TableStat(**row) for row in connection.execute(TABLES_SQL).mappings()}
+        return cls(time.time(), statements, tables)
+
+
+@dataclass
+class PgStatsDiff:
+    """Что база выполнила между двумя снимками, с меткой нагружаемого эндпоинта (или сценария, фазы).
+
+    В разность попадают все запросы базы за интервал — и сервиса, и проверок тестов, поэтому снимки стоит
+    снимать вокруг вызовов API без проверок через базу между ними.
+    """
+
+    label: str
+    elapsed: float
+    statements: List[StatementStat]
+    tables: List[TableStat]
+
+    @classmethod
+    def between(cls, before: PgStatsSnapshot, after: PgStatsSnapshot, label: str) -> "PgStatsDiff":
+        """Разность снимков: запросы с новыми вызовами и таблицы с изменившимися счётчиками.
+
+        Запрос, вытесненный из pg_stat_statements между снимками (pg_stat_statements.max), считается новым.
+        """
+        statements = []
+        for queryid, stat in after.statements.items():
+            previous = before.statements.get(queryid)
+            if previous is not None and previous.calls > stat.calls:
+                previous = None
+            delta = _counters_delta(stat, previous, keep=("queryid", "query"))
+            if delta.calls > 0:
+                statements.append(delta)
+        tables = []
+        for relname, stat in after.tables.items():
+            delta = _counters_delta(stat, before.tables.get(relname), keep=("relname", "n_live_tup"))
+            if any(getattr(delta, name) for name in ("seq_scan", "idx_scan", "n_tup_ins", "n_tup_upd", "n_tup_del")):
+                tables.append(delta)
+        return cls(label, after.taken_at - before.taken_at, statements, tables)
+
+    def top(self, metric: str = "total_ms", limit: int = 10) -> List[StatementStat]:
+        """Первые limit запросов по метрике из TOP_METRICS."""
+        return sorted(self.statements, key=lambda s: getattr(s, metric), reverse=True)[:limit]
+
+    def format_table(self, metric: str = "total_ms", limit: int = 10, query_width: int = 90) -> str:
+        """Текстовый отчёт: топ запросов по метрике и сканирования таблиц."""
+        header = f"{'calls':>8}{'total ms':>11}{'mean ms':>10}{'rows':>9}{'hit':>9}{'read':>8}  query"
+        lines = [f"[{self.label}] {self.elapsed:.2f}s, запросов: {len(self.statements)}, топ по {metric}",
+                 header, "-" * (len(header) + query_width - 5)]
+        for s in self.top(metric, limit):
+            query = " ".join(s.query.split())[:query_width]
+            lines.append(f"{s.calls:>8}{s.total_ms:>11.2f}{s.mean_ms:>10.3f}{s.rows:>9}{s.shared_blks_hit:>9}"
+                         f"{s.shared_blks_read:>8}  {query}")
+        if self.tables:
+            lines.append(f"{'table':<16}{'seq_scan':>10}{'seq_tup_read':>14}{'idx_scan':>10}{'ins':>8}{'upd':>8}"
+                         f"{'del':>8}{'live':>10}")
+            for t in sorted(self.tables, key=lambda t: t.seq_tup_read, reverse=True):
+                lines.append(f"{t.relname:<16}{t.seq_scan:>10}{t.seq_tup_read:>14}{t.idx_scan:>10}{t.n_tup_ins:>8}"
+                             f"{t.n_tup_upd:>8}{t.n_tup_del:>8}{t.n_live_tup:>10}")
+        return "\n".join(lines)
+
+    def to_dict(self, limit: int = 20) -> Dict[str, Any]:
+        """Топы запросов по каждой метрике TOP_METRICS и счётчики таблиц."""
+        def statement(s: StatementStat) -> Dict[str, Any]:
+            return {**asdict(s), "mean_ms": s.mean_ms, "hit_ratio": s.hit_ratio}
+
+        return {
+            "label": self.label,
+            "elapsed": self.elapsed,
+            "statements": len(self.statements),
+            "total_ms": sum(s.total_ms for s in self.statements),
+            "top": {metric: [statement(s) for s in self.top(metric, limit)] for metric in TOP_METRICS},
+            "tables": [asdict(t) for t in self.tables],
+        }
+
+
+@dataclass
+class BackendProfile:
+    """Результат профилирования блока кода: заполняется при выходе из SqlAlchemyClient.profile_backend."""
+
+    label: str
+    diff: Optional[PgStatsDiff] = None
+
+
+def write_report(diffs: List[PgStatsDiff], path: str, limit: int = 20) -> None:
+    """Сохранить разности снимков по меткам в JSON-файл."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump([diff.to_dict(limit) for diff in diffs], f, ensure_ascii=False, indent=2)
@@ -0,0 +1,207 @@
+import random
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Iterator, List, Optional, Sequence
+
+WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor incididunt ut labore et "
+    "dolore magna aliqua enim ad minim veniam quis nostrud exercitation ullamco laboris nisi aliquip ex ea "
+    "commodo consequat duis aute irure in reprehenderit voluptate velit esse cillum fugiat nulla pariatur "
+    "excepteur sint occaecat cupidatat non proident sunt culpa qui officia deserunt mollit anim id est laborum"
+).split()
+
+# Заглушка вместо хеша пароля: засеянные пользователи — это данные для выборок, войти под ними нельзя.
+# Чтобы получить пользователей с рабочим входом, передайте password_hash, которым сервис хеширует пароли.
+DEFAULT_PASSWORD_HASH = "{noop}seeded-user"
+
+TEXT_POOL_SIZE = 4096
+
+_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_value(value: Any) -> str:
+    r"""Представить значение в текстовом формате COPY (NULL — \N)."""
+    if value is None:
+        return "\\N"
+    if type(value) is str:
+        return value.translate(_ESCAPES)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+class CopyStream:
+    """Файлоподобный поток строк для COPY ... FROM STDIN.
+
+    Строки берутся из генератора по мере чтения, поэтому миллионы записей не держатся в памяти целиком.
+    """
+
+    def __init__(self, rows: Iterable[Sequence[Any]]) -> None:
+        self._rows = iter(rows)
+        self._buffer = b""
+        self.rows_written = 0
+
+    def _next_line(self) -> bytes:
+        row = next(self._rows)
+        self.rows_written += 1
+        return ("\t".join(_copy_value(value) for value in row) + "\n").encode()
+
+    def read(self, size: int = -1) -> bytes:
+        chunks = [self._buffer]
+        length = len(self._buffer)
+        try:
+            while size < 0 or length < size:
+                line = self._next_line()
+                chunks.append(line)
+                length += len(line)
+        except StopIteration:
+            pass
+        data = b"".join(chunks)
+        if size < 0:
+            self._buffer = b""
+            return data
+        self._buffer = data[size:]
+        return data[:size]
+
+
+def copy_rows(cursor, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> int:
+    """Загрузить строки в таблицу через COPY FROM STDIN и вернуть их количество."""
+    stream = CopyStream(rows)
+    cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", stream, size=1 << 16)
+    return stream.rows_written
+
+
+def sequential_uuid(prefix: int, index: int) -> uuid.UUID:
+    """UUID версии 4 из 64-битного префикса прогона и порядкового номера записи.
+
+    Позволяет ссылаться на пост или комментарий по номеру, не храня миллионы id в памяти.
+    """
+    return uuid.UUID(int=(prefix << 64) | index, version=4)
+
+
+@dataclass
+class SeedPlan:
+    """Параметры генерируемого набора данных.
+
+    comment_reply_ratio — доля комментариев, которые являются ответами на более ранний комментарий того же
+    поста (остальные — комментарии верхнего уровня), max_comment_depth — максимальная вложенность ответов.
+    """
+
+    users: int
+    posts: int
+    comments: int
+    votes: int
+    seed: int = 0
+    comment_reply_ratio: float = 0.6
+    max_comment_depth: int = 8
+    upvote_ratio: float = 0.7
+    password_hash: str = DEFAULT_PASSWORD_HASH
+    period: timedelta = timedelta(days=365)
+
+
+@dataclass
+class SeedResult:
+    """Итог засеивания: диапазон id пользователей, префиксы UUID и количество записей по таблицам."""
+
+    first_user_id: int
+    last_user_id: int
+    post_prefix: int
+    comment_prefix: int
+    counts: dict = field(default_factory=dict)
+
+    def post_id(self, index: int) -> uuid.UUID:
+        """Id поста с порядковым номером index."""
+        return sequential_uuid(self.post_prefix, index)
+
+    def comment_id(self, index: int) -> uuid.UUID:
+        """Id комментария с порядковым номером index."""
+        return sequential_uuid(self.comment_prefix, index)
+
+
+class DatasetGenerator:
+    """Детерминированный генератор строк users/posts/comments/votes по SeedPlan."""
+
+    def __init__(self, plan: SeedPlan, first_user_id: int) -> None:
+        if plan.posts and not plan.users:
+            raise ValueError("Для постов нужен хотя бы один пользователь")
+        if plan.comments and not plan.posts:
+            raise ValueError("Для комментариев нужен хотя бы один пост")
+        if plan.votes > plan.posts * plan.users:
+            raise ValueError("Голосов больше, чем уникальных пар (пост, пользователь)")
+        self.plan = plan
+        self.rng = random.Random(plan.seed)
+        self.first_user_id = first_user_id
+        self.post_prefix = self.rng.getrandbits(64)
+        self.comment_prefix = self.rng.getrandbits(64)
+        self.started_at = datetime.now(timezone.utc) - plan.period
+        # Тексты берутся из заранее сгенерированных пулов: сборка строки на каждую из миллионов записей
+        # занимала бы большую часть времени засеивания.
+        self._titles = [self._text(self.rng.randint(3, 8)) for _ in range(TEXT_POOL_SIZE)]
+        self._contents = [self._text(self.rng.randint(20, 60)) for _ in range(TEXT_POOL_SIZE)]
+        self._comment_texts = [self._text(self.rng.randint(5, 25)) for _ in range(TEXT_POOL_SIZE)]
+
+    def _text(self, words: int) -> str:
+        return " ".join(self.rng.choices(WORDS, k=words))
+
+    def _user_id(self, index: int) -> int:
+        return self.first_user_id + index % self.plan.users
+
+    def _post_created_at(self, index: int) -> datetime:
+        return self.started_at + self.plan.period * (index / max(self.plan.posts, 1))
+
+    def users(self) -> Iterator[tuple]:
+        """Строки (id, email, username, password, role, banned_until)."""
+        for index in range(self.plan.users):
+            user_id = self.first_user_id + index
+            yield (user_id, f"seed{user_id}@seed.example.com", f"seed_user_{user_id}",
+                   self.plan.password_hash, "USER", None)
+
+    def posts(self) -> Iterator[tuple]:
+        """Строки (id, title, content, created_at, author_id)."""
+        for index in range(self.plan.posts):
+            yield (sequential_uuid(self.post_prefix, index), self.rng.choice(self._titles),
+                   self.rng.choice(self._contents), self._post_created_at(index),
+                   self._user_id(self.rng.randrange(self.plan.users)))
+
+    def comments(self) -> Iterator[tuple]:
+        """Строки (id, text, created_at, author_id, post_id, parent_id).
+
+        Комментарии разбиты на непрерывные группы по постам; ответ ссылается на более ранний комментарий
+        своей группы, поэтому родитель всегда загружается раньше потомка, а дерево не выходит за пост.
+        """
+        plan = self.plan
+        step = plan.period / max(plan.posts, 1)
+        for post_index in range(plan.posts):
+            start = post_index * plan.comments // plan.posts
+            end = (post_index + 1) * plan.comments // plan.posts
+            post_id = sequential_uuid(self.post_prefix, post_index)
+            created_at = self._post_created_at(post_index)
+            depths: List[int] = []
+            for index in range(start, end):
+                parent_id: Optional[uuid.UUID] = None
+                depth = 0
+                if depths and self.rng.random() < plan.comment_reply_ratio:
+                    local_parent = self.rng.randrange(len(depths))
+                    if depths[local_parent] < plan.max_comment_depth:
+                        parent_id = sequential_uuid(self.comment_prefix, start + local_parent)
+                        depth = depths[local_parent] + 1
+                depths.append(depth)
+                created_at += step / (end - start + 1)
+                yield (sequential_uuid(self.comment_prefix, index), self.rng.choice(self._comment_texts),
+                       created_at, self._user_id(self.rng.randrange(plan.users)), post_id, parent_id)
+
+    def votes(self) -> Iterator[tuple]:
+        """Строки (post_id, user_id, value, created_at).
+
+        Голоса одного поста отдаются подряд идущим пользователям, поэтому пары (пост, пользователь) уникальны.
+        """
+        plan = self.plan
+        for post_index in range(plan.posts):
+            start = post_index * plan.votes // plan.posts
+            end = (post_index + 1) * plan.votes // plan.posts
+            post_id = sequential_uuid(self.post_prefix, post_index)
+            created_at = self._post_created_at(post_index)
+            for offset in range(end - start):
+                value = 1 if self.rng.random() < plan.upvote_ratio else -1
+                yield post_id, self._user_id(post_index + offset), value, created_at
@@ -1,11 +1,29 @@
-from typing import Any, Callable, Optional
+import logging
+import time
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
-import allure
-from sqlalchemy import text
+from sqlalchemy import delete, func, literal, or_, select, text
 
+from src.clients.sql_client.explain import BUILTIN_TARGETS, PlanCapture, PlanReport, PlanTarget
+from src.clients.sql_client.pg_stats import BackendProfile, PgStatsDiff, PgStatsSnapshot
+from src.clients.sql_client.seeding import DatasetGenerator, SeedPlan, SeedResult, copy_rows
 from src.clients.sql_client.sqlalchemy_connection import SQLAlchemyConnection
 from src.models.sqlalchemy_model import Base, Comment, Post, User, Vote
 from src.utils.custom_logger import CustomLogger
+from src.utils.query_tracker import QueryWindow, query_tracker
+from src.utils.reporting import step
 
 custom_logger = CustomLogger(__name__)
 
@@ -26,10 +44,19 @@ class SqlAlchemyClient:
                 session.commit()
                 return result
         except Exception as e:
-            custom_logger.log_with_context(f"Ошибка при работе с базой: {e}")
+            custom_logger.log_with_context("Ошибка при работе с базой: %s", e, level=logging.ERROR)
             return None
 
-    @allure.step("Установить роль ADMIN пользователю по user_id.")
+    def query_budget(self, max_queries: Optional[int] = None, max_time_ms: Optional[float] = None,
+                     max_repeats: Optional[int] = None, label: str = "блок") -> ContextManager[QueryWindow]:
+        """Бюджет запросов к базе для блока: with clients.db.query_budget(max_queries=1): ...
+
+        Превышение — QueryBudgetExceeded (см. QueryTracker.budget).
+        """
+        return query_tracker.budget(max_queries=max_queries, max_time_ms=max_time_ms, max_repeats=max_repeats,
+                                    label=label)
+
+    @step("Установить роль ADMIN пользователю по user_id.")
     def set_admin_role(self, user_id: int) -> bool:
         def operation(session):
             user = session.query(User).filter_by(id=user_id).one_or_none()
@@ -41,7 +68,7 @@ class SqlAlchemyClient:
         result = self._execute_db_operation(operation)
         return bool(result)
 
-    @allure.step("Удалить пользователя по user_id.")
+    @step("Удалить пользователя по user_id.")
     def delete_user(self, user_id: int) -> bool:
         def operation(session):
             user = session.query(User).filter_by(id=user_id).one_or_none()
@@ -54,96 +81,342 @@ class SqlAlchemyClient:
         result = self._execute_db_operation(operation)
         return bool(result)
 
-    @allure.step("Получить пользователя по email.")
+    @step("Получить пользователя по email.")
     def get_user_by_email(self, user_email: str) -> Optional[User]:
         def operation(session):
             return session.query(User).filter_by(email=user_email).one_or_none()
         return self._execute_db_operation(operation)
 
-    @allure.step("Получить пост по id.")
+    @step("Получить пользователей по списку email.")
+    def get_users_by_emails(self, emails: Iterable[str]) -> List[User]:
+        emails = list(emails)
+
+        def operation(session):
+            if not emails:
+                return []
+            return session.query(User).filter(User.email.in_(emails)).all()
+        return self._execute_db_operation(operation) or []
+
+    @step("Снять бан с пользователя по user_id.")
+    def unban_user(self, user_id: int) -> bool:
+        def operation(session):
+            updated = session.query(User).filter_by(id=user_id).update(
+                {User.banned_until: None}, synchronize_session=False)
+            return updated > 0
+        return bool(self._execute_db_operation(operation))
+
+    @step("Получить пост по id.")
     def get_post_by_id(self, post_id: str) -> Optional[Post]:
         def operation(session):
             return session.query(Post).filter_by(id=post_id).one_or_none()
         return self._execute_db_operation(operation)
 
-    @allure.step("Удалить пост по post_id.")
+    @step("Удалить пост по post_id.")
     def delete_post_by_author_id(self, author_id: int) -> bool:
         def operation(session):
-            posts = session.query(Post).filter_by(author_id=author_id).all()
-            if not posts:
-                return False
-            for post in posts:
-                session.delete(post)
-            return True
+            deleted = session.query(Post).filter_by(author_id=author_id).delete(synchronize_session=False)
+            return deleted > 0
 
         result = self._execute_db_operation(operation)
         return bool(result)
 
-    @allure.step("Получить комментарий по post_id.")
+    @step("Получить комментарий по post_id.")
     def get_comment_by_post_id(self, post_id: str) -> Optional[Comment]:
         def operation(session):
             return session.query(Comment).filter_by(post_id=post_id).one_or_none()
         return self._execute_db_operation(operation)
 
-    @allure.step("Получить комментарий по id.")
+    @step("Получить комментарий по id.")
     def get_comment_by_id(self, comment_id: str) -> Optional[Comment]:
         def operation(session):
             return session.query(Comment).filter_by(id=comment_id).one_or_none()
         return self._execute_db_operation(operation)
 
-    @allure.step("Удалить все комментарии пользователя по author_id.")
+    @step("Получить дерево комментариев поста одним рекурсивным запросом.")
+    def get_comment_tree(self, post_id: str) -> Optional[List[Dict[str, Any]]]:
+        """Все комментарии поста с глубиной и email автора, родители раньше потомков.
+
+        Дерево собирается рекурсивным CTE от комментариев верхнего уровня, поэтому глубина цепочки ответов не
+        влияет на количество запросов. Строки подходят для CommentTreeIndex.from_rows.
+        """
+        def operation(session):
+            tree = (
+                select(Comment.id, Comment.parent_id, Comment.text, Comment.author_id, Comment.created_at,
+                       literal(0).label("depth"))
+                .where(Comment.post_id == post_id, Comment.parent_id.is_(None))
+                .cte("comment_tree", recursive=True)
+            )
+            tree = tree.union_all(
+                select(Comment.id, Comment.parent_id, Comment.text, Comment.author_id, Comment.created_at,
+                       (tree.c.depth + 1).label("depth"))
+                .join(tree, Comment.parent_id == tree.c.id)
+            )
+            rows = session.execute(
+                select(tree.c.id, tree.c.parent_id, tree.c.depth, tree.c.text, tree.c.created_at,
+                       User.email.label("author"))
+                .join(User, User.id == tree.c.author_id)
+                .order_by(tree.c.depth, tree.c.created_at, tree.c.id)
+            ).mappings()
+            return [dict(row) for row in rows]
+        return self._execute_db_operation(operation)
+
+    @step("Удалить все комментарии пользователя по author_id.")
     def delete_comments_by_author_id(self, author_id: int) -> bool:
         def operation(session):
-            comments = session.query(Comment).filter_by(author_id=author_id).all()
-            if not comments:
-                return False
-            for comment in comments:
-                session.delete(comment)
-            return True
+            deleted = session.query(Comment).filter_by(author_id=author_id).delete(synchronize_session=False)
+            return deleted > 0
 
         result = self._execute_db_operation(operation)
         return bool(result)
 
-    @allure.step("Получить количество голосов за пост.")
+    @step("Получить количество голосов за пост.")
     def get_post_vote_value(self, post_id: str) -> Optional[int]:
+        """Сумма голосов за пост (как voteScore в API) или None, если голосов нет."""
         def operation(session):
-            vote = session.query(Vote).filter_by(post_id=post_id).first()
-            if vote is None:
-                return None
-            return vote.value
+            return session.query(func.sum(Vote.value)).filter(Vote.post_id == post_id).scalar()
 
         result = self._execute_db_operation(operation)
         return result
 
-    @allure.step("Удалить голоса за посты по user_id.")
+    @staticmethod
+    def _post_aggregates_query(post_ids: Optional[List[str]]):
+        """Посты с суммой голосов и количеством комментариев: группирующие подзапросы, присоединённые к posts."""
+        votes = select(Vote.post_id, func.sum(Vote.value).label("vote_score")).group_by(Vote.post_id).subquery()
+        comments = (select(Comment.post_id, func.count().label("comments"))
+                    .group_by(Comment.post_id).subquery())
+        query = (
+            select(Post.id, func.coalesce(votes.c.vote_score, 0), func.coalesce(comments.c.comments, 0))
+            .outerjoin(votes, votes.c.post_id == Post.id)
+            .outerjoin(comments, comments.c.post_id == Post.id)
+        )
+        if post_ids is not None:
+            query = query.where(Post.id.in_(post_ids))
+        return query
+
+    def iter_post_aggregates(self, post_ids: Optional[Iterable[str]] = None,
+                             batch_size: int = 10_000) -> Iterator[List[Tuple[str, int, int]]]:
+        """Порции (post_id, vote_score, comments) по batch_size строк одним запросом; без post_ids — все посты.
+
+        Строки читаются серверным курсором (yield_per), поэтому в памяти держится одна порция даже для
+        миллиона постов. Сессия и транзакция открыты, пока генератор не исчерпан или не закрыт. Ошибка базы
+        пробрасывается: оборванный поток нельзя вернуть как None.
+        """
+        post_ids = None if post_ids is None else list(post_ids)
+        try:
+            with self.connection.get_session() as session:
+                rows = session.execute(self._post_aggregates_query(post_ids).execution_options(yield_per=batch_size))
+                for partition in rows.partitions():
+                    yield [(str(post_id), int(vote_score), int(count)) for post_id, vote_score, count in partition]
+        except Exception as e:
+            custom_logger.log_with_context("Ошибка при работе с базой: %s", e, level=logging.ERROR)
+            raise
+
+    @step("Получить сумму голосов и количество комментариев по постам одним запросом.")
+    def get_post_aggregates(self, post_ids: Optional[Iterable[str]] = None,
+                            batch_size: int = 10_000) -> Optional[Dict[str, Tuple[int, int]]]:
+        """Ожидаемые voteScore и количество комментариев (включая вложенные ответы) для каждого поста.
+
+        Возвращает {post_id: (vote_score, comments)} целиком в памяти — для выборочных постов. Для всех постов
+        большой базы используйте iter_post_aggregates.
+        """
+        try:
+            return {post_id: (vote_score, count)
+                    for batch in self.iter_post_aggregates(post_ids, batch_size)
+                    for post_id, vote_score, count in batch}
+        except Exception:
+            return None
+
+    @step("Удалить голоса за посты по user_id.")
     def delete_votes_by_user_id(self, user_id: int) -> bool:
         def operation(session):
-            votes = session.query(Vote).filter_by(user_id=user_id).all()
-            if not votes:
-                return False
-            for vote in votes:
-                session.delete(vote)
-            return True
+            deleted = session.query(Vote).filter_by(user_id=user_id).delete(synchronize_session=False)
+            return deleted > 0
 
         result = self._execute_db_operation(operation)
         return bool(result)
 
-    @allure.step("Очистить все данные созданные пользователем и удалить его.")
+    @step("Очистить все данные созданные пользователем и удалить его.")
     def clear_user_data(self, user_id: int):
-        self.delete_votes_by_user_id(user_id)
-        self.delete_comments_by_author_id(user_id)
-        self.delete_post_by_author_id(user_id)
-        self.delete_user(user_id)
+        return self.clear_users_data([user_id])
+
+    @step("Очистить все данные созданные пользователями {user_ids} и удалить их.")
+    def clear_users_data(self, user_ids: Iterable[int], keep_users: bool = False) -> Optional[Dict[str, int]]:
+        """Удалить данные пользователей одной транзакцией несколькими set-based запросами.
+
+        Удаляются голоса пользователей и голоса за их посты, комментарии пользователей и комментарии
+        к их постам вместе со всеми ответами на них (в том числе чужими — иначе не даст parent_id),
+        посты пользователей и сами пользователи (если keep_users не задан).
+        Возвращает количество удалённых строк по таблицам.
+        """
+        user_ids = list(user_ids)
+        if not user_ids:
+            return {}
+
+        def operation(session):
+            user_posts = select(Post.id).where(Post.author_id.in_(user_ids))
+            doomed = (
+                select(Comment.id)
+                .where(or_(Comment.author_id.in_(user_ids), Comment.post_id.in_(user_posts)))
+                .cte("doomed_comments", recursive=True)
+            )
+            doomed = doomed.union(select(Comment.id).join(doomed, Comment.parent_id == doomed.c.id))
+            deleted = {
+                "votes": session.execute(
+                    delete(Vote).where(or_(Vote.user_id.in_(user_ids), Vote.post_id.in_(user_posts)))
+                ).rowcount,
+                "comments": session.execute(
+                    delete(Comment).where(Comment.id.in_(select(doomed.c.id)))
+                ).rowcount,
+                "posts": session.execute(delete(Post).where(Post.author_id.in_(user_ids))).rowcount,
+                "users": 0,
+            }
+            if not keep_users:
+                deleted["users"] = session.execute(delete(User).where(User.id.in_(user_ids))).rowcount
+            return deleted
+
+        return self._execute_db_operation(operation)
+
+    @step("Очистить все данные из всех таблиц в базе данных.")
+    def clear_all_tables(self, keep_user_ids: Optional[Iterable[int]] = None) -> None:
+        """Очистить все таблицы.
+
+        Пользователи из keep_user_ids (например, аккаунты пула) сохраняются; в этом случае последовательность
+        users_id_seq не сбрасывается, чтобы новые id не пересеклись с сохранёнными.
+        """
+        keep_user_ids = list(keep_user_ids or [])
 
-    @allure.step("Очистить все данные из всех таблиц в базе данных.")
-    def clear_all_tables(self) -> None:
         def operation(session):
             for table in reversed(self.metadata.sorted_tables):
-                session.execute(table.delete())
+                if table is User.__table__ and keep_user_ids:
+                    session.execute(table.delete().where(User.id.not_in(keep_user_ids)))
+                else:
+                    session.execute(table.delete())
             custom_logger.log_with_context("Все данные успешно очищены из таблиц.")
-            session.execute(text("ALTER SEQUENCE users_id_seq RESTART WITH 1"))
+            if not keep_user_ids:
+                session.execute(text("ALTER SEQUENCE users_id_seq RESTART WITH 1"))
         self._execute_db_operation(operation)
 
-    @allure.step("Закрыть соединение с базой.")
+    @step("Засеять базу набором данных через COPY: {plan}")
+    def seed_dataset(self, plan: SeedPlan) -> SeedResult:
+        """Массово загрузить пользователей, посты, деревья комментариев и голоса через COPY.
+
+        Все таблицы загружаются в одной транзакции напрямую через psycopg2 (COPY FROM STDIN), строки
+        генерируются потоково. Id пользователей продолжают текущий максимум, после загрузки сдвигается
+        users_id_seq, чтобы регистрация через API не упиралась в занятые id. В конце выполняется ANALYZE,
+        чтобы планировщик видел реальные размеры таблиц.
+        """
+        raw_connection = self.connection.engine.raw_connection()
+        try:
+            cursor = raw_connection.cursor()
+            cursor.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM users")
+            first_user_id = cursor.fetchone()[0]
+            generator = DatasetGenerator(plan, first_user_id)
+            counts = {
+                "users": copy_rows(cursor, "users", ("id", "email", "username", "password", "role", "banned_until"),
+                                   generator.users()),
+                "posts": copy_rows(cursor, "posts", ("id", "title", "content", "created_at", "author_id"),
+                                   generator.posts()),
+                "comments": copy_rows(cursor, "comments",
+                                      ("id", "text", "created_at", "author_id", "post_id", "parent_id"),
+                                      generator.comments()),
+                "votes": copy_rows(cursor, "votes", ("post_id", "user_id", "value", "created_at"),
+                                   generator.votes()),
+            }
+            cursor.execute("SELECT setval('users_id_seq', (SELECT MAX(id) FROM users))")
+            cursor.execute("ANALYZE users, posts, comments, votes")
+            raw_connection.commit()
+        except Exception as e:
+            raw_connection.rollback()
+            custom_logger.log_with_context("Ошибка при засеивании базы: %s", e)
+            raise
+        finally:
+            raw_connection.close()
+
+        custom_logger.log_with_context("База засеяна: %s", counts)
+        return SeedResult(
+            first_user_id=first_user_id,
+            last_user_id=first_user_id + plan.users - 1,
+            post_prefix=generator.post_prefix,
+            comment_prefix=generator.comment_prefix,
+            counts=counts,
+        )
+
+    @step("Подключить расширение pg_stat_statements.")
+    def enable_pg_stat_statements(self) -> bool:
+        """Создать расширение pg_stat_statements в базе (если его нет) и проверить, что статистика собирается.
+
+        Библиотека должна быть загружена сервером (shared_preload_libraries, см. docker-compose.yaml),
+        иначе возвращается False.
+        """
+        def operation(session):
+            session.execute(text("CREATE EXTENSION IF NOT EXISTS pg_stat_statements"))
+            session.execute(text("SELECT 1 FROM pg_stat_statements LIMIT 1"))
+            return True
+        return bool(self._execute_db_operation(operation))
+
+    def pg_stats_snapshot(self) -> PgStatsSnapshot:
+        """Снимок pg_stat_statements и pg_stat_user_tables текущей базы."""
+        snapshot = self._execute_db_operation(PgStatsSnapshot.take)
+        if snapshot is None:
+            raise RuntimeError("Не удалось прочитать pg_stat_statements: подключите расширение "
+                               "(enable_pg_stat_statements) и shared_preload_libraries=pg_stat_statements")
+        return snapshot
+
+    @contextmanager
+    def profile_backend(self, label: str, settle: float = 0.0) -> Iterator[BackendProfile]:
+        """Разность pg_stat_statements и pg_stat_user_tables за время блока с меткой label (эндпоинт, сценарий).
+
+        pg_stat_statements обновляется по завершении запроса, а счётчики таблиц сервис передаёт в статистику с
+        задержкой до секунды: settle — пауза перед вторым снимком, когда важны сканирования таблиц.
+        Результат — в profile.diff после выхода из блока.
+        """
+        profile = BackendProfile(label)
+        before = self.pg_stats_snapshot()
+        yield profile
+        if settle:
+            time.sleep(settle)
+        profile.diff = PgStatsDiff.between(before, self.pg_stats_snapshot(), label)
+        statements = profile.diff.statements
+        custom_logger.log_with_context("Статистика базы [%s]: запросов %d, %.1f ms", label, len(statements),
+                                       sum(s.total_ms for s in statements))
+
+    @step("Снять планы EXPLAIN (ANALYZE, BUFFERS) для {harvest} запросов из pg_stat_statements и заданных")
+    def explain_queries(self, targets: Optional[Sequence[PlanTarget]] = None, harvest: int = 0,
+                        min_table_rows: int = 10_000, estimate_ratio: float = 10.0) -> PlanReport:
+        """Планы запросов targets (по умолчанию BUILTIN_TARGETS) и harvest самых дорогих запросов сервиса.
+
+        Отмечаются Seq Scan таблиц от min_table_rows строк (с предложением индекса по условию Filter) и узлы,
+        где оценка строк планировщика расходится с фактом в estimate_ratio и более раз. Имеет смысл на засеянной
+        базе (seed_dataset / restore_snapshot): на маленьких таблицах Seq Scan — верный выбор планировщика.
+        """
+        targets = list(BUILTIN_TARGETS if targets is None else targets)
+        raw_connection = self.connection.engine.raw_connection()
+        try:
+            capture = PlanCapture(raw_connection, min_table_rows=min_table_rows, estimate_ratio=estimate_ratio)
+            if harvest:
+                targets += capture.harvest(harvest)
+            report = capture.capture_all(targets)
+        finally:
+            raw_connection.close()
+        custom_logger.log_with_context("Сняты планы %d запросов, проблем: %d", len(report.plans), len(report.issues))
+        return report
+
+    @step("Сохранить снапшот базы данных: {name}")
+    def create_snapshot(self, name: str = "baseline") -> None:
+        """Сохранить текущее состояние базы (например, после seed_dataset) как снапшот-шаблон."""
+        self.connection.create_snapshot(name)
+        custom_logger.log_with_context("Снапшот '%s' сохранён.", name)
+
+    @step("Восстановить базу данных из снапшота: {name}")
+    def restore_snapshot(self, name: str = "baseline") -> None:
+        """Вернуть базу к состоянию снапшота за время копирования шаблона, без повторного засеивания."""
+        self.connection.restore_snapshot(name)
+        custom_logger.log_with_context("База восстановлена из снапшота '%s'.", name)
+
+    def snapshot_exists(self, name: str = "baseline") -> bool:
+        """Проверить, существует ли снапшот."""
+        return self.connection.snapshot_exists(name)
+
+    @step("Закрыть соединение с базой.")
     def disconnect(self) -> None:
         self.connection.disconnect()
\ No newline at end of file
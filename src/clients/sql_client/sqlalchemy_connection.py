@@ -1,14 +1,21 @@
+import re
+import time
 from typing import Optional
 
-from sqlalchemy import Engine, create_engine
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
 from src.config.db_config import DataBaseConfig
 from src.utils.custom_logger import CustomLogger
+from src.utils.query_tracker import query_tracker
 
 custom_logger = CustomLogger(__name__)
 
+SNAPSHOT_NAME_PATTERN = re.compile(r"^[a-z0-9_]{1,32}$")
+
 class SQLAlchemyConnection:
     """Класс для управления соединением с базой данных PostgresSQL с использованием SQLAlchemy."""
 
@@ -32,13 +39,18 @@ class SQLAlchemyConnection:
                            Если это значение равно 0, пул не будет переполняться.
         pool_recycle (int): Количество секунд, после которых соединение будет переработано. Это полезно для 
                            баз данных, которые отключают соединения после определенного периода бездействия.
+
+        При DataBaseConfig.QUERY_TRACKING движок подключается к query_tracker: каждый запрос учитывается
+        с временем выполнения, тестом и фазой теста.
         """
         try:
             DataBaseConfig.validate()
             self.engine = create_engine(DataBaseConfig.DB_URL, pool_size=5, max_overflow=0, pool_recycle=3600)
+            if DataBaseConfig.QUERY_TRACKING:
+                query_tracker.instrument(self.engine)
             self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine, expire_on_commit=False)
         except SQLAlchemyError as e:
-            custom_logger.log_with_context(f"Error creating database engine: {e}")
+            custom_logger.log_with_context("Error creating database engine: %s", e)
             raise
 
     def get_session(self) -> Session:
@@ -54,3 +66,95 @@ class SQLAlchemyConnection:
             self.engine.dispose()
             self.engine = None
             self.SessionLocal = None
+
+    def _maintenance_engine(self) -> Engine:
+        """Движок к служебной базе postgres в режиме AUTOCOMMIT для CREATE/DROP DATABASE."""
+        url = make_url(DataBaseConfig.DB_URL).set(database="postgres")
+        return create_engine(url, isolation_level="AUTOCOMMIT", poolclass=NullPool)
+
+    @staticmethod
+    def snapshot_database_name(name: str) -> str:
+        """Имя базы-шаблона для снапшота name."""
+        if not SNAPSHOT_NAME_PATTERN.match(name):
+            raise ValueError(f"Недопустимое имя снапшота '{name}': ожидается [a-z0-9_]{{1,32}}")
+        return f"{DataBaseConfig.DB_NAME}_snapshot_{name}"
+
+    def _clone_database(self, connection, source: str, target: str, attempts: int = 5) -> None:
+        """Создать базу target из шаблона source.
+
+        PostgreSQL не копирует шаблон, к которому есть подключения, поэтому перед каждой попыткой
+        подключения к source (в том числе пул тестируемого сервиса) принудительно завершаются.
+        Сервис переподключается сам, поэтому при гонке попытка повторяется.
+        """
+        quote = connection.dialect.identifier_preparer.quote
+        for attempt in range(1, attempts + 1):
+            connection.execute(
+                text("SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+                     "WHERE datname = :db AND pid <> pg_backend_pid()"),
+                {"db": source})
+            try:
+                connection.execute(text(f"CREATE DATABASE {quote(target)} TEMPLATE {quote(source)}"))
+                return
+            except OperationalError as e:
+                if attempt == attempts or "is being accessed by other users" not in str(e):
+                    raise
+                time.sleep(0.2 * attempt)
+
+    def snapshot_exists(self, name: str) -> bool:
+        """Проверить, существует ли снапшот name."""
+        engine = self._maintenance_engine()
+        try:
+            with engine.connect() as connection:
+                return connection.execute(
+                    text("SELECT 1 FROM pg_database WHERE datname = :name"),
+                    {"name": self.snapshot_database_name(name)}).scalar() is not None
+        finally:
+            engine.dispose()
+
+    def create_snapshot(self, name: str) -> None:
+        """Сохранить текущее состояние базы в базу-шаблон (CREATE DATABASE ... TEMPLATE).
+
+        Существующий снапшот с тем же именем заменяется.
+        """
+        snapshot = self.snapshot_database_name(name)
+        if self.engine:
+            self.engine.dispose()
+        engine = self._maintenance_engine()
+        try:
+            with engine.connect() as connection:
+                quote = connection.dialect.identifier_preparer.quote
+                connection.execute(text(f"DROP DATABASE IF EXISTS {quote(snapshot)}"))
+                self._clone_database(connection, DataBaseConfig.DB_NAME, snapshot)
+        finally:
+            engine.dispose()
+
+    def restore_snapshot(self, name: str) -> None:
+        """Восстановить базу из снапшота: удалить её и создать заново копированием шаблона.
+
+        Копирование шаблона выполняется на уровне файлов и занимает секунды даже для больших наборов данных.
+        Подключения к базе (в том числе пул сервиса) разрываются, пул этого клиента сбрасывается.
+        """
+        snapshot = self.snapshot_database_name(name)
+        if self.engine:
+            self.engine.dispose()
+        engine = self._maintenance_engine()
+        try:
+            with engine.connect() as connection:
+                quote = connection.dialect.identifier_preparer.quote
+                if connection.execute(text("SELECT 1 FROM pg_database WHERE datname = :name"),
+                                      {"name": snapshot}).scalar() is None:
+                    raise ValueError(f"Снапшот '{name}' не найден")
+                connection.execute(text(f"DROP DATABASE IF EXISTS {quote(DataBaseConfig.DB_NAME)} WITH (FORCE)"))
+                self._clone_database(connection, snapshot, DataBaseConfig.DB_NAME)
+        finally:
+            engine.dispose()
+
+    def drop_snapshot(self, name: str) -> None:
+        """Удалить снапшот name, если он существует."""
+        engine = self._maintenance_engine()
+        try:
+            with engine.connect() as connection:
+                quote = connection.dialect.identifier_preparer.quote
+                connection.execute(text(f"DROP DATABASE IF EXISTS {quote(self.snapshot_database_name(name))}"))
+        finally:
+            engine.dispose()
@@ -1,25 +1,22 @@
-import os
+from src.config.env import env
 
-from dotenv import load_dotenv
-
-load_dotenv()
 
 class ApiEndpoints:
     """Класс, содержащий базовый URL и пути к основным API-эндпоинтам сервера.
 
-    Загружает параметры из переменных окружения, определенных в `.env` файле.
+    Загружает параметры из переменных окружения, определенных в `.env` файле, при первом обращении.
     """
 
-    BASE_URL = os.getenv("BASE_URL")
-    AUTH_REGISTER = os.getenv("AUTH_REGISTER")
-    AUTH_LOGIN = os.getenv("AUTH_LOGIN")
-    POSTS = os.getenv("POSTS")
-    POST = os.getenv("POST")
-    POST_VOTE = os.getenv("POST_VOTE")
-    POST_ADD_COMMENT = os.getenv("POST_ADD_COMMENT")
-    POST_PUBLISH = os.getenv("POST_PUBLISH")
-    PROFILE_INFO = os.getenv("PROFILE_INFO")
-    ADMIN_PROFILE_INFO = os.getenv("ADMIN_PROFILE_INFO")
-    ADMIN_BAN_USER = os.getenv("ADMIN_BAN_USER")
-    ADMIN_UNBAN_USER = os.getenv("ADMIN_UNBAN_USER")
-    COMMENT_REPLY = os.getenv("COMMENT_REPLY")
\ No newline at end of file
+    BASE_URL = env("BASE_URL")
+    AUTH_REGISTER = env("AUTH_REGISTER")
+    AUTH_LOGIN = env("AUTH_LOGIN")
+    POSTS = env("POSTS")
+    POST = env("POST")
+    POST_VOTE = env("POST_VOTE")
+    POST_ADD_COMMENT = env("POST_ADD_COMMENT")
+    POST_PUBLISH = env("POST_PUBLISH")
+    PROFILE_INFO = env("PROFILE_INFO")
+    ADMIN_PROFILE_INFO = env("ADMIN_PROFILE_INFO")
+    ADMIN_BAN_USER = env("ADMIN_BAN_USER")
+    ADMIN_UNBAN_USER = env("ADMIN_UNBAN_USER")
+    COMMENT_REPLY = env("COMMENT_REPLY")
\ No newline at end of file
@@ -1,21 +1,26 @@
-import os
+from src.config.env import Setting, env, to_bool
 
-from dotenv import load_dotenv
-
-load_dotenv()
 
 class DataBaseConfig:
     """Класс для хранения конфигурационных данных базы данных.
 
-    Загружает параметры подключения к базе данных из переменных окружения, определенных в `.env` файле
+    Загружает параметры подключения к базе данных из переменных окружения, определенных в `.env` файле,
+    при первом обращении.
+
+    QUERY_TRACKING (bool): Учитывать запросы движка SQLAlchemy в src.utils.query_tracker (количество и время
+                           по тестам и фикстурам, повторы N+1).
+    N_PLUS_ONE_THRESHOLD (int): Сколько выполнений одного шаблона запроса в одной фазе теста считается N+1.
     """
 
-    DB_HOST = os.getenv("DB_HOST")
-    DB_PORT = os.getenv("DB_PORT")
-    DB_USER = os.getenv("DB_USER")
-    DB_PASS = os.getenv("DB_PASS")
-    DB_NAME = os.getenv("DB_NAME")
-    DB_URL = f"postgresql://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+    DB_HOST = env("DB_HOST")
+    DB_PORT = env("DB_PORT")
+    DB_USER = env("DB_USER")
+    DB_PASS = env("DB_PASS")
+    DB_NAME = env("DB_NAME")
+    DB_URL = Setting(lambda cls: f"postgresql://{cls.DB_USER}:{cls.DB_PASS}@{cls.DB_HOST}:{cls.DB_PORT}"
+                                 f"/{cls.DB_NAME}")
+    QUERY_TRACKING = env("DB_QUERY_TRACKING", True, to_bool)
+    N_PLUS_ONE_THRESHOLD = env("DB_N_PLUS_ONE_THRESHOLD", 5, int)
 
     @classmethod
     def validate(cls) -> None:
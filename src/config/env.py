@@ -0,0 +1,54 @@
+import os
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+T = TypeVar('T')
+
+_loaded = False
+
+
+def load_env() -> None:
+    """Один раз загрузить `.env` в окружение процесса; python-dotenv импортируется только здесь.
+
+    Значения, уже заданные в окружении, не перезаписываются (как у load_dotenv по умолчанию).
+    """
+    global _loaded
+    if not _loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _loaded = True
+
+
+def to_bool(value: str) -> bool:
+    """Булево значение переменной окружения (1/true/yes/on)."""
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+class Setting(Generic[T]):
+    """Атрибут класса конфигурации, который вычисляется при первом обращении.
+
+    Вычисленное значение записывается в класс вместо дескриптора, поэтому следующие обращения стоят как
+    чтение обычного атрибута, а присваивание (ApiEndpoints.BASE_URL = ...) работает как раньше.
+    """
+
+    def __init__(self, resolve: Callable[[type], T]) -> None:
+        self.resolve = resolve
+        self.name: Optional[str] = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type) -> T:
+        value = self.resolve(owner)
+        setattr(owner, self.name, value)
+        return value
+
+
+def env(name: str, default: Optional[T] = None, cast: Callable[[str], T] = str) -> Setting[T]:
+    """Настройка из переменной окружения name (после загрузки `.env`); cast применяется к заданному значению."""
+    def resolve(owner: type) -> Optional[T]:
+        load_env()
+        value = os.getenv(name)
+        return default if value is None else cast(value)
+
+    return Setting(resolve)
@@ -0,0 +1,35 @@
+from src.config.env import env, to_bool
+
+
+class HttpClientConfig:
+    """Класс с настройками транспорта HTTP-клиентов: пул соединений, TCP keep-alive и прогрев.
+
+    Загружает параметры из переменных окружения, определенных в `.env` файле.
+
+    POOL_CONNECTIONS (int): Количество пулов (хостов), которые кеширует HTTPAdapter.
+    POOL_MAXSIZE (int): Максимальное количество соединений к одному хосту, которые пул хранит открытыми.
+    POOL_BLOCK (bool): Ждать освобождения соединения, когда пул исчерпан, вместо открытия нового одноразового
+                       соединения, которое будет закрыто после ответа.
+    TCP_KEEPALIVE (bool): Включить SO_KEEPALIVE, чтобы простаивающие соединения не обрывались по пути.
+    TCP_KEEPIDLE, TCP_KEEPINTVL, TCP_KEEPCNT (int): Параметры keep-alive проб (секунды, секунды, количество).
+    PREWARM_CONNECTIONS (int): Сколько соединений открыть заранее в warmup() перед замерами (0 — не прогревать).
+    ASYNC_MAX_CONNECTIONS (int): Размер пула соединений AsyncBaseClient.
+    RESPONSE_VALIDATION_MODE (str): Режим валидации ответов по умолчанию: strict, fast или trusted
+                                    (см. src.models.validation.ValidationMode).
+    CASSETTE_MODE (str): Режим кассет HTTP-обменов: off, record или replay
+                         (см. src.clients.http_client.cassette.CassetteMode).
+    CASSETTE_DIR (str): Каталог кассет; в тестах у каждого модуля своя кассета.
+    """
+
+    POOL_CONNECTIONS = env("HTTP_POOL_CONNECTIONS", 10, int)
+    POOL_MAXSIZE = env("HTTP_POOL_MAXSIZE", 10, int)
+    POOL_BLOCK = env("HTTP_POOL_BLOCK", False, to_bool)
+    TCP_KEEPALIVE = env("HTTP_TCP_KEEPALIVE", True, to_bool)
+    TCP_KEEPIDLE = env("HTTP_TCP_KEEPIDLE", 60, int)
+    TCP_KEEPINTVL = env("HTTP_TCP_KEEPINTVL", 10, int)
+    TCP_KEEPCNT = env("HTTP_TCP_KEEPCNT", 6, int)
+    PREWARM_CONNECTIONS = env("HTTP_PREWARM_CONNECTIONS", 0, int)
+    ASYNC_MAX_CONNECTIONS = env("HTTP_ASYNC_MAX_CONNECTIONS", 100, int)
+    RESPONSE_VALIDATION_MODE = env("RESPONSE_VALIDATION_MODE", "strict")
+    CASSETTE_MODE = env("HTTP_CASSETTE_MODE", "off")
+    CASSETTE_DIR = env("HTTP_CASSETTE_DIR", "tests/cassettes")
@@ -0,0 +1,20 @@
+from src.config.env import env, to_bool
+
+
+class LoggingConfig:
+    """Класс с настройками логирования CustomLogger.
+
+    Загружает параметры из переменных окружения, определенных в `.env` файле.
+
+    LEVEL (str): Уровень логирования корневого логгера (INFO, DEBUG, WARNING...).
+    FORMAT (str): Формат записей: text — строка как у logging.basicConfig, json — одна JSON-запись на строку.
+    QUEUE (bool): Передавать записи фоновому потоку (QueueHandler/QueueListener), чтобы вызывающий код
+                  не ждал записи в поток вывода.
+    SAMPLE_RATE (float): Доля записей уровня ниже WARNING, которые попадают в лог (1.0 — все). Предупреждения
+                         и ошибки не сэмплируются.
+    """
+
+    LEVEL = env("LOG_LEVEL", "INFO", str.upper)
+    FORMAT = env("LOG_FORMAT", "text", str.lower)
+    QUEUE = env("LOG_QUEUE", False, to_bool)
+    SAMPLE_RATE = env("LOG_SAMPLE_RATE", 1.0, float)
@@ -0,0 +1,19 @@
+from src.config.env import env
+
+
+class PayloadConfig:
+    """Класс с настройками пулов тестовых данных (src.utils.payload_pool).
+
+    Загружает параметры из переменных окружения, определенных в `.env` файле, при первом обращении.
+
+    SEED (int): Seed генерации: при одинаковых SEED и RUN_ID пулы выдают одни и те же данные.
+    RUN_ID (str): Метка прогона в email и username. По умолчанию — время старта процесса, чтобы данные разных
+                  прогонов не пересекались с пользователями, оставшимися в базе.
+    CHUNK_SIZE (int): Сколько объектов генерируется за один раз, когда пул исчерпан.
+    VALIDATION_MODE (str): Режим валидации сгенерированных объектов (strict, fast или trusted).
+    """
+
+    SEED = env("PAYLOAD_SEED", 0, int)
+    RUN_ID = env("PAYLOAD_RUN_ID")
+    CHUNK_SIZE = env("PAYLOAD_CHUNK_SIZE", 1024, int)
+    VALIDATION_MODE = env("PAYLOAD_VALIDATION_MODE", "fast")
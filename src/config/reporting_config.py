@@ -0,0 +1,17 @@
+from src.config.env import env, to_bool
+
+
+class ReportingConfig:
+    """Класс с настройками шагов Allure, которые создают контроллеры и клиенты (src.utils.reporting.step).
+
+    Загружает параметры из переменных окружения, определенных в `.env` файле.
+
+    STEPS_ENABLED (bool): Создавать шаги Allure. false — шаги не создаются и аргументы не форматируются
+                          (для нагрузочных прогонов и бенчмарков).
+    STEP_SAMPLE_EVERY (int): Записывать 1 из N вызовов верхнего уровня вместе со вложенными шагами (1 — все).
+    STEP_MAX_LENGTH (int): Максимальная длина заголовка шага и значения каждого параметра.
+    """
+
+    STEPS_ENABLED = env("ALLURE_STEPS", True, to_bool)
+    STEP_SAMPLE_EVERY = env("ALLURE_STEP_SAMPLE_EVERY", 1, int)
+    STEP_MAX_LENGTH = env("ALLURE_STEP_MAX_LENGTH", 200, int)
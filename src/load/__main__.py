@@ -0,0 +1,56 @@
+import argparse
+import json
+import sys
+
+from src.config.api_endpoints import ApiEndpoints
+from src.load.backend_profile import profile_load_phase
+from src.load.journeys import default_scenario
+from src.load.runner import LoadRunner
+from src.models.validation import ValidationMode
+from src.stub.server import StubServer
+from src.utils.payload_pool import payload_pool
+
+
+def main() -> None:
+    """Запустить сценарий по умолчанию с параметрами из командной строки и вывести отчёт."""
+    parser = argparse.ArgumentParser(description="Нагрузочный прогон сценариев nanoreddit")
+    parser.add_argument("--users", type=int, default=10, help="Количество виртуальных пользователей")
+    parser.add_argument("--duration", type=float, default=None, help="Длительность прогона в секундах")
+    parser.add_argument("--iterations", type=int, default=None, help="Итераций на пользователя")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="Время плавного старта пользователей")
+    parser.add_argument("--seed", type=int, default=None, help="Seed для воспроизводимого выбора сценариев")
+    parser.add_argument("--validation-mode", choices=[m.value for m in ValidationMode], default=None,
+                        help="Режим валидации ответов (по умолчанию RESPONSE_VALIDATION_MODE)")
+    parser.add_argument("--stub", action="store_true",
+                        help="Нагружать заглушку nanoreddit в этом процессе вместо BASE_URL")
+    parser.add_argument("--json", dest="json_path", default=None, help="Сохранить отчёт в JSON-файл")
+    parser.add_argument("--pg-stats", default=None,
+                        help="Сохранить в JSON-файл разность pg_stat_statements/pg_stat_user_tables за прогон")
+    args = parser.parse_args()
+
+    if args.stub and args.pg_stats:
+        parser.error("--pg-stats требует реальную базу и несовместим с --stub")
+    if args.duration is None and args.iterations is None:
+        args.iterations = 1
+    runner = LoadRunner(default_scenario(), users=args.users, duration=args.duration,
+                        iterations=args.iterations, ramp_up=args.ramp_up, seed=args.seed,
+                        validation_mode=args.validation_mode)
+    payload_pool().warmup()
+    if args.stub:
+        with StubServer() as server:
+            base_url, ApiEndpoints.BASE_URL = ApiEndpoints.BASE_URL, server.url
+            try:
+                report = runner.run_sync()
+            finally:
+                ApiEndpoints.BASE_URL = base_url
+    else:
+        with profile_load_phase("scenario:default", args.pg_stats):
+            report = runner.run_sync()
+    sys.stdout.write(report.format_table() + "\n")
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report.to_dict(), f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
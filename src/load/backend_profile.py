@@ -0,0 +1,28 @@
+import sys
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from src.clients.sql_client.pg_stats import BackendProfile, write_report
+
+
+@contextmanager
+def profile_load_phase(label: str, path: Optional[str], settle: float = 1.0,
+                       limit: int = 20) -> Iterator[Optional[BackendProfile]]:
+    """Снять pg_stat_statements и pg_stat_user_tables до и после фазы нагрузки и сохранить разность в path.
+
+    Без path ничего не делает. Топ запросов по времени и счётчики таблиц выводятся в stdout.
+    """
+    if not path:
+        yield None
+        return
+    from src.clients.sql_client.sqlalchemy_client import SqlAlchemyClient
+
+    sql_client = SqlAlchemyClient()
+    try:
+        sql_client.enable_pg_stat_statements()
+        with sql_client.profile_backend(label, settle=settle) as profile:
+            yield profile
+    finally:
+        sql_client.disconnect()
+    sys.stdout.write(profile.diff.format_table() + "\n")
+    write_report([profile.diff], path, limit)
@@ -0,0 +1,76 @@
+from src.load.scenario import Journey, Scenario, Step
+from src.load.virtual_user import VirtualUser
+from src.models.api_model import LoginRequest
+from src.utils.payload_pool import payload_pool
+
+
+async def register(user: VirtualUser):
+    """Зарегистрировать нового пользователя с уникальными email и username из пула данных."""
+    data = payload_pool().registration()
+    user.state["email"] = data.email
+    user.state["password"] = data.password
+    return await user.auth.register(data)
+
+
+async def login(user: VirtualUser):
+    """Авторизоваться под зарегистрированным пользователем (токен сохраняется в клиенте)."""
+    return await user.auth.login(LoginRequest(email=user.state["email"], password=user.state["password"]))
+
+
+async def publish_post(user: VirtualUser):
+    """Опубликовать пост и запомнить его id."""
+    response = await user.posts.publish_post(payload_pool().publish())
+    if response.responseData is not None:
+        user.state["post_id"] = str(response.responseData.id)
+    return response
+
+
+async def get_posts_list(user: VirtualUser):
+    """Получить первую страницу ленты постов."""
+    return await user.posts.get_posts_list({"page": 0, "size": 20})
+
+
+async def get_post(user: VirtualUser):
+    """Получить последний опубликованный пользователем пост."""
+    return await user.posts.get_post(user.state["post_id"])
+
+
+async def add_comment(user: VirtualUser):
+    """Прокомментировать последний опубликованный пост."""
+    return await user.posts.add_comment(user.state["post_id"], payload_pool().comment().text)
+
+
+async def vote_post(user: VirtualUser):
+    """Проголосовать за последний опубликованный пост."""
+    return await user.posts.vote_post(user.state["post_id"], user.rng.choice((-1, 1)))
+
+
+def full_journey(weight: float = 1.0) -> Journey:
+    """Полный путь нового пользователя: регистрация, вход, публикация, лента, комментарий, голос."""
+    return Journey(
+        name="full_journey",
+        weight=weight,
+        steps=[
+            Step("register", register),
+            Step("login", login),
+            Step("publish_post", publish_post),
+            Step("get_posts_list", get_posts_list),
+            Step("add_comment", add_comment),
+            Step("vote_post", vote_post),
+        ],
+    )
+
+
+def reader_journey(weight: float = 1.0) -> Journey:
+    """Читатель: один раз регистрируется и публикует пост, затем читает ленту и пост."""
+    return Journey(
+        name="reader_journey",
+        weight=weight,
+        setup=[Step("register", register), Step("login", login), Step("publish_post", publish_post)],
+        steps=[Step("get_posts_list", get_posts_list), Step("get_post", get_post)],
+    )
+
+
+def default_scenario() -> Scenario:
+    """Смешанный сценарий: 20% полных путей новых пользователей, 80% чтения."""
+    return Scenario([full_journey(weight=0.2), reader_journey(weight=0.8)])
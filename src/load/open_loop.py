@@ -0,0 +1,177 @@
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from typing import Any, Awaitable, Callable, Iterator, Literal, Optional, Set
+
+from src.clients.async_http_client.base_client import AsyncBaseClient
+from src.clients.async_http_client.post_controller import AsyncPostsController
+from src.config.api_endpoints import ApiEndpoints
+from src.load.backend_profile import profile_load_phase
+from src.load.stats import LoadReport, LoadStats
+from src.models.validation import ValidationMode
+from src.utils.custom_logger import CustomLogger
+
+custom_logger = CustomLogger(__name__)
+
+RequestFunc = Callable[[], Awaitable[Any]]
+Distribution = Literal["uniform", "poisson"]
+
+
+class ArrivalSchedule:
+    """Расписание прибытия запросов с постоянной средней интенсивностью rate (запросов в секунду).
+
+    uniform — равные интервалы 1/rate; poisson — экспоненциальные интервалы со средним 1/rate.
+    """
+
+    def __init__(self, rate: float, distribution: Distribution = "poisson", seed: Optional[int] = None) -> None:
+        if rate <= 0:
+            raise ValueError("Интенсивность rate должна быть положительной")
+        if distribution not in ("uniform", "poisson"):
+            raise ValueError(f"Неизвестное распределение: {distribution}")
+        self.rate = rate
+        self.distribution = distribution
+        self._rng = random.Random(seed)
+
+    def offsets(self, duration: float) -> Iterator[float]:
+        """Смещения запланированных отправок (секунды от старта) в пределах duration."""
+        offset = 0.0
+        while True:
+            if self.distribution == "uniform":
+                offset += 1 / self.rate
+            else:
+                offset += self._rng.expovariate(self.rate)
+            if offset >= duration:
+                return
+            yield offset
+
+
+class OpenLoopRunner:
+    """Открытый (open-loop) генератор нагрузки с постоянной интенсивностью прибытия.
+
+    Запросы отправляются по расписанию независимо от того, завершились ли предыдущие, поэтому
+    замедление сервера не снижает подаваемую нагрузку. Задержка считается от запланированного
+    момента отправки, а не от фактического: если генератор или пул соединений отстал, это время
+    попадает в задержку (поправка на coordinated omission). Отдельно пишется service time —
+    время от фактической отправки до ответа, — чтобы видеть, сколько добавила очередь.
+
+    max_in_flight ограничивает число одновременных запросов; запросы сверх лимита не ждут,
+    а учитываются отдельным счётчиком dropped (вне распределения задержек), чтобы не превращать
+    прогон в закрытый цикл.
+    """
+
+    def __init__(self, name: str, request: RequestFunc, rate: float, duration: float,
+                 distribution: Distribution = "poisson", max_in_flight: Optional[int] = None,
+                 seed: Optional[int] = None) -> None:
+        self.name = name
+        self.request = request
+        self.duration = duration
+        self.schedule = ArrivalSchedule(rate, distribution, seed)
+        self.max_in_flight = max_in_flight
+        self.stats = LoadStats()
+        self.dropped = 0
+
+    @property
+    def service_name(self) -> str:
+        """Имя шага, под которым пишется service time."""
+        return f"{self.name} (service)"
+
+    async def _fire(self, intended: float) -> None:
+        actual = time.perf_counter()
+        error = None
+        try:
+            response = await self.request()
+            if getattr(response, "status", "ok") != "ok":
+                error = getattr(response, "error", None) or "status=error"
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        finished = time.perf_counter()
+        self.stats.record(self.name, finished - intended, error)
+        self.stats.record(self.service_name, finished - actual, error)
+
+    async def run(self) -> LoadReport:
+        """Выполнить прогон и вернуть отчёт (задержка от запланированного и service time)."""
+        in_flight: Set[asyncio.Task] = set()
+        start = time.perf_counter()
+        for offset in self.schedule.offsets(self.duration):
+            intended = start + offset
+            delay = intended - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if self.max_in_flight is not None and len(in_flight) >= self.max_in_flight:
+                self.dropped += 1
+                self.stats.drop(self.name)
+                continue
+            task = asyncio.create_task(self._fire(intended))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        if in_flight:
+            await asyncio.gather(*in_flight)
+        report = self.stats.report(time.perf_counter() - start)
+        custom_logger.log_with_context(
+            f"Open-loop прогон {self.name} завершён за {report.elapsed:.2f}s, отброшено запросов: {self.dropped}")
+        return report
+
+    def run_sync(self) -> LoadReport:
+        """Выполнить прогон из синхронного кода."""
+        return asyncio.run(self.run())
+
+
+async def _run_target(args: argparse.Namespace) -> LoadReport:
+    async with AsyncBaseClient(max_connections=args.max_connections, validation_mode=args.validation_mode) as api:
+        await api.warmup(args.prewarm)
+        posts = AsyncPostsController(api)
+        if args.target == "posts_list":
+            async def request():
+                return await posts.get_posts_list({"page": 0, "size": args.page_size})
+        else:
+            page = await posts.get_posts_list({"page": 0, "size": 100})
+            if page.responseData is None or not page.responseData.content:
+                raise ValueError(f"Нет постов для нагрузки на GET /posts/{{id}}: {page.error}")
+            post_ids = [str(post.id) for post in page.responseData.content]
+            rng = random.Random(args.seed)
+
+            async def request():
+                return await posts.get_post(rng.choice(post_ids), {"page": 0, "size": args.page_size})
+
+        runner = OpenLoopRunner(args.target, request, rate=args.rate, duration=args.duration,
+                                distribution=args.distribution, max_in_flight=args.max_in_flight,
+                                seed=args.seed)
+        return await runner.run()
+
+
+def main() -> None:
+    """Запустить open-loop прогон выбранного эндпоинта с параметрами из командной строки."""
+    parser = argparse.ArgumentParser(description="Open-loop прогон с постоянной интенсивностью запросов")
+    parser.add_argument("--target", choices=("posts_list", "post"), default="posts_list",
+                        help="posts_list — GET /posts, post — GET /posts/{id} с комментариями")
+    parser.add_argument("--rate", type=float, required=True, help="Запросов в секунду")
+    parser.add_argument("--duration", type=float, default=30.0, help="Длительность прогона в секундах")
+    parser.add_argument("--distribution", choices=("uniform", "poisson"), default="poisson")
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--max-in-flight", type=int, default=None)
+    parser.add_argument("--max-connections", type=int, default=None,
+                        help="Размер пула соединений (по умолчанию HTTP_ASYNC_MAX_CONNECTIONS)")
+    parser.add_argument("--prewarm", type=int, default=None,
+                        help="Сколько соединений открыть до старта (по умолчанию HTTP_PREWARM_CONNECTIONS)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--validation-mode", choices=[m.value for m in ValidationMode], default=None,
+                        help="Режим валидации ответов (по умолчанию RESPONSE_VALIDATION_MODE)")
+    parser.add_argument("--json", dest="json_path", default=None, help="Сохранить отчёт в JSON-файл")
+    parser.add_argument("--pg-stats", default=None,
+                        help="Сохранить в JSON-файл разность pg_stat_statements/pg_stat_user_tables за прогон")
+    args = parser.parse_args()
+
+    endpoint = ApiEndpoints.POSTS if args.target == "posts_list" else ApiEndpoints.POST
+    with profile_load_phase(f"GET {endpoint}", args.pg_stats):
+        report = asyncio.run(_run_target(args))
+    sys.stdout.write(report.format_table() + "\n")
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report.to_dict(), f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+import argparse
+import asyncio
+import itertools
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.clients.async_http_client.base_client import AsyncBaseClient
+from src.clients.async_http_client.post_controller import AsyncPostsController
+from src.utils.comment_tree import count_comments
+from src.utils.custom_logger import CustomLogger
+
+if TYPE_CHECKING:
+    from src.clients.sql_client.sqlalchemy_client import SqlAlchemyClient
+
+custom_logger = CustomLogger(__name__)
+
+
+@dataclass
+class Mismatch:
+    """Расхождение агрегата поста: ожидаемое значение из базы и полученное из API."""
+
+    post_id: str
+    field: str
+    expected: int
+    actual: int
+
+
+@dataclass
+class ReconciliationReport:
+    """Итог сверки: сколько постов проверено, расхождения и ошибки запросов к API."""
+
+    checked: int = 0
+    elapsed: float = 0.0
+    mismatches: List[Mismatch] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches and not self.errors
+
+    def summary(self, limit: int = 10) -> str:
+        """Краткое описание результата с первыми limit расхождениями и ошибками."""
+        lines = [f"Проверено постов: {self.checked} за {self.elapsed:.2f}s, "
+                 f"расхождений: {len(self.mismatches)}, ошибок API: {len(self.errors)}"]
+        lines += [f"  {m.post_id} {m.field}: ожидалось {m.expected}, получено {m.actual}"
+                  for m in self.mismatches[:limit]]
+        lines += [f"  {post_id}: {error}" for post_id, error in list(self.errors.items())[:limit]]
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict:
+        return {"checked": self.checked, "elapsed": self.elapsed,
+                "mismatches": [asdict(m) for m in self.mismatches], "errors": self.errors}
+
+
+class Reconciler:
+    """Сверка voteScore и количества комментариев всех постов между API и базой.
+
+    Ожидаемые значения считаются одним группирующим запросом и читаются порциями по batch_size строк
+    (SqlAlchemyClient.iter_post_aggregates), посты запрашиваются у API параллельно concurrency воркерами
+    через AsyncPostsController. Воркеры берут посты из очередной порции, следующая читается из курсора,
+    когда текущая разобрана; ответы API сравниваются по мере получения и не накапливаются. Поэтому сверка
+    всей базы после нагрузочного прогона не требует ни запроса к базе на каждый пост, ни всех агрегатов
+    в памяти. Чтение порции из курсора синхронное и ненадолго блокирует цикл событий.
+    """
+
+    def __init__(self, db: "SqlAlchemyClient", concurrency: int = 50, comment_page_size: int = 100,
+                 token: Optional[str] = None, validation_mode: Optional[str] = None,
+                 batch_size: int = 10_000) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency должно быть положительным")
+        self.db = db
+        self.concurrency = concurrency
+        self.comment_page_size = comment_page_size
+        self.token = token
+        self.validation_mode = validation_mode
+        self.batch_size = batch_size
+
+    async def _fetch(self, posts: AsyncPostsController, post_id: str) -> Tuple[int, int]:
+        """Получить voteScore и количество комментариев поста, обойдя все страницы комментариев."""
+        page, comments, vote_score = 0, 0, None
+        while True:
+            response = await posts.get_post(post_id, {"page": page, "size": self.comment_page_size})
+            if response.status != "ok" or response.responseData is None:
+                raise Exception(f"API error: {response.error}")
+            data = response.responseData
+            if vote_score is None:
+                vote_score = data.voteScore
+            comments += count_comments(data.comments)
+            if not data.hasMoreComments or not data.comments:
+                return vote_score, comments
+            page += 1
+
+    async def _worker(self, posts: AsyncPostsController, queue: Iterator[Tuple[str, int, int]],
+                      report: ReconciliationReport) -> None:
+        for post_id, expected_votes, expected_comments in queue:
+            try:
+                vote_score, comments = await self._fetch(posts, post_id)
+            except Exception as e:
+                report.errors[post_id] = str(e)
+                continue
+            report.checked += 1
+            if vote_score != expected_votes:
+                report.mismatches.append(Mismatch(post_id, "voteScore", expected_votes, vote_score))
+            if comments != expected_comments:
+                report.mismatches.append(Mismatch(post_id, "comments", expected_comments, comments))
+
+    async def reconcile(self, post_ids: Optional[Iterable[str]] = None) -> ReconciliationReport:
+        """Сверить указанные посты (по умолчанию — все посты в базе) и вернуть отчёт."""
+        start = time.perf_counter()
+        report = ReconciliationReport()
+        # Общий итератор раздаёт посты воркерам: в памяти нет ни очереди из миллиона корутин, ни всех агрегатов.
+        batches = self.db.iter_post_aggregates(post_ids, self.batch_size)
+        queue = itertools.chain.from_iterable(batches)
+        async with AsyncBaseClient(max_connections=self.concurrency, validation_mode=self.validation_mode) as api:
+            if self.token:
+                api.set_token(self.token)
+            posts = AsyncPostsController(api)
+            try:
+                await asyncio.gather(*(self._worker(posts, queue, report) for _ in range(self.concurrency)))
+            finally:
+                batches.close()
+        report.elapsed = time.perf_counter() - start
+        custom_logger.log_with_context(
+            f"Сверка API и базы: проверено {report.checked}, расхождений {len(report.mismatches)}, "
+            f"ошибок {len(report.errors)}")
+        return report
+
+    def run_sync(self, post_ids: Optional[Iterable[str]] = None) -> ReconciliationReport:
+        """Выполнить сверку из синхронного кода."""
+        return asyncio.run(self.reconcile(post_ids))
+
+
+def main() -> None:
+    """Сверить агрегаты всех постов между API и базой и вывести отчёт."""
+    parser = argparse.ArgumentParser(description="Сверка voteScore и количества комментариев API с базой")
+    parser.add_argument("--concurrency", type=int, default=50, help="Количество параллельных запросов к API")
+    parser.add_argument("--comment-page-size", type=int, default=100, help="Размер страницы комментариев")
+    parser.add_argument("--batch-size", type=int, default=10_000,
+                        help="Сколько агрегатов постов читать из базы за раз")
+    parser.add_argument("--token", default=None, help="JWT для запросов к API, если он требуется")
+    parser.add_argument("--json", dest="json_path", default=None, help="Сохранить отчёт в JSON-файл")
+    args = parser.parse_args()
+
+    from src.clients.sql_client.sqlalchemy_client import SqlAlchemyClient
+
+    reconciler = Reconciler(SqlAlchemyClient(), concurrency=args.concurrency,
+                            comment_page_size=args.comment_page_size, token=args.token,
+                            batch_size=args.batch_size)
+    report = reconciler.run_sync()
+    sys.stdout.write(report.summary() + "\n")
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report.to_dict(), f, ensure_ascii=False, indent=2)
+    sys.exit(0 if report.ok else 1)
+
+
+if __name__ == "__main__":
+    main()
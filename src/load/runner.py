@@ -0,0 +1,99 @@
+import asyncio
+import time
+from typing import List, Optional
+
+from src.clients.async_http_client.base_client import AsyncBaseClient
+from src.load.scenario import Journey, Scenario, Step
+from src.load.stats import LoadReport, LoadStats
+from src.load.virtual_user import VirtualUser
+from src.utils.custom_logger import CustomLogger
+
+custom_logger = CustomLogger(__name__)
+
+
+class LoadRunner:
+    """Запуск сценария N виртуальными пользователями в одном событийном цикле.
+
+    Прогон ограничивается длительностью (duration, секунды) и/или количеством итераций
+    на пользователя (iterations). Каждая итерация — один journey, выбранный по весам.
+    Если шаг завершился ошибкой, оставшиеся шаги итерации пропускаются: они зависят от состояния,
+    которое ошибочный шаг должен был подготовить.
+    """
+
+    def __init__(self, scenario: Scenario, users: int, duration: Optional[float] = None,
+                 iterations: Optional[int] = None, ramp_up: float = 0.0, seed: Optional[int] = None,
+                 validation_mode: Optional[str] = None) -> None:
+        if duration is None and iterations is None:
+            raise ValueError("Нужно задать duration или iterations")
+        if users < 1:
+            raise ValueError("Количество виртуальных пользователей должно быть положительным")
+        self.scenario = scenario
+        self.users = users
+        self.duration = duration
+        self.iterations = iterations
+        self.ramp_up = ramp_up
+        self.seed = seed
+        self.validation_mode = validation_mode
+        self.stats = LoadStats()
+
+    async def _run_step(self, step: Step, user: VirtualUser) -> bool:
+        """Выполнить шаг, записать задержку и вернуть признак успеха."""
+        start = time.perf_counter()
+        error = None
+        try:
+            response = await step.func(user)
+            if getattr(response, "status", "ok") != "ok":
+                error = getattr(response, "error", None) or "status=error"
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        self.stats.record(step.name, time.perf_counter() - start, error)
+        return error is None
+
+    async def _run_steps(self, steps: List[Step], user: VirtualUser) -> bool:
+        for step in steps:
+            if not await self._run_step(step, user):
+                return False
+        return True
+
+    async def _user_loop(self, user: VirtualUser, deadline: Optional[float]) -> None:
+        if self.ramp_up and self.users > 1:
+            await asyncio.sleep(self.ramp_up * user.user_id / self.users)
+        prepared: set[str] = set()
+        done = 0
+        while self.iterations is None or done < self.iterations:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            journey: Journey = self.scenario.choose(user.rng)
+            if journey.name not in prepared:
+                if not await self._run_steps(journey.setup, user):
+                    done += 1
+                    continue
+                prepared.add(journey.name)
+            await self._run_steps(journey.steps, user)
+            done += 1
+
+    async def run(self) -> LoadReport:
+        """Выполнить прогон и вернуть отчёт.
+
+        Клиенты пользователей создаются и прогреваются (HttpClientConfig.PREWARM_CONNECTIONS) до старта
+        отсчёта, чтобы установка соединений не попадала в длительность и задержки.
+        """
+        users = [
+            VirtualUser(user_id, AsyncBaseClient(validation_mode=self.validation_mode),
+                        seed=None if self.seed is None else self.seed + user_id)
+            for user_id in range(self.users)
+        ]
+        try:
+            await asyncio.gather(*(user.api.warmup() for user in users))
+            start = time.perf_counter()
+            deadline = start + self.duration if self.duration is not None else None
+            await asyncio.gather(*(self._user_loop(user, deadline) for user in users))
+            report = self.stats.report(time.perf_counter() - start)
+        finally:
+            await asyncio.gather(*(user.api.close_session() for user in users))
+        custom_logger.log_with_context("Нагрузочный прогон завершён за %.2fs", report.elapsed)
+        return report
+
+    def run_sync(self) -> LoadReport:
+        """Выполнить прогон из синхронного кода."""
+        return asyncio.run(self.run())
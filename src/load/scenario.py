@@ -0,0 +1,46 @@
+import random
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, List, Sequence
+
+from src.load.virtual_user import VirtualUser
+
+StepFunc = Callable[[VirtualUser], Awaitable[Any]]
+
+
+@dataclass
+class Step:
+    """Шаг пользовательского сценария — один вызов контроллера от имени виртуального пользователя.
+
+    Функция шага возвращает ответ контроллера; ответ со статусом "error" считается ошибкой шага.
+    """
+
+    name: str
+    func: StepFunc
+
+
+@dataclass
+class Journey:
+    """Пользовательский сценарий: упорядоченная цепочка шагов и его вес при случайном выборе."""
+
+    name: str
+    steps: List[Step]
+    weight: float = 1.0
+    setup: List[Step] = field(default_factory=list)
+
+
+class Scenario:
+    """Набор взвешенных сценариев, из которого виртуальные пользователи выбирают следующую итерацию."""
+
+    def __init__(self, journeys: Sequence[Journey]) -> None:
+        if not journeys:
+            raise ValueError("Сценарий должен содержать хотя бы один journey")
+        if any(journey.weight <= 0 for journey in journeys):
+            raise ValueError("Вес journey должен быть положительным")
+        self.journeys = list(journeys)
+        self._weights = [journey.weight for journey in self.journeys]
+
+    def choose(self, rng: random.Random) -> Journey:
+        """Выбрать journey пропорционально весам."""
+        if len(self.journeys) == 1:
+            return self.journeys[0]
+        return rng.choices(self.journeys, weights=self._weights, k=1)[0]
@@ -0,0 +1,98 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from src.utils.percentiles import percentile
+
+
+@dataclass
+class StepStats:
+    """Накопленные замеры одного шага сценария: задержки вызовов, количество ошибок и отброшенных запросов.
+
+    Отброшенные запросы (не отправленные из-за лимита генератора) в распределение задержек не попадают:
+    их почти нулевые задержки занизили бы перцентили как раз тогда, когда сервер перегружен.
+    """
+
+    name: str
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+    dropped: int = 0
+    last_error: Optional[str] = None
+
+    def add(self, latency: float, error: Optional[str] = None) -> None:
+        """Добавить замер. Задержка ошибочного вызова тоже учитывается в распределении."""
+        self.latencies.append(latency)
+        if error is not None:
+            self.errors += 1
+            self.last_error = error
+
+    def drop(self) -> None:
+        """Учесть запрос, который генератор не отправил."""
+        self.dropped += 1
+
+    def summary(self, elapsed: float) -> Dict[str, float]:
+        """Сводка по шагу: количество, пропускная способность и перцентили задержки в миллисекундах."""
+        samples = sorted(self.latencies)
+        count = len(samples)
+        return {
+            "count": count,
+            "errors": self.errors,
+            "dropped": self.dropped,
+            "rps": count / elapsed if elapsed > 0 else 0.0,
+            "mean_ms": sum(samples) / count * 1000 if count else 0.0,
+            "p50_ms": percentile(samples, 50) * 1000,
+            "p90_ms": percentile(samples, 90) * 1000,
+            "p95_ms": percentile(samples, 95) * 1000,
+            "p99_ms": percentile(samples, 99) * 1000,
+            "max_ms": samples[-1] * 1000 if count else 0.0,
+        }
+
+
+class LoadStats:
+    """Сборщик статистики нагрузочного прогона в разрезе шагов."""
+
+    def __init__(self) -> None:
+        self.steps: Dict[str, StepStats] = {}
+
+    def _step(self, step_name: str) -> StepStats:
+        stats = self.steps.get(step_name)
+        if stats is None:
+            stats = self.steps[step_name] = StepStats(step_name)
+        return stats
+
+    def record(self, step_name: str, latency: float, error: Optional[str] = None) -> None:
+        """Зафиксировать выполнение шага с задержкой в секундах."""
+        self._step(step_name).add(latency, error)
+
+    def drop(self, step_name: str) -> None:
+        """Зафиксировать отброшенный запрос шага (без задержки)."""
+        self._step(step_name).drop()
+
+    def report(self, elapsed: float) -> "LoadReport":
+        """Сформировать отчёт по накопленным замерам."""
+        return LoadReport(
+            elapsed=elapsed,
+            steps={name: stats.summary(elapsed) for name, stats in self.steps.items()},
+        )
+
+
+@dataclass
+class LoadReport:
+    """Итоговый отчёт прогона: длительность и сводка по каждому шагу."""
+
+    elapsed: float
+    steps: Dict[str, Dict[str, float]]
+
+    def to_dict(self) -> Dict[str, object]:
+        """Представить отчёт в виде словаря для сохранения в JSON."""
+        return {"elapsed": self.elapsed, "steps": self.steps}
+
+    def format_table(self) -> str:
+        """Отформатировать отчёт в виде текстовой таблицы."""
+        header = (f"{'step':<24}{'count':>8}{'errors':>8}{'dropped':>9}{'rps':>10}"
+                  f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+        lines = [f"elapsed: {self.elapsed:.2f}s", header, "-" * len(header)]
+        for name, s in self.steps.items():
+            lines.append(
+                f"{name:<24}{s['count']:>8}{s['errors']:>8}{s['dropped']:>9}{s['rps']:>10.1f}"
+                f"{s['p50_ms']:>10.1f}{s['p95_ms']:>10.1f}{s['p99_ms']:>10.1f}{s['max_ms']:>10.1f}")
+        return "\n".join(lines)
@@ -0,0 +1,29 @@
+import random
+from typing import Any, Dict, Optional
+
+from src.clients.async_http_client.admin_controller import AsyncAdminController
+from src.clients.async_http_client.auth_controller import AsyncAuthController
+from src.clients.async_http_client.base_client import AsyncBaseClient
+from src.clients.async_http_client.comments_controller import AsyncCommentsController
+from src.clients.async_http_client.post_controller import AsyncPostsController
+from src.clients.async_http_client.profile_controller import AsyncProfileController
+
+
+class VirtualUser:
+    """Виртуальный пользователь нагрузочного прогона.
+
+    У каждого пользователя свой AsyncBaseClient (и, значит, свой JWT токен), набор асинхронных
+    контроллеров и словарь состояния, через который шаги сценария передают друг другу данные
+    (учётные данные, id созданного поста и т.п.).
+    """
+
+    def __init__(self, user_id: int, api: AsyncBaseClient, seed: Optional[int] = None) -> None:
+        self.user_id = user_id
+        self.api = api
+        self.auth = AsyncAuthController(api)
+        self.posts = AsyncPostsController(api)
+        self.comments = AsyncCommentsController(api)
+        self.profile = AsyncProfileController(api)
+        self.admin = AsyncAdminController(api)
+        self.state: Dict[str, Any] = {}
+        self.rng = random.Random(seed)
@@ -0,0 +1,154 @@
+import types
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel, EmailStr, TypeAdapter, create_model
+from pydantic_core import from_json
+
+from src.models.api_model import ApiResponse
+
+T = TypeVar('T', bound=BaseModel)
+
+# Облегчённые копии моделей общие для всех адаптеров: CommentResponseFast одинаков в PostDataResponseFast
+# и в fast_adapter(CommentResponse).
+_RELAXED_MODELS: Dict[type, Any] = {}
+
+
+class ValidationMode(str, Enum):
+    """Режим валидации ответов API.
+
+    STRICT — полная валидация исходной моделью (model_validate_json).
+    FAST — закешированный TypeAdapter облегчённой копии модели: EmailStr проверяется как str (проверка email
+           выполняется в Python и на больших страницах стоит дороже всего остального), остальные типы —
+           как в исходной модели. Возвращаемые объекты — экземпляры подклассов исходных моделей.
+    TRUSTED — валидируется только конверт ответа (status/error), данные собираются через model_construct
+              без проверки типов: datetime и UUID остаются строками. Сборка моделей идёт в Python, поэтому
+              на больших ответах режим обычно медленнее FAST (см. src.benchmarks.parse_benchmark).
+    """
+
+    STRICT = "strict"
+    FAST = "fast"
+    TRUSTED = "trusted"
+
+
+def _relax_annotation(annotation: Any, memo: Dict[type, Any]) -> Any:
+    """Заменить EmailStr на str в аннотации, рекурсивно заменяя вложенные модели облегчёнными копиями."""
+    if annotation is EmailStr:
+        return str
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _relaxed_model(annotation, memo)
+    origin = get_origin(annotation)
+    if origin in (list, List):
+        (item,) = get_args(annotation)
+        return List[_relax_annotation(item, memo)]
+    if origin in (Union, types.UnionType):
+        return Union[tuple(_relax_annotation(arg, memo) for arg in get_args(annotation))]
+    return annotation
+
+
+def _relaxed_model(model: Type[BaseModel], memo: Dict[type, Any]) -> Any:
+    if model in memo:
+        return memo[model]
+    name = f"{model.__name__}Fast"
+    # Пока модель строится, ссылки на неё (CommentResponse.replies) остаются строковыми forward ref.
+    memo[model] = name
+    overrides = {}
+    for field_name, field_info in model.model_fields.items():
+        relaxed = _relax_annotation(field_info.annotation, memo)
+        if relaxed != field_info.annotation:
+            overrides[field_name] = (relaxed, field_info)
+    relaxed_model = create_model(name, __base__=model, **overrides) if overrides else model
+    memo[model] = relaxed_model
+    return relaxed_model
+
+
+@lru_cache(maxsize=None)
+def fast_adapter(model: Type[T]) -> TypeAdapter:
+    """Закешированный TypeAdapter облегчённой копии модели (см. ValidationMode.FAST)."""
+    relaxed = _relaxed_model(model, _RELAXED_MODELS)
+    namespace = {value.__name__: value for value in _RELAXED_MODELS.values() if isinstance(value, type)}
+    for value in namespace.values():
+        if not value.__pydantic_complete__:
+            value.model_rebuild(_types_namespace=namespace)
+    return TypeAdapter(relaxed)
+
+
+def _unwrap_model(annotation: Any) -> Optional[Tuple[str, Type[BaseModel]]]:
+    """Определить, ссылается ли поле на модель ("model") или список моделей ("list")."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return "model", annotation
+    origin = get_origin(annotation)
+    if origin in (list, List):
+        (item,) = get_args(annotation)
+        target = _unwrap_model(item)
+        return ("list", target[1]) if target else None
+    if origin in (Union, types.UnionType):
+        for arg in get_args(annotation):
+            target = _unwrap_model(arg)
+            if target:
+                return target
+    return None
+
+
+@lru_cache(maxsize=None)
+def _construct_plan(model: Type[BaseModel]) -> Dict[str, Tuple[str, Type[BaseModel]]]:
+    plan = {}
+    for field_name, field_info in model.model_fields.items():
+        target = _unwrap_model(field_info.annotation)
+        if target:
+            plan[field_name] = target
+    return plan
+
+
+def construct_trusted(model: Type[T], data: Any) -> Any:
+    """Собрать модель из распарсенного JSON через model_construct, без валидации значений."""
+    if not isinstance(data, dict):
+        return data
+    plan = _construct_plan(model)
+    values = {}
+    for key, value in data.items():
+        target = plan.get(key)
+        if target is not None and value is not None:
+            kind, submodel = target
+            if kind == "model":
+                value = construct_trusted(submodel, value)
+            else:
+                value = [construct_trusted(submodel, item) for item in value]
+        values[key] = value
+    return model.model_construct(**values)
+
+
+def validate_python(model: Type[T], data: Any, mode: ValidationMode = ValidationMode.STRICT) -> T:
+    """Провалидировать уже распарсенный JSON в выбранном режиме валидации."""
+    if mode == ValidationMode.STRICT:
+        return model.model_validate(data)
+    if mode == ValidationMode.FAST:
+        return fast_adapter(model).validate_python(data)
+    ApiResponse.model_validate({"status": data.get("status"), "error": data.get("error")})
+    return construct_trusted(model, data)
+
+
+def _is_recursion_limit(error: ValueError) -> bool:
+    return "recursion limit" in str(error)
+
+
+def validate_response(model: Type[T], content: bytes, mode: ValidationMode = ValidationMode.STRICT) -> T:
+    """Разобрать тело ответа в модель в выбранном режиме валидации.
+
+    Парсер JSON pydantic-core ограничивает вложенность (цепочка ответов глубже ~100 уровней уже не разбирается),
+    поэтому ответы с деревьями комментариев при превышении лимита разбираются итеративно
+    (src.utils.comment_tree.load_deep_response).
+    """
+    try:
+        if mode == ValidationMode.STRICT:
+            return model.model_validate_json(content)
+        if mode == ValidationMode.FAST:
+            return fast_adapter(model).validate_json(content)
+        data = from_json(content)
+    except ValueError as e:
+        if not _is_recursion_limit(e):
+            raise
+        from src.utils.comment_tree import load_deep_response
+        return load_deep_response(model, content, mode)
+    return validate_python(model, data, mode)
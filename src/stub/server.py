@@ -0,0 +1,345 @@
+import argparse
+import json
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from pydantic import ValidationError
+
+from src.config.api_endpoints import ApiEndpoints
+from src.models.api_model import (
+    AdminUserResponse,
+    ApiResponse,
+    BanUserData,
+    BanUserResponse,
+    CommentApiResponse,
+    NewCommentRequest,
+    PostDataComponent,
+    PostDataResponse,
+    PostPublishResponse,
+    PostsPageDataComponent,
+    PostsResponse,
+    ProfileResponse,
+    PublishRequest,
+    RegistrationRequest,
+    UnbanUserData,
+    UnbanUserResponse,
+)
+from src.stub.store import InMemoryStore, StubError, StubUser
+from src.utils.comment_tree import dumps_comment_tree
+from src.utils.custom_logger import CustomLogger
+
+custom_logger = CustomLogger(__name__)
+
+# Пути по умолчанию (как в .env_sample), если переменные окружения ApiEndpoints не заданы.
+DEFAULT_PATHS = {
+    "AUTH_REGISTER": "/api/v1/auth/register",
+    "AUTH_LOGIN": "/api/v1/auth/login",
+    "POSTS": "/api/v1/posts",
+    "POST": "/api/v1/posts/{post_id}",
+    "POST_VOTE": "/api/v1/posts/{post_id}/vote",
+    "POST_ADD_COMMENT": "/api/v1/posts/{post_id}/addComment",
+    "POST_PUBLISH": "/api/v1/posts/publish",
+    "PROFILE_INFO": "/api/v1/profile/info",
+    "ADMIN_PROFILE_INFO": "/api/v1/admin/user/{user_id}",
+    "ADMIN_BAN_USER": "/api/v1/admin/management/ban/byEmail/{email}",
+    "ADMIN_UNBAN_USER": "/api/v1/admin/management/unban/byEmail/{email}",
+    "COMMENT_REPLY": "/api/v1/comments/{parentCommentId}/reply",
+}
+
+Request = Dict[str, Any]
+Handler = Callable[["StubApp", Request], str]
+
+
+def _route_pattern(template: str) -> Pattern:
+    """Регулярное выражение пути по шаблону ApiEndpoints: {name} — один сегмент пути."""
+    return re.compile("^" + re.sub(r"\\\{(\w+)\\\}", r"(?P<\1>[^/]+)", re.escape(template)) + "$")
+
+
+def _ok(envelope: ApiResponse) -> str:
+    return envelope.model_dump_json()
+
+
+def _int_param(query: Dict[str, str], name: str, default: Optional[int] = None, minimum: int = 0) -> int:
+    value = query.get(name)
+    if value is None:
+        if default is None:
+            raise StubError(400, f"Required parameter '{name}' is not present")
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise StubError(400, f"Parameter '{name}' must be an integer") from None
+    if number < minimum:
+        raise StubError(400, f"Parameter '{name}' must be at least {minimum}")
+    return number
+
+
+class StubApp:
+    """Маршруты заглушки nanoreddit: метод и шаблон пути из ApiEndpoints → обработчик.
+
+    Обработчик получает разобранный запрос (параметры пути и query, JSON-тело, пользователь по JWT) и
+    возвращает тело ответа в конвертах из src.models.api_model; ошибки — StubError со статусом и текстом.
+    Конверты собираются через model_construct: данные хранилища уже корректны и повторно не валидируются.
+    """
+
+    def __init__(self, store: Optional[InMemoryStore] = None) -> None:
+        self.store = store or InMemoryStore()
+        table: List[Tuple[str, str, Handler, bool]] = [
+            ("POST", "AUTH_REGISTER", StubApp.register, False),
+            ("POST", "AUTH_LOGIN", StubApp.login, False),
+            ("POST", "POST_PUBLISH", StubApp.publish, True),
+            ("GET", "POSTS", StubApp.posts, True),
+            ("GET", "POST", StubApp.post, True),
+            ("POST", "POST_VOTE", StubApp.vote, True),
+            ("POST", "POST_ADD_COMMENT", StubApp.add_comment, True),
+            ("POST", "COMMENT_REPLY", StubApp.reply, True),
+            ("POST", "PROFILE_INFO", StubApp.profile, True),
+            ("POST", "ADMIN_PROFILE_INFO", StubApp.admin_profile, True),
+            ("POST", "ADMIN_BAN_USER", StubApp.ban, True),
+            ("POST", "ADMIN_UNBAN_USER", StubApp.unban, True),
+        ]
+        self.routes = [(method, _route_pattern(getattr(ApiEndpoints, name) or DEFAULT_PATHS[name]), handler, auth)
+                       for method, name, handler, auth in table]
+
+    def handle(self, method: str, target: str, headers: Dict[str, str], body: bytes) -> Tuple[int, str]:
+        """Обработать запрос и вернуть HTTP-статус и JSON-тело ответа."""
+        parts = urlsplit(target)
+        path_matched = False
+        try:
+            for route_method, pattern, handler, auth in self.routes:
+                match = pattern.match(parts.path)
+                if match is None:
+                    continue
+                path_matched = True
+                if route_method != method:
+                    continue
+                request: Request = {
+                    "path": {name: unquote(value) for name, value in match.groupdict().items()},
+                    "query": dict(parse_qsl(parts.query)),
+                    "body": body,
+                    "user": self.store.authenticate(headers.get("Authorization")) if auth else None,
+                }
+                return 200, handler(self, request)
+            if path_matched:
+                raise StubError(405, f"Request method '{method}' is not supported")
+            raise StubError(404, f"No endpoint {method} {parts.path}")
+        except StubError as e:
+            return e.status, _ok(ApiResponse.model_construct(status="error", error=e.message))
+
+    @staticmethod
+    def _json(request: Request) -> Dict[str, Any]:
+        try:
+            data = json.loads(request["body"] or b"null")
+        except ValueError:
+            raise StubError(400, "Malformed JSON request") from None
+        if not isinstance(data, dict):
+            raise StubError(400, "Request body must be a JSON object")
+        return data
+
+    def _parse(self, model, request: Request):
+        try:
+            return model.model_validate(self._json(request))
+        except ValidationError as e:
+            raise StubError(400, "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}"
+                                           for err in e.errors())) from None
+
+    def _require_admin(self, user: StubUser) -> None:
+        if user.role != "ADMIN":
+            raise StubError(403, "Access denied")
+
+    def register(self, request: Request) -> str:
+        data = self._parse(RegistrationRequest, request)
+        user = self.store.register(data.email, data.username, data.password)
+        return _ok(ApiResponse.model_construct(status="ok", responseData={
+            "id": user.id, "email": user.email, "username": user.username}))
+
+    def login(self, request: Request) -> str:
+        data = self._json(request)
+        email, password = data.get("email"), data.get("password")
+        if not isinstance(email, str) or not isinstance(password, str):
+            raise StubError(400, "Email and password are required")
+        return _ok(ApiResponse.model_construct(status="ok", responseData={"jwt": self.store.login(email, password)}))
+
+    def publish(self, request: Request) -> str:
+        data = self._parse(PublishRequest, request)
+        post = self.store.publish(request["user"], data.title, data.content)
+        return _ok(PostPublishResponse.model_construct(status="ok", responseData=post))
+
+    def posts(self, request: Request) -> str:
+        query = request["query"]
+        page, size = _int_param(query, "page", 0), _int_param(query, "size", 10, minimum=1)
+        ascending = query.get("sort", "").lower().endswith("asc")
+        content, total, pages = self.store.posts_page(page, size, ascending)
+        return _ok(PostsResponse.model_construct(status="ok", responseData=PostsPageDataComponent.model_construct(
+            content=content, pageNumber=page, pageSize=size, totalElements=total, totalPages=pages)))
+
+    def post(self, request: Request) -> str:
+        query = request["query"]
+        page, size = _int_param(query, "page", 0), _int_param(query, "size", 10, minimum=1)
+        post = self.store.post(request["path"]["post_id"])
+        with self.store.lock:
+            roots = post.comments[page * size:(page + 1) * size]
+            has_more = (page + 1) * size < len(post.comments)
+            envelope = _ok(PostDataResponse.model_construct(status="ok", responseData=PostDataComponent.model_construct(
+                post=post.data, comments=[], voteScore=post.vote_score, hasMoreComments=has_more)))
+            # Дерево ответов сериализуется без рекурсии: цепочки ответов могут быть глубже лимита стека.
+            return envelope.replace('"comments":[]', f'"comments":{dumps_comment_tree(roots)}', 1)
+
+    def vote(self, request: Request) -> str:
+        value = _int_param(request["query"], "value", minimum=-1)
+        self.store.vote(request["user"], request["path"]["post_id"], value)
+        return _ok(ApiResponse.model_construct(status="ok", responseData=None))
+
+    def add_comment(self, request: Request) -> str:
+        data = self._parse(NewCommentRequest, request)
+        comment = self.store.add_comment(request["user"], data.text, post_id=request["path"]["post_id"])
+        return _ok(CommentApiResponse.model_construct(status="ok", responseData=comment))
+
+    def reply(self, request: Request) -> str:
+        data = self._parse(NewCommentRequest, request)
+        comment = self.store.add_comment(request["user"], data.text, parent_id=request["path"]["parentCommentId"])
+        return _ok(CommentApiResponse.model_construct(status="ok", responseData=comment))
+
+    def profile(self, request: Request) -> str:
+        return _ok(ProfileResponse.model_construct(status="ok", responseData=request["user"].profile()))
+
+    def admin_profile(self, request: Request) -> str:
+        self._require_admin(request["user"])
+        user_id = request["path"]["user_id"]
+        if not user_id.isdigit():
+            raise StubError(400, f"Invalid user id: {user_id}")
+        user = self.store.user_by_id(int(user_id))
+        return _ok(AdminUserResponse.model_construct(status="ok", responseData=user.profile()))
+
+    def ban(self, request: Request) -> str:
+        self._require_admin(request["user"])
+        seconds = _int_param(request["query"], "forSeconds", minimum=1)
+        user = self.store.ban(request["path"]["email"], seconds)
+        return _ok(BanUserResponse.model_construct(status="ok", message="User banned",
+                                                   responseData=BanUserData.model_construct(
+                                                       bannedUntil=user.banned_until)))
+
+    def unban(self, request: Request) -> str:
+        self._require_admin(request["user"])
+        self.store.unban(request["path"]["email"])
+        return _ok(UnbanUserResponse.model_construct(status="ok", message="User unbanned",
+                                                     responseData=UnbanUserData.model_construct(bannedUntil=None)))
+
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 с keep-alive: клиенты держат соединения в пуле, как с настоящим сервисом.
+
+    Заголовки и тело уходят одной записью в сокет с TCP_NODELAY: иначе ответ из двух сегментов ждёт
+    delayed ACK клиента (~40 мс) и заглушка не годится как точка отсчёта накладных расходов.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    wbufsize = -1
+    server_version = "nanoreddit-stub"
+
+    def _dispatch(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        method = "GET" if self.command == "HEAD" else self.command
+        status, payload = self.server.app.handle(method, self.path, self.headers, body)
+        data = payload.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(data)
+
+    do_HEAD = _dispatch
+    do_GET = _dispatch
+    do_POST = _dispatch
+    do_PUT = _dispatch
+    do_DELETE = _dispatch
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class StubServer:
+    """Заглушка REST API nanoreddit на localhost в фоновом потоке процесса.
+
+    Реализует все маршруты ApiEndpoints поверх InMemoryStore и запускается за миллисекунды, поэтому
+    подходит для разработки клиентов, нагрузочного генератора и бенчмарков без Spring-приложения и базы,
+    а также как точка отсчёта накладных расходов на стороне клиента. port=0 — свободный порт.
+
+        with StubServer() as server:
+            client = BaseClient()
+            client.base_url = server.url
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, store: Optional[InMemoryStore] = None) -> None:
+        self.app = StubApp(store)
+        self._httpd = ThreadingHTTPServer((host, port), _StubRequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.app = self.app
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def store(self) -> InMemoryStore:
+        return self.app.store
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubServer":
+        """Начать обслуживать запросы в фоновом потоке."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name="nanoreddit-stub", daemon=True)
+            self._thread.start()
+            custom_logger.log_with_context("Заглушка nanoreddit запущена на %s", self.url)
+        return self
+
+    def stop(self) -> None:
+        """Остановить сервер и закрыть сокет."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+
+def main() -> None:
+    """Запустить заглушку nanoreddit на указанном порту до прерывания (Ctrl+C)."""
+    parser = argparse.ArgumentParser(description="Заглушка REST API nanoreddit в памяти процесса")
+    parser.add_argument("--host", default="127.0.0.1", help="Адрес для прослушивания")
+    parser.add_argument("--port", type=int, default=8080, help="Порт (0 — свободный)")
+    parser.add_argument("--admin", default=None, metavar="EMAIL:USERNAME:PASSWORD",
+                        help="Заранее зарегистрировать администратора")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    server = StubServer(args.host, args.port)
+    if args.admin:
+        email, username, password = args.admin.split(":", 2)
+        server.store.set_role(server.store.register(email, username, password).id, "ADMIN")
+    server.start()
+    sys.stdout.write(f"nanoreddit stub: {server.url} (старт за {time.perf_counter() - started:.3f}s)\n")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
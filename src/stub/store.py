@@ -0,0 +1,232 @@
+import base64
+import hashlib
+import hmac
+import json
+import math
+import secrets
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from src.models.api_model import CommentResponse, PostPublishComponent, ProfileDataComponent
+
+
+class StubError(Exception):
+    """Ошибка обработки запроса заглушкой: HTTP-статус и текст, который попадёт в поле error ответа."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _password_hash(password: str) -> str:
+    return hashlib.sha256(password.encode()).hexdigest()
+
+
+@dataclass
+class StubUser:
+    """Пользователь заглушки: роль хранится как в таблице users (USER, MODERATOR, ADMIN)."""
+
+    id: int
+    email: str
+    username: str
+    password_hash: str
+    role: str = "USER"
+    banned_until: Optional[datetime] = None
+
+    def is_banned(self) -> bool:
+        return self.banned_until is not None and self.banned_until > datetime.now()
+
+    def profile(self) -> ProfileDataComponent:
+        return ProfileDataComponent.model_construct(id=self.id, email=self.email, username=self.username,
+                                                    bannedUntil=self.banned_until,
+                                                    authorities=[f"ROLE_{self.role}"])
+
+
+@dataclass
+class StubPost:
+    """Пост с голосами (id пользователя → ±1) и комментариями верхнего уровня в порядке добавления."""
+
+    data: PostPublishComponent
+    votes: Dict[int, int] = field(default_factory=dict)
+    vote_score: int = 0
+    comments: List[CommentResponse] = field(default_factory=list)
+
+
+class InMemoryStore:
+    """Хранилище заглушки nanoreddit в памяти процесса: пользователи, посты, голоса и комментарии.
+
+    Все операции выполняются под одной блокировкой. Ответы на комментарии сразу добавляются в replies
+    родителя, поэтому дерево поста не нужно собирать при каждом GET /posts/{postId}.
+    JWT подписывается HMAC-SHA256 секретом экземпляра: exp в payload читается так же, как у токенов
+    настоящего сервиса (tests/user_pool.decode_jwt_expiry).
+    """
+
+    def __init__(self, token_ttl: int = 3600) -> None:
+        self.token_ttl = token_ttl
+        self.lock = threading.RLock()
+        self._secret = secrets.token_bytes(32)
+        self._users: Dict[int, StubUser] = {}
+        self._users_by_email: Dict[str, StubUser] = {}
+        self._usernames: set = set()
+        self._posts: Dict[uuid.UUID, StubPost] = {}
+        self._feed: List[PostPublishComponent] = []
+        self._comments: Dict[uuid.UUID, Tuple[CommentResponse, StubPost]] = {}
+        self._next_user_id = 1
+
+    def issue_token(self, user: StubUser) -> str:
+        """Выдать JWT пользователю."""
+        now = int(time.time())
+        header = _b64(b'{"alg":"HS256","typ":"JWT"}')
+        payload = _b64(json.dumps({"sub": user.email, "iat": now, "exp": now + self.token_ttl}).encode())
+        signature = hmac.new(self._secret, f"{header}.{payload}".encode(), hashlib.sha256).digest()
+        return f"{header}.{payload}.{_b64(signature)}"
+
+    def authenticate(self, authorization: Optional[str]) -> StubUser:
+        """Пользователь по заголовку Authorization: Bearer <jwt>; без валидного токена — 401 Access denied."""
+        if not authorization or not authorization.startswith("Bearer "):
+            raise StubError(401, "Access denied")
+        try:
+            header, payload, signature = authorization[7:].split(".")
+            expected = hmac.new(self._secret, f"{header}.{payload}".encode(), hashlib.sha256).digest()
+            if not hmac.compare_digest(_b64(expected), signature):
+                raise ValueError("bad signature")
+            claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        except ValueError:
+            raise StubError(401, "Access denied") from None
+        with self.lock:
+            user = self._users_by_email.get(claims.get("sub"))
+        if user is None or claims.get("exp", 0) < time.time():
+            raise StubError(401, "Access denied")
+        return user
+
+    def register(self, email: str, username: str, password: str) -> StubUser:
+        """Зарегистрировать пользователя с ролью USER."""
+        with self.lock:
+            if email in self._users_by_email or username in self._usernames:
+                raise StubError(400, "Username or Email already in use!")
+            user = StubUser(self._next_user_id, email, username, _password_hash(password))
+            self._next_user_id += 1
+            self._users[user.id] = user
+            self._users_by_email[email] = user
+            self._usernames.add(username)
+        return user
+
+    def login(self, email: str, password: str) -> str:
+        """Проверить email и пароль и выдать JWT."""
+        with self.lock:
+            user = self._users_by_email.get(email)
+        if user is None or not hmac.compare_digest(user.password_hash, _password_hash(password)):
+            raise StubError(401, "Bad credentials")
+        return self.issue_token(user)
+
+    def set_role(self, user_id: int, role: str) -> None:
+        """Назначить роль пользователю (аналог SqlAlchemyClient.set_admin_role для заглушки)."""
+        with self.lock:
+            self.user_by_id(user_id).role = role
+
+    def user_by_id(self, user_id: int) -> StubUser:
+        with self.lock:
+            user = self._users.get(user_id)
+        if user is None:
+            raise StubError(404, f"User not found with id: {user_id}")
+        return user
+
+    def user_by_email(self, email: str) -> StubUser:
+        with self.lock:
+            user = self._users_by_email.get(email)
+        if user is None:
+            raise StubError(404, f"User not found with email: {email}")
+        return user
+
+    def ban(self, email: str, seconds: int) -> StubUser:
+        """Забанить пользователя на seconds секунд."""
+        user = self.user_by_email(email)
+        with self.lock:
+            user.banned_until = datetime.now() + timedelta(seconds=seconds)
+        return user
+
+    def unban(self, email: str) -> StubUser:
+        user = self.user_by_email(email)
+        with self.lock:
+            user.banned_until = None
+        return user
+
+    @staticmethod
+    def _check_not_banned(user: StubUser) -> None:
+        if user.is_banned():
+            raise StubError(403, f"User is banned until {user.banned_until.isoformat()}")
+
+    def publish(self, user: StubUser, title: str, content: str) -> PostPublishComponent:
+        """Опубликовать пост от имени пользователя."""
+        self._check_not_banned(user)
+        post = PostPublishComponent.model_construct(id=uuid.uuid4(), title=title, content=content,
+                                                    author=user.email, createdAt=datetime.now())
+        with self.lock:
+            self._posts[post.id] = StubPost(post)
+            self._feed.append(post)
+        return post
+
+    def post(self, post_id: str) -> StubPost:
+        try:
+            key = uuid.UUID(post_id)
+        except ValueError:
+            raise StubError(400, f"Invalid post id: {post_id}") from None
+        with self.lock:
+            post = self._posts.get(key)
+        if post is None:
+            raise StubError(404, "Post not found")
+        return post
+
+    def posts_page(self, page: int, size: int, ascending: bool = False) -> Tuple[List[PostPublishComponent], int, int]:
+        """Страница ленты (по умолчанию новые посты первыми), общее количество постов и страниц."""
+        with self.lock:
+            total = len(self._feed)
+            if ascending:
+                content = self._feed[page * size:(page + 1) * size]
+            else:
+                end = max(total - page * size, 0)
+                content = self._feed[max(end - size, 0):end][::-1]
+        return content, total, math.ceil(total / size)
+
+    def vote(self, user: StubUser, post_id: str, value: int) -> int:
+        """Проголосовать за пост (повторный голос заменяет прежний) и вернуть новый voteScore."""
+        if value not in (-1, 1):
+            raise StubError(400, "Vote value must be 1 or -1")
+        self._check_not_banned(user)
+        post = self.post(post_id)
+        with self.lock:
+            post.vote_score += value - post.votes.get(user.id, 0)
+            post.votes[user.id] = value
+            return post.vote_score
+
+    def add_comment(self, user: StubUser, text: str, post_id: Optional[str] = None,
+                    parent_id: Optional[str] = None) -> CommentResponse:
+        """Добавить комментарий к посту (post_id) или ответ на комментарий (parent_id)."""
+        self._check_not_banned(user)
+        if parent_id is None:
+            post, siblings = self.post(post_id), None
+        else:
+            try:
+                parent_key = uuid.UUID(parent_id)
+            except ValueError:
+                raise StubError(400, f"Invalid comment id: {parent_id}") from None
+            with self.lock:
+                parent = self._comments.get(parent_key)
+            if parent is None:
+                raise StubError(404, "Parent comment not found")
+            post, siblings = parent[1], parent[0].replies
+        comment = CommentResponse.model_construct(id=uuid.uuid4(), text=text, author=user.email,
+                                                  createdAt=datetime.now(), replies=[])
+        with self.lock:
+            (post.comments if siblings is None else siblings).append(comment)
+            self._comments[comment.id] = (comment, post)
+        return comment
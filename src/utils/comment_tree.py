@@ -0,0 +1,349 @@
+import json
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from json.decoder import scanstring
+from json.scanner import NUMBER_RE
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from pydantic import BaseModel
+
+from src.models.api_model import CommentResponse, PostDataResponse
+from src.models.validation import ValidationMode, construct_trusted, fast_adapter, validate_python
+
+T = TypeVar('T', bound=BaseModel)
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_LITERALS = (("null", None), ("true", True), ("false", False))
+# Значение ещё не готово: открыт контейнер или ожидается следующий элемент.
+_PENDING = object()
+
+
+def _skip(text: str, index: int) -> int:
+    return _WHITESPACE.match(text, index).end()
+
+
+def _read_key(text: str, index: int) -> Tuple[str, int]:
+    """Прочитать ключ объекта и двоеточие после него; вернуть ключ и позицию значения."""
+    if text[index] != '"':
+        raise ValueError(f"Ожидался ключ объекта в позиции {index}")
+    key, index = scanstring(text, index + 1)
+    index = _skip(text, index)
+    if text[index] != ":":
+        raise ValueError(f"Ожидалось ':' в позиции {index}")
+    return key, _skip(text, index + 1)
+
+
+def _read_literal(text: str, index: int) -> Tuple[Any, int]:
+    """Прочитать null/true/false или число."""
+    for literal, literal_value in _LITERALS:
+        if text.startswith(literal, index):
+            return literal_value, index + len(literal)
+    match = NUMBER_RE.match(text, index)
+    if match is None:
+        raise ValueError(f"Неожиданный символ {text[index]!r} в позиции {index}")
+    integer, fraction, exponent = match.groups()
+    if fraction or exponent:
+        return float(integer + (fraction or "") + (exponent or "")), match.end()
+    return int(integer), match.end()
+
+
+def _start_value(text: str, index: int, stack: List[List[Any]]) -> Tuple[Any, int]:
+    """Прочитать значение в позиции index.
+
+    Непустой объект или массив кладётся на стек, и возвращается _PENDING с позицией его первого элемента.
+    """
+    char = text[index]
+    if char == "{" or char == "[":
+        closer = "}" if char == "{" else "]"
+        index = _skip(text, index + 1)
+        if text[index] == closer:
+            return ({} if char == "{" else []), index + 1
+        if char == "{":
+            key, index = _read_key(text, index)
+            stack.append([{}, key])
+        else:
+            stack.append([[], None])
+        return _PENDING, index
+    if char == '"':
+        return scanstring(text, index + 1)
+    return _read_literal(text, index)
+
+
+def _attach(text: str, index: int, value: Any, stack: List[List[Any]]) -> Tuple[Any, int]:
+    """Добавить готовое значение в контейнер на вершине стека, закрывая завершённые контейнеры.
+
+    Возвращает _PENDING с позицией следующего элемента или, когда стек опустел, разобранный документ.
+    """
+    while stack:
+        container, key = stack[-1]
+        if key is None:
+            container.append(value)
+        else:
+            container[key] = value
+        index = _skip(text, index)
+        if text[index] == ",":
+            index = _skip(text, index + 1)
+            if key is not None:
+                stack[-1][1], index = _read_key(text, index)
+            return _PENDING, index
+        closer = "]" if key is None else "}"
+        if text[index] != closer:
+            raise ValueError(f"Ожидалось ',' или '{closer}' в позиции {index}")
+        index += 1
+        value = stack.pop()[0]
+    return value, index
+
+
+def loads_iterative(text: str) -> Any:
+    """Разобрать JSON без рекурсии: глубина вложенности ограничена только памятью.
+
+    Медленнее json.loads, поэтому используется, только когда обычные парсеры упираются в лимит вложенности.
+    """
+    stack: List[List[Any]] = []
+    index = _skip(text, 0)
+    try:
+        while True:
+            value, index = _start_value(text, index, stack)
+            if value is _PENDING:
+                continue
+            value, index = _attach(text, index, value, stack)
+            if value is _PENDING:
+                continue
+            if _skip(text, index) != len(text):
+                raise ValueError(f"Лишние данные в позиции {index}")
+            return value
+    except IndexError:
+        raise ValueError("Неожиданный конец JSON") from None
+
+
+def loads_deep(content: bytes | str) -> Any:
+    """Разобрать JSON с произвольной вложенностью: json.loads, а при RecursionError — итеративный разбор."""
+    text = content.decode("utf-8") if isinstance(content, (bytes, bytearray)) else content
+    try:
+        return json.loads(text)
+    except RecursionError:
+        return loads_iterative(text)
+
+
+def _comment_validator(mode: ValidationMode):
+    if mode == ValidationMode.STRICT:
+        return CommentResponse.model_validate
+    if mode == ValidationMode.FAST:
+        return fast_adapter(CommentResponse).validate_python
+    return lambda data: construct_trusted(CommentResponse, data)
+
+
+def build_comment_models(raw_comments: Sequence[Mapping[str, Any]],
+                         mode: ValidationMode = ValidationMode.STRICT) -> List[CommentResponse]:
+    """Собрать дерево CommentResponse из распарсенного JSON без рекурсии.
+
+    Каждый комментарий валидируется отдельно с пустым replies, после чего ответы добавляются в его список,
+    поэтому глубина дерева не ограничена стеком. Сериализация такого дерева (model_dump, ==) по-прежнему
+    рекурсивна — для обхода используйте CommentTreeIndex.
+    """
+    validate = _comment_validator(mode)
+    roots: List[CommentResponse] = []
+    stack = [(raw, roots) for raw in reversed(raw_comments)]
+    while stack:
+        raw, siblings = stack.pop()
+        node = validate({**raw, "replies": []})
+        siblings.append(node)
+        stack.extend((child, node.replies) for child in reversed(raw.get("replies") or []))
+    return roots
+
+
+def load_deep_response(model: Type[T], content: bytes, mode: ValidationMode = ValidationMode.STRICT) -> T:
+    """Разобрать ответ GET /posts/{postId} с деревом комментариев любой глубины.
+
+    Вызывается из validate_response, когда парсер pydantic-core упирается в лимит вложенности.
+    """
+    data = loads_deep(content)
+    response_data = data.get("responseData") if isinstance(data, dict) else None
+    if not issubclass(model, PostDataResponse) or not isinstance(response_data, dict):
+        raise ValueError(f"Ответ для {model.__name__} превышает допустимую вложенность JSON")
+    raw_comments = response_data.get("comments") or []
+    response = validate_python(model, {**data, "responseData": {**response_data, "comments": []}}, mode)
+    response.responseData.comments.extend(build_comment_models(raw_comments, mode))
+    return response
+
+
+def dumps_comment_tree(comments: Iterable[CommentResponse]) -> str:
+    """Сериализовать дерево CommentResponse в JSON без рекурсии (model_dump_json падает на глубоких цепочках)."""
+    parts = ["["]
+    stack = [iter(comments)]
+    first = [True]
+    while stack:
+        comment = next(stack[-1], None)
+        if comment is None:
+            stack.pop()
+            first.pop()
+            parts.append("]}" if stack else "]")
+            continue
+        if not first[-1]:
+            parts.append(",")
+        first[-1] = False
+        head = comment.model_dump_json(exclude={"replies"})
+        parts.append(head[:-1] + ',"replies":[')
+        stack.append(iter(comment.replies))
+        first.append(True)
+    return "".join(parts)
+
+
+def count_comments(comments: Iterable[CommentResponse]) -> int:
+    """Количество комментариев в дереве вместе со всеми вложенными ответами (без рекурсии)."""
+    total = 0
+    stack = list(comments)
+    while stack:
+        comment = stack.pop()
+        total += 1
+        stack.extend(comment.replies)
+    return total
+
+
+@dataclass
+class FlatComment:
+    """Комментарий без вложенных ответов: ссылка на родителя и глубина (0 — комментарий к посту)."""
+
+    id: str
+    parent_id: Optional[str]
+    depth: int
+    text: str
+    author: str
+    created_at: Optional[datetime] = None
+
+
+@dataclass
+class CommentTreeIndex:
+    """Плоский индекс дерева комментариев: id → комментарий, родитель → дети (в порядке ответа), корни.
+
+    Все обходы итеративные, поэтому работают с цепочками ответов любой глубины.
+    """
+
+    nodes: Dict[str, FlatComment] = field(default_factory=dict)
+    children: Dict[Optional[str], List[str]] = field(default_factory=dict)
+    max_depth: int = -1
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def add(self, comment: FlatComment) -> None:
+        """Добавить комментарий в индекс. Повтор id — ошибка: в дереве он встречается один раз."""
+        if comment.id in self.nodes:
+            raise ValueError(f"Комментарий {comment.id} встречается в дереве дважды")
+        self.nodes[comment.id] = comment
+        self.children.setdefault(comment.parent_id, []).append(comment.id)
+        self.max_depth = max(self.max_depth, comment.depth)
+
+    @property
+    def roots(self) -> List[str]:
+        """Id комментариев верхнего уровня."""
+        return self.children.get(None, [])
+
+    @classmethod
+    def from_api(cls, comments: Iterable[CommentResponse]) -> "CommentTreeIndex":
+        """Построить индекс по дереву CommentResponse из ответа API (обход в прямом порядке)."""
+        index = cls()
+        stack: List[Tuple[CommentResponse, Optional[str], int]] = [
+            (comment, None, 0) for comment in reversed(list(comments))]
+        while stack:
+            comment, parent_id, depth = stack.pop()
+            comment_id = str(comment.id)
+            created_at = comment.createdAt if isinstance(comment.createdAt, datetime) else None
+            index.add(FlatComment(comment_id, parent_id, depth, comment.text, str(comment.author), created_at))
+            stack.extend((reply, comment_id, depth + 1) for reply in reversed(comment.replies))
+        return index
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]]) -> "CommentTreeIndex":
+        """Построить индекс по строкам SqlAlchemyClient.get_comment_tree (родитель идёт раньше потомков)."""
+        index = cls()
+        for row in rows:
+            parent_id = row["parent_id"]
+            index.add(FlatComment(str(row["id"]), str(parent_id) if parent_id is not None else None,
+                                  row["depth"], row["text"], row["author"], row.get("created_at")))
+        return index
+
+    def iter_subtree(self, comment_id: Optional[str] = None) -> Iterator[FlatComment]:
+        """Обойти поддерево комментария в прямом порядке (None — всё дерево), не включая сам comment_id."""
+        stack = list(reversed(self.children.get(comment_id, [])))
+        while stack:
+            current = stack.pop()
+            yield self.nodes[current]
+            stack.extend(reversed(self.children.get(current, [])))
+
+    def ancestors(self, comment_id: str) -> List[str]:
+        """Id предков комментария от родителя до комментария верхнего уровня."""
+        result = []
+        parent_id = self.nodes[comment_id].parent_id
+        while parent_id is not None:
+            result.append(parent_id)
+            parent_id = self.nodes[parent_id].parent_id
+        return result
+
+
+@dataclass
+class CommentTreeDiff:
+    """Расхождения между деревом комментариев из API и из базы."""
+
+    missing_in_api: List[str] = field(default_factory=list)
+    missing_in_db: List[str] = field(default_factory=list)
+    parent_mismatch: List[Tuple[str, Optional[str], Optional[str]]] = field(default_factory=list)
+    field_mismatch: List[Tuple[str, str, Any, Any]] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not (self.missing_in_api or self.missing_in_db or self.parent_mismatch or self.field_mismatch)
+
+    def summary(self, limit: int = 5) -> str:
+        """Краткое описание расхождений с первыми limit примерами каждого вида."""
+        parts = []
+        for name in ("missing_in_api", "missing_in_db", "parent_mismatch", "field_mismatch"):
+            items = getattr(self, name)
+            if items:
+                parts.append(f"{name}: {len(items)} {items[:limit]}")
+        return "; ".join(parts) or "деревья совпадают"
+
+
+def compare_comment_trees(api: CommentTreeIndex, db: CommentTreeIndex, partial: bool = False,
+                          fields: Sequence[str] = ("text", "author")) -> CommentTreeDiff:
+    """Сравнить деревья комментариев из API и из базы за O(n) по индексам.
+
+    partial=True — API вернул не все комментарии верхнего уровня (hasMoreComments): из базы ожидаются только
+    поддеревья корней, присутствующих в ответе API.
+    """
+    diff = CommentTreeDiff()
+    if partial:
+        expected = set()
+        for root in api.roots:
+            if root in db.nodes:
+                expected.add(root)
+                expected.update(comment.id for comment in db.iter_subtree(root))
+    else:
+        expected = set(db.nodes)
+    diff.missing_in_api = [comment_id for comment_id in db.nodes if comment_id in expected
+                           and comment_id not in api.nodes]
+    for comment_id, api_comment in api.nodes.items():
+        db_comment = db.nodes.get(comment_id)
+        if db_comment is None:
+            diff.missing_in_db.append(comment_id)
+            continue
+        if api_comment.parent_id != db_comment.parent_id:
+            diff.parent_mismatch.append((comment_id, api_comment.parent_id, db_comment.parent_id))
+        for name in fields:
+            api_value, db_value = getattr(api_comment, name), getattr(db_comment, name)
+            if api_value != db_value:
+                diff.field_mismatch.append((comment_id, name, api_value, db_value))
+    return diff
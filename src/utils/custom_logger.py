@@ -1,17 +1,138 @@
-import inspect
+import atexit
+import copy
+import json
 import logging
+import queue
+import random
+import sys
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
+
+from src.config.logging_config import LoggingConfig
+
+_configure_lock = threading.Lock()
+_configured = False
+_listener: Optional[QueueListener] = None
+
+
+class ContextFormatter(logging.Formatter):
+    """Текстовый формат logging.basicConfig с именем вызывающей функции в конце сообщения."""
+
+    def __init__(self) -> None:
+        super().__init__(logging.BASIC_FORMAT)
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        caller = getattr(record, "caller", None)
+        return f"{text} (called from {caller})" if caller else text
+
+
+class JsonFormatter(logging.Formatter):
+    """Структурированный формат: одна JSON-запись на строку с вызывающей функцией и контекстом."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        caller = getattr(record, "caller", None)
+        if caller:
+            payload["caller"] = caller
+        context = getattr(record, "context", None)
+        if context:
+            payload["context"] = context
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class _StructuredQueueHandler(QueueHandler):
+    """QueueHandler, который подставляет аргументы в сообщение, но оставляет трассировку исключения отдельно.
+
+    Стандартный prepare() склеивает трассировку с сообщением, и JSON-запись теряет поле exc.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+
+def configure_logging(force: bool = False) -> None:
+    """Один раз настроить корневой логгер по LoggingConfig.
+
+    Как и logging.basicConfig, обработчик добавляется, только если у корневого логгера их ещё нет
+    (или force=True). При LoggingConfig.QUEUE запись в поток вывода выполняет фоновый QueueListener.
+    """
+    global _configured, _listener
+    if _configured and not force:
+        return
+    with _configure_lock:
+        if _configured and not force:
+            return
+        root = logging.getLogger()
+        root.setLevel(LoggingConfig.LEVEL)
+        if force:
+            stop_logging()
+            for handler in list(root.handlers):
+                root.removeHandler(handler)
+        if not root.handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(JsonFormatter() if LoggingConfig.FORMAT == "json" else ContextFormatter())
+            if LoggingConfig.QUEUE:
+                _listener = QueueListener(queue.SimpleQueue(), handler, respect_handler_level=True)
+                _listener.start()
+                root.addHandler(_StructuredQueueHandler(_listener.queue))
+            else:
+                root.addHandler(handler)
+        _configured = True
+
+
+def stop_logging() -> None:
+    """Дописать записи из очереди и остановить фоновый поток логирования, если он запущен."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging)
 
 
 class CustomLogger:
     """Класс для логирования сообщений с указанием контекста вызова (имени вызывающей функции)."""
 
-    def __init__(self, name:str) -> None:
-        """Инициализация логгера с заданным именем."""
-        logging.basicConfig(level=logging.INFO)
+    def __init__(self, name: str, sample_rate: Optional[float] = None) -> None:
+        """Инициализация логгера с заданным именем.
+
+        sample_rate — доля записей уровня ниже WARNING, которые попадают в лог (по умолчанию LoggingConfig).
+        """
+        configure_logging()
         self.logger = logging.getLogger(name)
+        self.sample_rate = LoggingConfig.SAMPLE_RATE if sample_rate is None else sample_rate
+
+    def log_with_context(self, message: str, *args: Any, level: int = logging.INFO, **context: Any) -> None:
+        """Логирует сообщение с указанием имени функции, из которой был вызов.
 
-    def log_with_context(self, message: str) -> None:
-        """Логирует сообщение с указанием имени функции, из которой был вызов."""
-        stack = inspect.stack()
-        caller_function = stack[1].function
-        self.logger.info(f"{message} (called from {caller_function})")
+        args подставляются в message через %, только если запись действительно будет выведена; context
+        попадает в JSON-запись отдельным полем. Имя вызывающей функции берётся из кадра стека напрямую.
+        """
+        if not self.logger.isEnabledFor(level):
+            return
+        if level < logging.WARNING and self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return
+        caller = sys._getframe(1).f_code.co_name
+        self.logger.log(level, message, *args, extra={"caller": caller, "context": context or None})
@@ -0,0 +1,149 @@
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from src.utils.percentiles import percentile
+from src.utils.reporting import step_reporter
+
+METRICS = ("p50_ms", "p95_ms", "p99_ms")
+# Допустимый рост метрики относительно базовой линии: хвосты шумнее медианы.
+DEFAULT_TOLERANCES = {"p50_ms": 0.2, "p95_ms": 0.3, "p99_ms": 0.5}
+# Рост меньше этого порога (мс) не считается регрессией: на быстрых эндпоинтах проценты — это шум.
+DEFAULT_MIN_DELTA_MS = 1.0
+
+
+@dataclass
+class LatencyStats:
+    """Распределение задержки эндпоинта по замерам после прогрева, в миллисекундах."""
+
+    endpoint: str
+    iterations: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    max_ms: float
+
+    @classmethod
+    def from_samples(cls, endpoint: str, samples: List[float], errors: int = 0) -> "LatencyStats":
+        """Посчитать перцентили по замерам в секундах."""
+        ordered = sorted(samples)
+        count = len(ordered)
+        return cls(
+            endpoint=endpoint,
+            iterations=count,
+            errors=errors,
+            p50_ms=round(percentile(ordered, 50) * 1000, 3),
+            p95_ms=round(percentile(ordered, 95) * 1000, 3),
+            p99_ms=round(percentile(ordered, 99) * 1000, 3),
+            mean_ms=round(sum(ordered) / count * 1000, 3) if count else 0.0,
+            max_ms=round(ordered[-1] * 1000, 3) if count else 0.0,
+        )
+
+
+def measure_latency(endpoint: str, call: Callable[[], Any], iterations: int = 200,
+                    warmup: int = 20) -> LatencyStats:
+    """Вызвать call warmup раз без замера, затем iterations раз с замером.
+
+    call — вызов контроллера; ответ со status "error" считается ошибкой (его время тоже входит в выборку).
+    Шаги Allure на время замера отключаются, чтобы в задержку не попадало их форматирование.
+    """
+    samples: List[float] = []
+    errors = 0
+    with step_reporter.disabled():
+        for _ in range(warmup):
+            call()
+        for _ in range(iterations):
+            start = time.perf_counter()
+            response = call()
+            samples.append(time.perf_counter() - start)
+            if getattr(response, "status", "ok") != "ok":
+                errors += 1
+    return LatencyStats.from_samples(endpoint, samples, errors)
+
+
+@dataclass
+class Regression:
+    """Метрика эндпоинта вышла за допуск базовой линии."""
+
+    endpoint: str
+    metric: str
+    baseline_ms: float
+    actual_ms: float
+    limit_ms: float
+
+    def __str__(self) -> str:
+        growth = (self.actual_ms / self.baseline_ms - 1) * 100 if self.baseline_ms else float("inf")
+        return (f"{self.endpoint} {self.metric}: {self.actual_ms:.2f} ms при базовой линии "
+                f"{self.baseline_ms:.2f} ms (+{growth:.0f}%, допустимо до {self.limit_ms:.2f} ms)")
+
+
+@dataclass
+class LatencyBaseline:
+    """Базовая линия задержек по эндпоинтам с допусками, хранится в JSON-файле в репозитории.
+
+    tolerances — допустимый относительный рост по метрикам (переопределяется у эндпоинта ключом "tolerances"),
+    min_delta_ms — абсолютный порог, ниже которого рост не считается регрессией.
+    Эндпоинты без базовой линии не проверяются, пока она не записана (update).
+    """
+
+    tolerances: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_TOLERANCES))
+    min_delta_ms: float = DEFAULT_MIN_DELTA_MS
+    endpoints: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: str) -> "LatencyBaseline":
+        """Прочитать базовую линию; если файла нет — пустая базовая линия с допусками по умолчанию."""
+        if not os.path.exists(path):
+            return cls()
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(tolerances={**DEFAULT_TOLERANCES, **data.get("tolerances", {})},
+                   min_delta_ms=data.get("min_delta_ms", DEFAULT_MIN_DELTA_MS),
+                   endpoints=data.get("endpoints", {}))
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(asdict(self), f, ensure_ascii=False, indent=2, sort_keys=True)
+            f.write("\n")
+
+    def check(self, stats: LatencyStats) -> List[Regression]:
+        """Регрессии эндпоинта относительно базовой линии (пустой список — в пределах допусков)."""
+        baseline = self.endpoints.get(stats.endpoint)
+        if baseline is None:
+            return []
+        tolerances = {**self.tolerances, **baseline.get("tolerances", {})}
+        regressions = []
+        for metric in METRICS:
+            expected = baseline.get(metric)
+            if expected is None:
+                continue
+            limit = max(expected * (1 + tolerances[metric]), expected + self.min_delta_ms)
+            actual = getattr(stats, metric)
+            if actual > limit:
+                regressions.append(Regression(stats.endpoint, metric, expected, actual, round(limit, 3)))
+        return regressions
+
+    def update(self, stats: LatencyStats) -> None:
+        """Записать замер эндпоинта как новую базовую линию, сохранив его собственные допуски."""
+        entry = {metric: getattr(stats, metric) for metric in METRICS}
+        tolerances = self.endpoints.get(stats.endpoint, {}).get("tolerances")
+        if tolerances:
+            entry["tolerances"] = tolerances
+        self.endpoints[stats.endpoint] = entry
+
+
+def format_table(results: List[LatencyStats], baseline: Optional[LatencyBaseline] = None) -> str:
+    """Текстовая таблица замеров с p95 базовой линии."""
+    header = (f"{'endpoint':<52}{'n':>6}{'err':>5}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+              f"{'max ms':>9}{'base p95':>10}")
+    lines = [header, "-" * len(header)]
+    for r in results:
+        base = (baseline.endpoints.get(r.endpoint) or {}).get("p95_ms") if baseline else None
+        base_text = f"{base:.2f}" if base is not None else "-"
+        lines.append(f"{r.endpoint:<52}{r.iterations:>6}{r.errors:>5}{r.p50_ms:>9.2f}{r.p95_ms:>9.2f}"
+                     f"{r.p99_ms:>9.2f}{r.max_ms:>9.2f}{base_text:>10}")
+    return "\n".join(lines)
@@ -0,0 +1,133 @@
+import asyncio
+import queue
+import threading
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional, TypeVar
+
+from src.models.api_model import ApiResponse
+from src.utils.reporting import step_reporter
+
+P = TypeVar('P', bound=ApiResponse)
+
+_DONE = object()
+
+
+def _is_last_page(response: ApiResponse, page: int, max_pages: Optional[int], fetched: int) -> bool:
+    """Страница последняя, если ответ ошибочный или пустой, достигнут totalPages или лимит max_pages.
+
+    totalPages берётся из каждой полученной страницы: лента может расти, пока по ней идёт обход.
+    """
+    data = response.responseData
+    if response.status != "ok" or data is None or not data.content:
+        return True
+    if max_pages is not None and fetched >= max_pages:
+        return True
+    return page + 1 >= data.totalPages
+
+
+def _pages_in_caller(fetch_page: Callable[[int], P], start_page: int, max_pages: Optional[int]) -> Iterator[P]:
+    """Загрузка страниц по одной в вызывающем потоке (iter_pages с prefetch=0)."""
+    page, fetched = start_page, 0
+    while True:
+        response = fetch_page(page)
+        fetched += 1
+        yield response
+        if _is_last_page(response, page, max_pages, fetched):
+            return
+        page += 1
+
+
+def _put(pages: queue.Queue, stop: threading.Event, item: Any) -> bool:
+    """Положить элемент в очередь, пока обход не остановлен; False — обход остановлен."""
+    while not stop.is_set():
+        try:
+            pages.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _prefetch_worker(pages: queue.Queue, stop: threading.Event, fetch_page: Callable[[int], Any],
+                     start_page: int, max_pages: Optional[int]) -> None:
+    """Тело фонового потока iter_pages: шаги Allure в нём не пишутся — стек шагов принадлежит потоку теста."""
+    page, fetched = start_page, 0
+    try:
+        with step_reporter.suppressed():
+            while not stop.is_set():
+                response = fetch_page(page)
+                fetched += 1
+                if not _put(pages, stop, response) or _is_last_page(response, page, max_pages, fetched):
+                    break
+                page += 1
+    except BaseException as e:
+        _put(pages, stop, e)
+    _put(pages, stop, _DONE)
+
+
+def iter_pages(fetch_page: Callable[[int], P], start_page: int = 0, prefetch: int = 1,
+               max_pages: Optional[int] = None) -> Iterator[P]:
+    """Лениво обойти постраничный эндпоинт, загружая следующие страницы в фоновом потоке.
+
+    fetch_page(page) возвращает ответ с responseData.content/totalPages (например, PostsResponse).
+    Фоновый поток держит не больше prefetch готовых страниц, поэтому в памяти одновременно не больше
+    prefetch + 2 страниц. prefetch=0 — загрузка страниц по одной в вызывающем потоке.
+    fetch_page вызывается из фонового потока, поэтому не должен делить с вызывающим кодом
+    непотокобезопасное состояние (например, requests.Session — см. BaseClient.clone).
+    Ошибочный ответ отдаётся последним, чтобы вызывающий код мог проверить его status и error.
+    """
+    if prefetch <= 0:
+        yield from _pages_in_caller(fetch_page, start_page, max_pages)
+        return
+
+    pages: queue.Queue = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+    thread = threading.Thread(target=_prefetch_worker, name="page-prefetch", daemon=True,
+                              args=(pages, stop, fetch_page, start_page, max_pages))
+    thread.start()
+    try:
+        while True:
+            item = pages.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+async def aiter_pages(fetch_page: Callable[[int], Awaitable[P]], start_page: int = 0, prefetch: int = 1,
+                      max_pages: Optional[int] = None) -> AsyncIterator[P]:
+    """Асинхронный вариант iter_pages: следующие страницы загружает фоновая задача asyncio."""
+    pages: asyncio.Queue = asyncio.Queue(maxsize=max(prefetch, 1))
+
+    async def worker() -> None:
+        page, fetched = start_page, 0
+        try:
+            while True:
+                response = await fetch_page(page)
+                fetched += 1
+                await pages.put(response)
+                if _is_last_page(response, page, max_pages, fetched):
+                    break
+                page += 1
+        except Exception as e:
+            await pages.put(e)
+        await pages.put(_DONE)
+
+    task = asyncio.create_task(worker())
+    try:
+        while True:
+            item = await pages.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
@@ -0,0 +1,168 @@
+import os
+import random
+import re
+import string
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, Generic, List, Optional, Sequence, Type, TypeVar
+
+from pydantic import BaseModel
+
+from src.config.payload_config import PayloadConfig
+from src.models.api_model import NewCommentRequest, PublishRequest, RegistrationRequest
+from src.models.validation import ValidationMode, validate_python
+
+T = TypeVar('T', bound=BaseModel)
+
+_SPECIAL = "!@#$%^&*_-+="
+_PASSWORD_ALPHABET = string.ascii_letters + string.digits + _SPECIAL
+_DIGITS36 = string.digits + string.ascii_lowercase
+
+
+def _base36(number: int) -> str:
+    digits = []
+    while True:
+        number, remainder = divmod(number, 36)
+        digits.append(_DIGITS36[remainder])
+        if not number:
+            return "".join(reversed(digits))
+
+
+@lru_cache(maxsize=None)
+def _vocabulary() -> Sequence[str]:
+    """Словарь для текстов и имён — слова lorem из Faker (faker импортируется только здесь, один раз)."""
+    from faker.providers.lorem.en_US import Provider
+
+    return tuple(word for word in Provider.word_list if word.isalpha())
+
+
+@lru_cache(maxsize=None)
+def default_namespace() -> str:
+    """Метка данных процесса: id воркера pytest-xdist (или main) и PayloadConfig.RUN_ID (по умолчанию время старта).
+
+    Входит в каждый email и username, поэтому воркеры и прогоны не конфликтуют по уникальным
+    users.email и users.username.
+    """
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    run_id = PayloadConfig.RUN_ID or _base36(int(time.time() * 1000))
+    return re.sub(r"[^a-z0-9-]", "", f"{worker}-{run_id}".lower())
+
+
+class _Stream(Generic[T]):
+    """Массив заранее сгенерированных объектов одного вида и курсор выдачи.
+
+    Исчерпанный массив заменяется следующей порцией build(номер порции); выданные элементы не переиспользуются.
+    """
+
+    def __init__(self, build: Callable[[int], List[T]]) -> None:
+        self._build = build
+        self._items: List[Optional[T]] = []
+        self._position = 0
+        self._chunk = 0
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        if self._position == len(self._items):
+            self._items = self._build(self._chunk)
+            self._chunk += 1
+            self._position = 0
+
+    def prefill(self) -> None:
+        with self._lock:
+            self._refill()
+
+    def next(self) -> T:
+        with self._lock:
+            self._refill()
+            item = self._items[self._position]
+            self._items[self._position] = None
+            self._position += 1
+        return item
+
+
+class PayloadPool:
+    """Пулы готовых RegistrationRequest, PublishRequest и NewCommentRequest для тестов и генератора нагрузки.
+
+    Данные генерируются порциями по chunk_size из random.Random с seed, зависящим от seed пула, вида данных и
+    номера порции, поэтому при одинаковых seed и namespace последовательность воспроизводится. Email и username
+    содержат namespace и порядковый номер и уникальны без обращений к базе. Пароли строятся сразу
+    удовлетворяющими validate_password_complexity. Порция целиком валидируется моделью в режиме validation_mode
+    (fast по умолчанию: email в генерируемом формате заведомо корректен), после чего объект выдаётся за одно
+    обращение к массиву.
+    """
+
+    def __init__(self, seed: Optional[int] = None, namespace: Optional[str] = None,
+                 chunk_size: Optional[int] = None, validation_mode: Optional[str] = None) -> None:
+        self.seed = PayloadConfig.SEED if seed is None else seed
+        self.namespace = default_namespace() if namespace is None else namespace
+        self.chunk_size = chunk_size or PayloadConfig.CHUNK_SIZE
+        self.validation_mode = ValidationMode(validation_mode or PayloadConfig.VALIDATION_MODE)
+        self._words = _vocabulary()
+        self._registrations: _Stream[RegistrationRequest] = _Stream(self._build_registrations)
+        self._posts: _Stream[PublishRequest] = _Stream(self._build_posts)
+        self._comments: _Stream[NewCommentRequest] = _Stream(self._build_comments)
+
+    def warmup(self) -> "PayloadPool":
+        """Сгенерировать первые порции всех видов заранее, чтобы генерация не попала в замеры."""
+        for stream in (self._registrations, self._posts, self._comments):
+            stream.prefill()
+        return self
+
+    def registration(self) -> RegistrationRequest:
+        """Следующий запрос регистрации с уникальными email и username."""
+        return self._registrations.next()
+
+    def publish(self) -> PublishRequest:
+        """Следующий запрос публикации поста."""
+        return self._posts.next()
+
+    def comment(self) -> NewCommentRequest:
+        """Следующий запрос комментария."""
+        return self._comments.next()
+
+    def _rng(self, kind: str, chunk: int) -> random.Random:
+        return random.Random(f"{self.seed}:{kind}:{chunk}")
+
+    def _text(self, rng: random.Random, low: int, high: int) -> str:
+        words = rng.choices(self._words, k=rng.randint(low, high))
+        return " ".join(words).capitalize() + "."
+
+    @staticmethod
+    def _password(rng: random.Random) -> str:
+        chars = [rng.choice(string.ascii_uppercase), rng.choice(string.ascii_lowercase),
+                 rng.choice(string.digits), rng.choice(_SPECIAL)] + rng.choices(_PASSWORD_ALPHABET, k=8)
+        rng.shuffle(chars)
+        return "".join(chars)
+
+    def _validate(self, model: Type[T], items: List[Dict[str, Any]]) -> List[T]:
+        if self.validation_mode == ValidationMode.TRUSTED:
+            return [model.model_construct(**item) for item in items]
+        return [validate_python(model, item, self.validation_mode) for item in items]
+
+    def _build_registrations(self, chunk: int) -> List[RegistrationRequest]:
+        rng = self._rng("registration", chunk)
+        items = []
+        for index in range(chunk * self.chunk_size, (chunk + 1) * self.chunk_size):
+            first, last = rng.choice(self._words), rng.choice(self._words)
+            number = _base36(index)
+            password = self._password(rng)
+            items.append({"email": f"{first}.{last}.{self.namespace}.{number}@example.com",
+                          "username": f"{first}_{last}_{self.namespace}_{number}",
+                          "password": password, "passwordConfirmation": password})
+        return self._validate(RegistrationRequest, items)
+
+    def _build_posts(self, chunk: int) -> List[PublishRequest]:
+        rng = self._rng("post", chunk)
+        return self._validate(PublishRequest, [{"title": self._text(rng, 2, 8), "content": self._text(rng, 10, 40)}
+                                               for _ in range(self.chunk_size)])
+
+    def _build_comments(self, chunk: int) -> List[NewCommentRequest]:
+        rng = self._rng("comment", chunk)
+        return self._validate(NewCommentRequest, [{"text": self._text(rng, 3, 20)} for _ in range(self.chunk_size)])
+
+
+@lru_cache(maxsize=None)
+def payload_pool() -> PayloadPool:
+    """Общий пул процесса с настройками из PayloadConfig."""
+    return PayloadPool()
@@ -0,0 +1,14 @@
+import math
+from typing import Sequence
+
+
+def percentile(sorted_samples: Sequence[float], q: float) -> float:
+    """Вычислить перцентиль q (0..100) по отсортированной выборке с линейной интерполяцией."""
+    if not sorted_samples:
+        return 0.0
+    rank = (len(sorted_samples) - 1) * q / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return sorted_samples[lower]
+    return sorted_samples[lower] + (sorted_samples[upper] - sorted_samples[lower]) * (rank - lower)
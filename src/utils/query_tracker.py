@@ -0,0 +1,253 @@
+import json
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+from src.config.db_config import DataBaseConfig
+
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\$\d+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_VALUES_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(statement: str) -> str:
+    """Привести SQL к шаблону: параметры и литералы — ?, списки IN (...) — (?...), пробелы схлопнуты.
+
+    Запросы, отличающиеся только значениями, получают одинаковый шаблон — по нему считаются повторы (N+1).
+    """
+    statement = _PLACEHOLDER.sub("?", statement)
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    statement = _VALUES_LIST.sub("(?...)", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+@dataclass
+class QueryRecord:
+    """Один запрос к базе, выполненный через движок SQLAlchemy.
+
+    statement — нормализованный SQL, param_sets — количество наборов параметров (больше 1 у executemany:
+    у psycopg2 это отдельный обмен с сервером на каждый набор), rowcount — затронутые строки (-1, если драйвер
+    не сообщает). phase — фаза теста: setup:<фикстура>, call или teardown. Время в секундах.
+    """
+
+    seq: int
+    statement: str
+    duration: float
+    param_sets: int
+    rowcount: int
+    started_at: float
+    test: Optional[str] = None
+    phase: Optional[str] = None
+
+
+@dataclass
+class RepeatedQuery:
+    """Признак N+1: один шаблон запроса выполнен много раз в одной фазе теста."""
+
+    statement: str
+    test: Optional[str]
+    phase: Optional[str]
+    executions: int
+    total_ms: float
+
+    def __str__(self) -> str:
+        return f"{self.executions}× за {self.total_ms:.1f} ms [{self.phase}]: {self.statement[:200]}"
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Блок кода выполнил больше запросов (или потратил больше времени в базе), чем разрешено бюджетом."""
+
+
+class QueryWindow:
+    """Запросы, выполненные внутри блока query_tracker.budget(...)."""
+
+    def __init__(self, tracker: "QueryTracker", start_seq: int) -> None:
+        self._tracker = tracker
+        self._start_seq = start_seq
+        self._end_seq: Optional[int] = None
+
+    def records(self) -> List["QueryRecord"]:
+        end = self._tracker.last_seq if self._end_seq is None else self._end_seq
+        return [r for r in self._tracker.records() if self._start_seq < r.seq <= end]
+
+    @property
+    def count(self) -> int:
+        return sum(r.param_sets for r in self.records())
+
+    @property
+    def total_ms(self) -> float:
+        return sum(r.duration for r in self.records()) * 1000
+
+
+class QueryTracker:
+    """Потокобезопасный учёт запросов к базе через события движка SQLAlchemy.
+
+    Устроен как timing_collector для HTTP: записи помечаются текущим тестом и фазой, хранится не больше
+    max_records последних. Движок подключается через instrument(engine). Порог N+1 по умолчанию —
+    DataBaseConfig.N_PLUS_ONE_THRESHOLD.
+    """
+
+    def __init__(self, max_records: int = 100_000, n_plus_one_threshold: Optional[int] = None) -> None:
+        self._records: Deque[QueryRecord] = deque(maxlen=max_records)
+        self._lock = threading.Lock()
+        self._seq = 0
+        self.enabled = True
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.current_test: Optional[str] = None
+        self.current_phase: Optional[str] = None
+
+    @property
+    def last_seq(self) -> int:
+        return self._seq
+
+    def instrument(self, engine) -> None:
+        """Подписаться на before/after_cursor_execute движка (повторный вызов для того же движка ничего не делает)."""
+        from sqlalchemy import event
+
+        if event.contains(engine, "after_cursor_execute", self._after_cursor_execute):
+            return
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    @staticmethod
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        if context is not None:
+            context._query_tracker_start = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        start = getattr(context, "_query_tracker_start", None)
+        if start is None or not self.enabled:
+            return
+        self.add(statement, time.perf_counter() - start, len(parameters) if executemany and parameters else 1,
+                 getattr(cursor, "rowcount", -1))
+
+    def add(self, statement: str, duration: float, param_sets: int = 1, rowcount: int = -1) -> QueryRecord:
+        """Зафиксировать выполненный запрос."""
+        normalized = normalize_sql(statement)
+        with self._lock:
+            self._seq += 1
+            record = QueryRecord(seq=self._seq, statement=normalized, duration=duration, param_sets=param_sets,
+                                 rowcount=rowcount, started_at=time.time() - duration, test=self.current_test,
+                                 phase=self.current_phase)
+            self._records.append(record)
+        return record
+
+    def records(self, test: Optional[str] = None, phase: Optional[str] = None) -> List[QueryRecord]:
+        """Выбрать запросы по тесту и фазе (phase="setup" — все фикстуры подготовки)."""
+        with self._lock:
+            records = list(self._records)
+        return [
+            r for r in records
+            if (test is None or r.test == test)
+            and (phase is None or r.phase == phase or (r.phase or "").startswith(f"{phase}:"))
+        ]
+
+    def clear(self) -> None:
+        """Удалить все накопленные записи."""
+        with self._lock:
+            self._records.clear()
+
+    @staticmethod
+    def summary(records: List[QueryRecord]) -> Dict[str, Dict[str, Any]]:
+        """Сводка по шаблонам запросов: количество выполнений, суммарное, среднее и максимальное время (мс), строки."""
+        groups: Dict[str, List[QueryRecord]] = {}
+        for record in records:
+            groups.setdefault(record.statement, []).append(record)
+
+        result = {}
+        for statement, items in sorted(groups.items(), key=lambda item: -sum(r.duration for r in item[1])):
+            executions = sum(r.param_sets for r in items)
+            total = sum(r.duration for r in items)
+            result[statement] = {
+                "executions": executions,
+                "total_ms": total * 1000,
+                "mean_ms": total / executions * 1000,
+                "max_ms": max(r.duration for r in items) * 1000,
+                "rows": sum(r.rowcount for r in items if r.rowcount >= 0),
+            }
+        return result
+
+    @staticmethod
+    def by_phase(records: List[QueryRecord]) -> Dict[str, Dict[str, float]]:
+        """Количество запросов и время в базе (мс) по фазам теста и фикстурам."""
+        result: Dict[str, Dict[str, float]] = {}
+        for record in records:
+            phase = result.setdefault(record.phase or "-", {"queries": 0, "total_ms": 0.0})
+            phase["queries"] += record.param_sets
+            phase["total_ms"] += record.duration * 1000
+        return result
+
+    def detect_n_plus_one(self, records: List[QueryRecord],
+                          threshold: Optional[int] = None) -> List[RepeatedQuery]:
+        """Шаблоны запросов, выполненные threshold и более раз в одной фазе одного теста.
+
+        Сюда попадают и циклы по строкам из Python (запрос на каждую строку), и executemany с построчными
+        DELETE/UPDATE, которые psycopg2 отправляет отдельными обменами.
+        """
+        threshold = threshold or self.n_plus_one_threshold or DataBaseConfig.N_PLUS_ONE_THRESHOLD
+        groups: Dict[tuple, List[QueryRecord]] = {}
+        for record in records:
+            groups.setdefault((record.test, record.phase, record.statement), []).append(record)
+        repeated = []
+        for (test, phase, statement), items in groups.items():
+            executions = sum(r.param_sets for r in items)
+            if executions >= threshold:
+                repeated.append(RepeatedQuery(statement, test, phase, executions,
+                                              round(sum(r.duration for r in items) * 1000, 3)))
+        return sorted(repeated, key=lambda r: -r.executions)
+
+    @contextmanager
+    def budget(self, max_queries: Optional[int] = None, max_time_ms: Optional[float] = None,
+               max_repeats: Optional[int] = None, label: str = "блок") -> Iterator[QueryWindow]:
+        """Проверить, что код внутри блока уложился в бюджет запросов к базе.
+
+        max_queries — всего запросов (наборов параметров executemany), max_time_ms — суммарное время в базе,
+        max_repeats — сколько раз допустим один шаблон запроса (1 запрещает любые повторы). Если блок завершился
+        исключением, бюджет не проверяется. Превышение — QueryBudgetExceeded со списком самых частых запросов.
+        """
+        window = QueryWindow(self, self.last_seq)
+        yield window
+        window._end_seq = self.last_seq
+        records = window.records()
+        problems = []
+        if max_queries is not None and window.count > max_queries:
+            problems.append(f"запросов {window.count}, допустимо {max_queries}")
+        if max_time_ms is not None and window.total_ms > max_time_ms:
+            problems.append(f"время в базе {window.total_ms:.1f} ms, допустимо {max_time_ms} ms")
+        if max_repeats is not None:
+            problems.extend(f"повтор запроса: {r}" for r in self.detect_n_plus_one(records, max_repeats + 1))
+        if problems:
+            top = "\n".join(f"  {stats['executions']}× {stats['total_ms']:.1f} ms: {statement[:200]}"
+                            for statement, stats in list(self.summary(records).items())[:10])
+            raise QueryBudgetExceeded(f"Бюджет запросов к базе превышен ({label}): " + "; ".join(problems)
+                                      + f"\n{top}")
+
+    def to_json(self, records: Optional[List[QueryRecord]] = None) -> str:
+        """Сериализовать запросы, сводку по фазам и шаблонам и найденные повторы (N+1) в JSON."""
+        records = self.records() if records is None else records
+        return json.dumps(
+            {"queries": sum(r.param_sets for r in records),
+             "total_ms": sum(r.duration for r in records) * 1000,
+             "phases": self.by_phase(records),
+             "n_plus_one": [asdict(r) for r in self.detect_n_plus_one(records)],
+             "statements": self.summary(records),
+             "records": [asdict(r) for r in records]},
+            ensure_ascii=False, indent=2)
+
+    def write_summary(self, path: str) -> None:
+        """Сохранить сводку по шаблонам запросов и повторы (N+1) по тестам в JSON-файл."""
+        records = self.records()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"statements": self.summary(records),
+                       "n_plus_one": [asdict(r) for r in self.detect_n_plus_one(records)]},
+                      f, ensure_ascii=False, indent=2)
+
+
+query_tracker = QueryTracker()
@@ -0,0 +1,164 @@
+import functools
+import inspect
+import itertools
+import reprlib
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, ContextManager, Dict, Iterator, Tuple, TypeVar
+
+import allure
+from allure_commons import plugin_manager
+from pydantic import BaseModel
+
+from src.config.reporting_config import ReportingConfig
+
+try:
+    from allure_commons._allure import StepContext as _StepContext
+except ImportError:
+    _StepContext = None
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+def allure_step(title: str, params: Dict[str, str]) -> ContextManager[Any]:
+    """Шаг Allure с параметрами — единственное место, где используется приватный StepContext allure-pytest.
+
+    Публичный allure.step(title) не принимает параметры шага; если StepContext пропадёт из allure_commons,
+    шаги пишутся через allure.step без параметров.
+    """
+    if _StepContext is None:
+        return allure.step(title)
+    return _StepContext(title, params)
+
+
+class _ShortRepr(reprlib.Repr):
+    """reprlib с ограничением длины строк и поддержкой моделей Pydantic.
+
+    Модель выводится по полям с теми же ограничениями, без полного repr вложенных объектов.
+    """
+
+    def __init__(self, max_length: int) -> None:
+        super().__init__()
+        self.maxstring = max_length
+        self.maxother = max_length
+        self.maxlist = self.maxtuple = self.maxset = self.maxdict = 10
+        self.maxlevel = 3
+
+    def repr_instance(self, obj: Any, level: int) -> str:
+        if isinstance(obj, BaseModel):
+            if level <= 0:
+                return f"{type(obj).__name__}(...)"
+            fields = []
+            for name in list(type(obj).model_fields)[:self.maxdict]:
+                fields.append(f"{name}={self.repr1(getattr(obj, name, None), level - 1)}")
+            return f"{type(obj).__name__}({', '.join(fields)})"
+        return super().repr_instance(obj, level)
+
+
+class StepReporter:
+    """Ленивые шаги Allure для контроллеров и клиентов.
+
+    Заголовок и параметры шага форматируются только если шаг действительно будет записан: шаги включены,
+    вызов попал в выборку и в процессе зарегистрирован слушатель Allure (pytest с --alluredir). Значения
+    аргументов сокращаются до max_length. Выборка делается по вызовам верхнего уровня: если вызов
+    контроллера не записан, не записываются и его вложенные шаги (BaseClient).
+    """
+
+    def __init__(self, enabled: bool = ReportingConfig.STEPS_ENABLED,
+                 sample_every: int = ReportingConfig.STEP_SAMPLE_EVERY,
+                 max_length: int = ReportingConfig.STEP_MAX_LENGTH) -> None:
+        self.enabled = enabled
+        self.sample_every = max(sample_every, 1)
+        self.max_length = max_length
+        self._counter = itertools.count()
+        self._local = threading.local()
+
+    @property
+    def max_length(self) -> int:
+        return self._repr.maxstring
+
+    @max_length.setter
+    def max_length(self, value: int) -> None:
+        self._repr = _ShortRepr(value)
+
+    @contextmanager
+    def disabled(self) -> Iterator[None]:
+        """Временно отключить шаги (например, на время нагрузочного прогона)."""
+        previous, self.enabled = self.enabled, False
+        try:
+            yield
+        finally:
+            self.enabled = previous
+
+    @contextmanager
+    def suppressed(self) -> Iterator[None]:
+        """Не записывать шаги в текущем потоке (фоновые потоки, у которых нет своего шага теста)."""
+        local = self._local
+        previous, local.suppressed = getattr(local, "suppressed", False), True
+        try:
+            yield
+        finally:
+            local.suppressed = previous
+
+    def represent(self, value: Any) -> str:
+        """Короткое представление значения для заголовка и параметров шага."""
+        text = self._repr.repr(value)
+        if len(text) > self.max_length:
+            text = text[:self.max_length - 3] + "..."
+        return text
+
+    def _should_record(self) -> bool:
+        if not plugin_manager.hook.start_step.get_hookimpls():
+            return False
+        return self.sample_every == 1 or next(self._counter) % self.sample_every == 0
+
+    def _render(self, title: str, signature: inspect.Signature, args: Tuple[Any, ...],
+                kwargs: Dict[str, Any]) -> Tuple[str, Dict[str, str]]:
+        try:
+            bound = signature.bind(*args, **kwargs)
+        except TypeError:
+            return title, {}
+        bound.apply_defaults()
+        params = {name: self.represent(value) for name, value in bound.arguments.items()
+                  if name not in ("self", "cls")}
+        try:
+            rendered = title.format(**params)
+        except (KeyError, IndexError):
+            rendered = title
+        if len(rendered) > self.max_length:
+            rendered = rendered[:self.max_length - 3] + "..."
+        return rendered, params
+
+    def step(self, title: str) -> Callable[[F], F]:
+        """Декоратор шага Allure с заголовком вида "Получение поста {post_id}" (аналог allure.step)."""
+        def decorator(func: F) -> F:
+            signature = inspect.signature(func)
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                local = self._local
+                if not self.enabled or getattr(local, "suppressed", False):
+                    return func(*args, **kwargs)
+                depth = getattr(local, "depth", 0)
+                if depth == 0:
+                    local.record = self._should_record()
+                local.depth = depth + 1
+                try:
+                    if not local.record:
+                        return func(*args, **kwargs)
+                    rendered, params = self._render(title, signature, args, kwargs)
+                    with allure_step(rendered, params):
+                        return func(*args, **kwargs)
+                finally:
+                    local.depth = depth
+
+            return wrapper
+        return decorator
+
+
+step_reporter = StepReporter()
+
+
+def step(title: str) -> Callable[[F], F]:
+    """Шаг Allure с ленивым форматированием через глобальный step_reporter."""
+    return step_reporter.step(title)
@@ -0,0 +1,139 @@
+import json
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Deque, Dict, List, Optional
+
+from src.utils.percentiles import percentile
+
+_DYNAMIC_SEGMENT = re.compile(
+    r"/(?:[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|\d+|[^/@]+@[^/]+)(?=/|$)")
+
+
+def path_template(path: str) -> str:
+    """Заменить динамические сегменты пути (UUID, числовые id, email) на {id} для группировки."""
+    return _DYNAMIC_SEGMENT.sub("/{id}", path)
+
+
+@dataclass
+class RequestTiming:
+    """Замеры одного HTTP-запроса.
+
+    total — полное время запроса, ttfb — до получения заголовков ответа, body_read — чтение тела,
+    parse — валидация ответа моделью Pydantic (если запрос шёл через *_parse_request), validation — её режим.
+    Время в секундах. bytes_out — длина тела запроса, decoded_bytes_in — длина тела ответа после распаковки
+    Content-Encoding (не размер на проводе: заголовки и сжатие не учитываются).
+    """
+
+    method: str
+    path: str
+    status_code: int
+    started_at: float
+    total: float
+    ttfb: float
+    body_read: float
+    bytes_out: int
+    decoded_bytes_in: int
+    parse: Optional[float] = None
+    model: Optional[str] = None
+    validation: Optional[str] = None
+    test: Optional[str] = None
+
+    @property
+    def endpoint(self) -> str:
+        """Метод и шаблон пути, например "GET /api/v1/posts/{id}"."""
+        return f"{self.method} {path_template(self.path)}"
+
+
+class TimingCollector:
+    """Потокобезопасное хранилище замеров запросов в памяти с выборкой и сводкой по эндпоинтам.
+
+    Хранит не больше max_records последних записей, чтобы долгие нагрузочные прогоны не росли по памяти.
+    """
+
+    def __init__(self, max_records: int = 100_000) -> None:
+        self._records: Deque[RequestTiming] = deque(maxlen=max_records)
+        self._lock = threading.Lock()
+        self.enabled = True
+        self.current_test: Optional[str] = None
+
+    def add(self, method: str, path: str, status_code: int, start: float, headers_at: float,
+            body_at: float, bytes_out: int, decoded_bytes_in: int) -> Optional[RequestTiming]:
+        """Зафиксировать запрос по отметкам perf_counter: старт, получение заголовков, конец чтения тела."""
+        if not self.enabled:
+            return None
+        record = RequestTiming(
+            method=method,
+            path=path,
+            status_code=status_code,
+            started_at=time.time() - (body_at - start),
+            total=body_at - start,
+            ttfb=headers_at - start,
+            body_read=body_at - headers_at,
+            bytes_out=bytes_out,
+            decoded_bytes_in=decoded_bytes_in,
+            test=self.current_test,
+        )
+        with self._lock:
+            self._records.append(record)
+        return record
+
+    def records(self, method: Optional[str] = None, path: Optional[str] = None, test: Optional[str] = None,
+                min_total: Optional[float] = None) -> List[RequestTiming]:
+        """Выбрать замеры по методу, пути (точному или шаблону с {id}), тесту и минимальному времени."""
+        with self._lock:
+            records = list(self._records)
+        return [
+            r for r in records
+            if (method is None or r.method == method)
+            and (path is None or path in (r.path, path_template(r.path)))
+            and (test is None or r.test == test)
+            and (min_total is None or r.total >= min_total)
+        ]
+
+    def clear(self) -> None:
+        """Удалить все накопленные замеры."""
+        with self._lock:
+            self._records.clear()
+
+    @staticmethod
+    def summary(records: List[RequestTiming]) -> Dict[str, Dict[str, Any]]:
+        """Сводка по эндпоинтам: количество, перцентили total и средние доли сервера, сети и парсинга (мс)."""
+        groups: Dict[str, List[RequestTiming]] = {}
+        for record in records:
+            groups.setdefault(record.endpoint, []).append(record)
+
+        result = {}
+        for endpoint, items in groups.items():
+            totals = sorted(r.total for r in items)
+            parses = [r.parse for r in items if r.parse is not None]
+            count = len(items)
+            result[endpoint] = {
+                "count": count,
+                "total_p50_ms": percentile(totals, 50) * 1000,
+                "total_p95_ms": percentile(totals, 95) * 1000,
+                "total_max_ms": totals[-1] * 1000,
+                "ttfb_mean_ms": sum(r.ttfb for r in items) / count * 1000,
+                "body_read_mean_ms": sum(r.body_read for r in items) / count * 1000,
+                "parse_mean_ms": sum(parses) / len(parses) * 1000 if parses else None,
+                "bytes_out": sum(r.bytes_out for r in items),
+                "decoded_bytes_in": sum(r.decoded_bytes_in for r in items),
+            }
+        return result
+
+    def to_json(self, records: Optional[List[RequestTiming]] = None) -> str:
+        """Сериализовать замеры и сводку по ним в JSON."""
+        records = self.records() if records is None else records
+        return json.dumps(
+            {"summary": self.summary(records), "records": [asdict(r) for r in records]},
+            ensure_ascii=False, indent=2)
+
+    def write_summary(self, path: str) -> None:
+        """Сохранить сводку по всем накопленным замерам в JSON-файл."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(self.records()), f, ensure_ascii=False, indent=2)
+
+
+timing_collector = TimingCollector()
@@ -1,31 +1,168 @@
+import os
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
+import allure
 import pytest
-from conftest_users import *
+from conftest_perf import (
+    measure_endpoint,
+    perf_baseline,
+    perf_results,
+    pytest_addoption,
+    pytest_collection_modifyitems,
+    pytest_terminal_summary,
+    pytest_testnodedown,
+)
+from conftest_queries import (
+    backend_profile,
+    pytest_fixture_setup,
+    pytest_runtest_call,
+    pytest_runtest_setup,
+    pytest_runtest_teardown,
+    sql_queries,
+)
+from conftest_users import (
+    USER_POOL_ENABLED,
+    WORKER_ID,
+    UserPool,
+    admin_auth_token,
+    admin_user,
+    user,
+    user_auth_token,
+    user_pool,
+)
 from steps.post_steps import add_comment_step, publish_post_step
 
-from src.clients.http_client.admin_controller import AdminController
-from src.clients.http_client.auth_controller import AuthController
-from src.clients.http_client.base_client import BaseClient
-from src.clients.http_client.comments_controller import CommentsController
-from src.clients.http_client.post_controller import PostsController
-from src.clients.http_client.profile_controller import ProfileController
-from src.clients.sql_client.sqlalchemy_client import SqlAlchemyClient
+from src.utils.query_tracker import query_tracker
+from src.utils.request_timing import timing_collector
+
+# Клиенты API и базы импортируются в фикстурах: requests и sqlalchemy нужны, только когда тесты выполняются,
+# а не при сборе (--collect-only, контроллер pytest-xdist).
+if TYPE_CHECKING:
+    from src.clients.http_client.admin_controller import AdminController
+    from src.clients.http_client.auth_controller import AuthController
+    from src.clients.http_client.base_client import BaseClient
+    from src.clients.http_client.comments_controller import CommentsController
+    from src.clients.http_client.post_controller import PostsController
+    from src.clients.http_client.profile_controller import ProfileController
+    from src.clients.sql_client.sqlalchemy_client import SqlAlchemyClient
+
+# Фикстуры пользователей, замеров задержки (маркер perf) и учёта запросов к базе объявлены в conftest_users,
+# conftest_perf и conftest_queries и регистрируются импортом в этот модуль.
+__all__ = ["admin_auth_token", "admin_user", "user", "user_auth_token", "user_pool",
+           "measure_endpoint", "perf_baseline", "perf_results", "pytest_addoption", "pytest_collection_modifyitems",
+           "pytest_fixture_setup", "pytest_runtest_call", "pytest_runtest_setup", "pytest_runtest_teardown",
+           "pytest_terminal_summary", "pytest_testnodedown", "backend_profile", "sql_queries"]
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Помечает замеры HTTP-запросов и запросы к базе id текущего теста, включая запросы из фикстур его подготовки."""
+    timing_collector.current_test = query_tracker.current_test = item.nodeid
+    yield
+    timing_collector.current_test = query_tracker.current_test = None
+
+def _is_xdist_worker(config) -> bool:
+    """Процесс является воркером pytest-xdist (а не контроллером или обычным прогоном)."""
+    return hasattr(config, "workerinput")
+
+def _tests_will_run(session) -> bool:
+    return not session.config.option.collectonly
+
+def pytest_sessionstart(session):
+    """Восстанавливает базу из снапшота DB_SNAPSHOT (или создаёт его) один раз до старта воркеров xdist."""
+    name = os.getenv("DB_SNAPSHOT")
+    if not name or _is_xdist_worker(session.config) or not _tests_will_run(session):
+        return
+    from src.clients.sql_client.sqlalchemy_client import SqlAlchemyClient
+
+    sql_client = SqlAlchemyClient()
+    try:
+        if sql_client.snapshot_exists(name):
+            sql_client.restore_snapshot(name)
+        else:
+            sql_client.create_snapshot(name)
+    finally:
+        sql_client.disconnect()
+
+def _worker_path(path: str) -> str:
+    """Путь файла сводки воркера xdist: к имени добавляется id воркера."""
+    if WORKER_ID == "main":
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}-{WORKER_ID}{ext}"
+
+def pytest_sessionfinish(session, exitstatus):
+    """Сохраняет JSON-сводки HTTP-запросов и запросов к базе, один раз очищает базу после завершения всех воркеров.
+
+    Воркеры xdist базу не очищают: общая очистка в воркере стёрла бы данные, с которыми ещё работают другие.
+    """
+    if timing_collector.records():
+        path = os.getenv("REQUEST_TIMINGS_PATH", str(session.config.rootpath / "tests" / "request-timings.json"))
+        timing_collector.write_summary(_worker_path(path))
+    if query_tracker.records():
+        path = os.getenv("DB_QUERIES_PATH", str(session.config.rootpath / "tests" / "db-queries.json"))
+        query_tracker.write_summary(_worker_path(path))
+
+    if _is_xdist_worker(session.config) or not _tests_will_run(session) or not session.testscollected:
+        return
+    from src.clients.sql_client.sqlalchemy_client import SqlAlchemyClient
+
+    sql_client = SqlAlchemyClient()
+    try:
+        sql_client.clear_all_tables(keep_user_ids=UserPool.persisted_user_ids() if USER_POOL_ENABLED else None)
+    finally:
+        sql_client.disconnect()
+
+@pytest.fixture(autouse=True)
+def request_timings(request):
+    """Прикладывает к отчёту Allure замеры HTTP-запросов теста: время сервера, сети и парсинга."""
+    yield
+    records = timing_collector.records(test=request.node.nodeid)
+    if records:
+        allure.attach(timing_collector.to_json(records), name="HTTP timings",
+                      attachment_type=allure.attachment_type.JSON)
 
 
 @pytest.fixture(scope="session")
 def sql_client():
     """Создает клиент для работы с базой данных."""
+    from src.clients.sql_client.sqlalchemy_client import SqlAlchemyClient
+
     sql_client = SqlAlchemyClient()
 
     yield sql_client
-    sql_client.clear_all_tables()
     sql_client.disconnect()
 
-@pytest.fixture(scope="session")
-def http_client():
-    """Создает HTTP клиент для работы с API."""
-    http_client = BaseClient()
+@pytest.fixture(scope="module", autouse=True)
+def db_snapshot_group(request):
+    """Восстанавливает базу из снапшота перед модулем с маркером pytestmark = pytest.mark.db_snapshot("<name>").
+
+    Фикстура модульная и автоматическая, поэтому срабатывает раньше модульных фикстур пользователей
+    и не стирает созданные ими данные.
+    """
+    marker = request.node.get_closest_marker("db_snapshot")
+    if marker is None:
+        return
+    if _is_xdist_worker(request.config):
+        pytest.skip("Восстановление снапшота невозможно при параллельном прогоне: база общая для всех воркеров")
+    name = marker.args[0] if marker.args else "baseline"
+    request.getfixturevalue("sql_client").restore_snapshot(name)
+
+@pytest.fixture(scope="module")
+def http_client(request):
+    """Создает HTTP клиент для работы с API.
+
+    Клиент свой у каждого модуля: токен, выставленный логином или фикстурами авторизации в одном модуле,
+    не протекает в тесты других модулей, какой бы воркер xdist их ни выполнял. При HTTP_CASSETTE_MODE=record
+    или replay обмены модуля пишутся в кассету HTTP_CASSETTE_DIR/<модуль>.json.gz или отдаются из неё.
+    """
+    from src.clients.http_client.base_client import BaseClient
+    from src.config.http_config import HttpClientConfig
+
+    cassette_path = os.path.join(HttpClientConfig.CASSETTE_DIR, f"{request.module.__name__}.json.gz")
+    http_client = BaseClient(cassette_path=cassette_path)
+    http_client.warmup()
 
     yield http_client
     http_client.close_session()
@@ -33,39 +170,49 @@ def http_client():
 @pytest.fixture(scope="module")
 def auth_controller(http_client):
     """Создает клиент аутентификации."""
+    from src.clients.http_client.auth_controller import AuthController
+
     return AuthController(http_client)
 
 @pytest.fixture(scope="module")
 def admin_controller(http_client):
     """Создает клиент администратора (токен устанавливается через фикстуру admin_auth_token)."""
+    from src.clients.http_client.admin_controller import AdminController
+
     yield AdminController(http_client)
 
 @pytest.fixture(scope="module")
 def profile_controller(http_client):
     """Создает клиент профиля."""
+    from src.clients.http_client.profile_controller import ProfileController
+
     return ProfileController(http_client)
 
 @pytest.fixture(scope="module")
 def posts_controller(http_client):
     """Создает клиент постов."""
+    from src.clients.http_client.post_controller import PostsController
+
     return PostsController(http_client)
 
 @pytest.fixture(scope="module")
 def comments_controller(http_client):
     """Создает клиент комментариев."""
+    from src.clients.http_client.comments_controller import CommentsController
+
     return CommentsController(http_client)
 
 @dataclass
 class Clients:
     """Класс-обёртка, агрегирующий различные клиенты для взаимодействия с API и базой данных."""
 
-    db: SqlAlchemyClient
-    api: BaseClient
-    profile: ProfileController
-    auth: AuthController
-    posts: PostsController
-    comments: CommentsController
-    admin: AdminController
+    db: "SqlAlchemyClient"
+    api: "BaseClient"
+    profile: "ProfileController"
+    auth: "AuthController"
+    posts: "PostsController"
+    comments: "CommentsController"
+    admin: "AdminController"
 
 @pytest.fixture(scope="module")
 def clients(http_client, sql_client, profile_controller, auth_controller, posts_controller, comments_controller,
@@ -0,0 +1,129 @@
+import json
+import os
+from dataclasses import asdict
+from typing import Any, Callable, List
+
+import allure
+import pytest
+
+from src.utils.latency_slo import LatencyBaseline, LatencyStats, format_table, measure_latency
+
+# Базовая линия не поставляется с репозиторием: первым прогоном на эталонном окружении её записывает
+# --perf-update-baseline, без неё тесты perf падают.
+PERF_BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "perf-baseline.json")
+# Замеры всей сессии в процессе, который выводит итог прогона: без xdist — свои, у контроллера — от всех воркеров.
+PERF_RESULTS_KEY = pytest.StashKey[List[LatencyStats]]()
+
+
+def pytest_addoption(parser):
+    """Опции замеров задержки: --perf, число замеров и прогрева, файл базовой линии и её обновление."""
+    group = parser.getgroup("perf", "Замеры задержки эндпоинтов (маркер perf)")
+    group.addoption("--perf", action="store_true", default=False,
+                    help="Выполнить тесты с маркером perf (без флага они пропускаются)")
+    group.addoption("--perf-iterations", type=int, default=200, help="Замеров на эндпоинт после прогрева")
+    group.addoption("--perf-warmup", type=int, default=20, help="Вызовов прогрева на эндпоинт")
+    group.addoption("--perf-baseline", default=PERF_BASELINE_PATH, help="Файл базовой линии задержек")
+    group.addoption("--perf-update-baseline", action="store_true", default=False,
+                    help="Записать замеры в базовую линию вместо проверки на регрессию")
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Выводит таблицу замеров задержки в итог прогона и с --perf-update-baseline записывает базовую линию.
+
+    Итог прогона выводит процесс без xdist или контроллер xdist, поэтому здесь видны замеры всех эндпоинтов.
+    """
+    results = config.stash.get(PERF_RESULTS_KEY, [])
+    if not results:
+        return
+    path = config.getoption("--perf-baseline")
+    baseline = LatencyBaseline.load(path)
+    terminalreporter.write_sep("-", "perf")
+    for line in format_table(results, baseline).splitlines():
+        terminalreporter.write_line(line)
+    if config.getoption("--perf-update-baseline"):
+        for stats in results:
+            baseline.update(stats)
+        baseline.save(path)
+        terminalreporter.write_line(f"Базовая линия записана в {path}, эндпоинтов: {len(results)}")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Принимает на контроллере xdist замеры задержки, которые воркер передал в workeroutput."""
+    results = node.workeroutput.get("perf_results")
+    if results:
+        node.config.stash.setdefault(PERF_RESULTS_KEY, []).extend(LatencyStats(**item) for item in results)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Пропускает тесты с маркером perf без --perf: сотни запросов на эндпоинт не нужны в обычном прогоне."""
+    if config.getoption("--perf"):
+        return
+    skip = pytest.mark.skip(reason="Замеры задержки выполняются только с --perf")
+    for item in items:
+        if item.get_closest_marker("perf"):
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def perf_baseline(request):
+    """Базовая линия задержек из --perf-baseline."""
+    return LatencyBaseline.load(request.config.getoption("--perf-baseline"))
+
+
+@pytest.fixture(scope="session")
+def perf_results(request):
+    """Замеры задержки прогона; по завершении сессии сохраняет JSON-сводку и передаёт замеры в итог прогона.
+
+    Сводка пишется в PERF_RESULTS_PATH (у воркера xdist — с его id в имени). Воркер отправляет замеры
+    контроллеру через workeroutput: таблицу и базовую линию (pytest_terminal_summary) контроллер строит по
+    всем эндпоинтам.
+    """
+    results: List[LatencyStats] = []
+    yield results
+    if not results:
+        return
+    path = os.getenv("PERF_RESULTS_PATH", str(request.config.rootpath / "tests" / "perf-results.json"))
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if worker:
+        root, ext = os.path.splitext(path)
+        path = f"{root}-{worker}{ext}"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump([asdict(r) for r in results], f, ensure_ascii=False, indent=2)
+    if hasattr(request.config, "workeroutput"):
+        request.config.workeroutput["perf_results"] = [asdict(r) for r in results]
+    else:
+        request.config.stash.setdefault(PERF_RESULTS_KEY, []).extend(results)
+
+
+@pytest.fixture
+def measure_endpoint(request, perf_baseline, perf_results):
+    """Замерить задержку эндпоинта и упасть при регрессии относительно базовой линии.
+
+    Без --perf-update-baseline тест падает и тогда, когда для эндпоинта нет базовой линии: иначе проверка
+    молча проходит при любой задержке.
+
+    Использование: measure_endpoint("GET " + ApiEndpoints.POST, lambda: clients.posts.get_post(post_id)).
+    Количество замеров и прогрев задаются параметрами маркера perf(iterations=..., warmup=...)
+    или опциями --perf-iterations/--perf-warmup.
+    """
+    marker = request.node.get_closest_marker("perf")
+    options = marker.kwargs if marker else {}
+    iterations = options.get("iterations", request.config.getoption("--perf-iterations"))
+    warmup = options.get("warmup", request.config.getoption("--perf-warmup"))
+
+    def measure(endpoint: str, call: Callable[[], Any]) -> LatencyStats:
+        stats = measure_latency(endpoint, call, iterations=iterations, warmup=warmup)
+        perf_results.append(stats)
+        allure.attach(json.dumps(asdict(stats), ensure_ascii=False, indent=2), name=f"Latency {endpoint}",
+                      attachment_type=allure.attachment_type.JSON)
+        assert stats.errors == 0, f"{endpoint}: {stats.errors} из {stats.iterations} запросов завершились ошибкой"
+        if not request.config.getoption("--perf-update-baseline"):
+            if stats.endpoint not in perf_baseline.endpoints:
+                pytest.fail(f"{endpoint}: нет базовой линии в {request.config.getoption('--perf-baseline')}; "
+                            f"запишите её прогоном с --perf-update-baseline на эталонном окружении")
+            regressions = perf_baseline.check(stats)
+            assert not regressions, "Регрессия задержки:\n" + "\n".join(str(r) for r in regressions)
+        return stats
+
+    return measure
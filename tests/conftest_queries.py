@@ -0,0 +1,88 @@
+import json
+import logging
+from contextlib import contextmanager
+
+import allure
+import pytest
+
+from src.utils.custom_logger import CustomLogger
+from src.utils.query_tracker import query_tracker
+
+custom_logger = CustomLogger(__name__)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    """Помечает запросы к базе, выполненные при создании фикстуры, фазой setup:<имя фикстуры>."""
+    previous = query_tracker.current_phase
+    query_tracker.current_phase = f"setup:{fixturedef.argname}"
+    try:
+        return (yield)
+    finally:
+        query_tracker.current_phase = previous
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_setup(item):
+    """Помечает запросы подготовки теста вне фикстур фазой setup."""
+    query_tracker.current_phase = "setup"
+    return (yield)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    """Помечает запросы тела теста фазой call и проверяет бюджет из маркера query_budget.
+
+    Маркер: @pytest.mark.query_budget(max_queries=3, max_time_ms=50, max_repeats=1) — ограничивает запросы
+    к базе только в теле теста, без фикстур.
+    """
+    query_tracker.current_phase = "call"
+    marker = item.get_closest_marker("query_budget")
+    if marker is None:
+        return (yield)
+    with query_tracker.budget(label=item.nodeid, **marker.kwargs):
+        return (yield)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_teardown(item, nextitem):
+    """Помечает запросы завершения теста фазой teardown и сбрасывает фазу после него."""
+    query_tracker.current_phase = "teardown"
+    try:
+        return (yield)
+    finally:
+        query_tracker.current_phase = None
+
+
+@pytest.fixture(autouse=True)
+def sql_queries(request):
+    """Прикладывает к отчёту Allure запросы к базе теста: количество и время по фазам и фикстурам, повторы N+1."""
+    yield
+    records = query_tracker.records(test=request.node.nodeid)
+    if not records:
+        return
+    repeated = query_tracker.detect_n_plus_one(records)
+    for item in repeated:
+        custom_logger.log_with_context("Возможный N+1 в %s: %s", request.node.nodeid, item, level=logging.WARNING)
+    allure.attach(query_tracker.to_json(records), name="SQL queries" + (" (N+1)" if repeated else ""),
+                  attachment_type=allure.attachment_type.JSON)
+
+
+@pytest.fixture
+def backend_profile(request):
+    """Профиль запросов сервиса к базе по pg_stat_statements для блока теста, с меткой эндпоинта.
+
+    with backend_profile(f"GET {ApiEndpoints.POST}") as profile: ... — после блока profile.diff содержит
+    разность снимков, топ запросов и счётчики таблиц прикладываются к отчёту Allure.
+    """
+    @contextmanager
+    def profile(label: str, settle: float = 0.0):
+        sql_client = request.getfixturevalue("sql_client")
+        with sql_client.profile_backend(label, settle=settle) as result:
+            yield result
+        allure.attach(result.diff.format_table(), name=f"Postgres stats: {label}",
+                      attachment_type=allure.attachment_type.TEXT)
+        allure.attach(json.dumps(result.diff.to_dict(), ensure_ascii=False, indent=2),
+                      name=f"Postgres stats: {label} (JSON)", attachment_type=allure.attachment_type.JSON)
+
+    return profile
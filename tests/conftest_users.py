@@ -1,21 +1,26 @@
+import os
 from typing import Any, Dict
 
 import pytest
-from faker import Faker
+from user_pool import USER_POOL_PATH, UserPool
 
-from src.models.api_model import LoginRequest, RegistrationRequest
+from src.config.env import load_env, to_bool
+from src.models.api_model import LoginRequest
+from src.utils.payload_pool import payload_pool
 
-fake = Faker()
+load_env()
+
+# Id воркера pytest-xdist (gw0, gw1, ...) или "main" без xdist. Email и username пользователей уникальны
+# между воркерами за счёт метки воркера в данных пула (src.utils.payload_pool).
+WORKER_ID = os.getenv("PYTEST_XDIST_WORKER", "main")
+# Пул заранее авторизованных пользователей (см. user_pool.py); USER_POOL_ENABLED=false возвращает регистрацию
+# нового пользователя на каждый модуль.
+USER_POOL_ENABLED = to_bool(os.getenv("USER_POOL_ENABLED", "true"))
 
 def register_user(clients) -> Dict[str, Any]:
     """Регистрирует пользователя и проверяет его в базе, возвращает данные и пароль."""
-    password = fake.password(length=8, special_chars=True, digits=True, upper_case=True, lower_case=True)
-    reg_data = RegistrationRequest(
-        email=fake.email(),
-        username=fake.user_name(),
-        password=password,
-        passwordConfirmation=password
-    )
+    reg_data = payload_pool().registration()
+    password = reg_data.password
     validation_response = clients.auth.register(reg_data)
 
     assert validation_response.responseData is not None, "Отсутствуют данные регистрации"
@@ -41,9 +46,26 @@ def login_user(clients, email: str, password: str) -> str:
 
     return token
 
+@pytest.fixture(scope="session")
+def user_pool(sql_client):
+    """Пул пользователей с кешированными JWT, общий для прогона (None, если пул выключен)."""
+    if not USER_POOL_ENABLED:
+        yield None
+        return
+    pool = UserPool(sql_client, register=register_user, login=login_user, path=USER_POOL_PATH)
+    yield pool
+    pool.close()
+
 @pytest.fixture(scope="module")
-def user(clients):
-    """Создает пользователя и осуществляет вход."""
+def user(clients, user_pool):
+    """Создает пользователя (или берёт его из пула) и осуществляет вход."""
+    if user_pool is not None:
+        user_data = user_pool.lease("USER")
+        clients.api.set_token(user_data["token"])
+        yield user_data
+        user_pool.release(user_data)
+        return
+
     user_data = register_user(clients)
     token = login_user(clients, user_data["email"], user_data["password"])
     user_data["token"] = token
@@ -59,8 +81,15 @@ def user_auth_token(clients, user):
     clients.api.clear_token()
 
 @pytest.fixture(scope="module")
-def admin_user(clients):
-    """Создает администратора и осуществляет вход."""
+def admin_user(clients, user_pool):
+    """Создает администратора (или берёт его из пула) и осуществляет вход."""
+    if user_pool is not None:
+        user_data = user_pool.lease("ADMIN")
+        clients.api.set_token(user_data["token"])
+        yield user_data
+        user_pool.release(user_data)
+        return
+
     user_data = register_user(clients)
     clients.db.set_admin_role(user_data["user_id"])
     user = clients.db.get_user_by_email(user_data["email"])
@@ -0,0 +1,21 @@
+from typing import Any
+
+
+class _LazyFaker:
+    """Общий для тестов экземпляр Faker, который создаётся при первом обращении.
+
+    Импорт faker и создание Faker() стоят десятки миллисекунд: раньше их платил каждый модуль тестов
+    при сборе, даже если ни один его тест не запускался.
+    """
+
+    _faker = None
+
+    def __getattr__(self, name: str) -> Any:
+        if _LazyFaker._faker is None:
+            from faker import Faker
+
+            _LazyFaker._faker = Faker()
+        return getattr(_LazyFaker._faker, name)
+
+
+fake = _LazyFaker()
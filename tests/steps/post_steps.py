@@ -1,12 +1,9 @@
-from faker import Faker
+from src.utils.payload_pool import payload_pool
 
-from src.models.api_model import PublishRequest
-
-fake = Faker()
 
 def publish_post_step(clients, user):
     """Создает пост от имени авторизованного пользователя."""
-    test_data = PublishRequest(title=fake.text(10), content=fake.text(25))
+    test_data = payload_pool().publish()
     validation_response = clients.posts.publish_post(test_data)
     post_id = validation_response.responseData.id
     db_post = clients.db.get_post_by_id(str(post_id))
@@ -15,7 +12,7 @@ def publish_post_step(clients, user):
 
 def add_comment_step(clients, user, post_id):
     """Создает комментарий к посту от имени авторизованного пользователя."""
-    test_data = fake.text(15)
+    test_data = payload_pool().comment().text
     clients.posts.add_comment(post_id, test_data)
     db_comment = clients.db.get_comment_by_post_id(post_id)
     assert db_comment is not None, "Комментарий не найден в базе после создания"
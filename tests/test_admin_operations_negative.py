@@ -1,8 +1,7 @@
 import allure
 import pytest
-from faker import Faker
+from fake_data import fake
 
-fake = Faker()
 
 @allure.feature("Admin Controller")
 @allure.story("Admin Operations Negative")
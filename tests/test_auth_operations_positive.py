@@ -1,21 +1,14 @@
 import allure
 import pytest
-from faker import Faker
 
 from src.models.api_model import LoginRequest, RegistrationRequest
+from src.utils.payload_pool import payload_pool
 
-fake = Faker()
 
 @pytest.fixture(scope="module")
 def test_data():
     """Генерирует тестовые данные для регистрации и аутентификации пользователя."""
-    password = fake.password(length=8, special_chars=True, digits=True, upper_case=True, lower_case=True)
-    return {
-        "email": fake.email(),
-        "username": fake.user_name(),
-        "password": password,
-        "passwordConfirmation": password,
-    }
+    return payload_pool().registration().model_dump()
 
 @allure.feature("Authentication")
 @allure.story("User Registration and Authentication")
@@ -1,8 +1,9 @@
 import allure
 import pytest
-from faker import Faker
+from fake_data import fake
+
+from src.utils.comment_tree import CommentTreeIndex, compare_comment_trees
 
-fake = Faker()
 
 @allure.feature("Comment Controller")
 @allure.story("Comment Operations Positive")
@@ -21,3 +22,22 @@ class TestComments:
         assert clients.db.get_comment_by_id(validation_response.responseData.id) is not None,\
             "Комментарий не найден в базе"
 
+    @allure.title("Глубокая цепочка ответов совпадает с деревом в базе")
+    def test_deep_reply_chain(self, clients, publish_post, add_comment):
+        """Тест на цепочку ответов глубже лимита вложенности JSON-парсера pydantic и сверку дерева с базой."""
+        depth = 120
+        parent_id = add_comment
+        for _ in range(depth):
+            parent_id = str(clients.comments.reply_to_comment(parent_id, fake.text(10)).responseData.id)
+
+        validation_response = clients.posts.get_post(publish_post)
+        assert validation_response.status == "ok", f"Пост не разобран: {validation_response.error}"
+        api_tree = CommentTreeIndex.from_api(validation_response.responseData.comments)
+        assert api_tree.max_depth >= depth, "Цепочка ответов в ответе API короче созданной"
+
+        with allure.step("Сверка дерева комментариев с базой данных"):
+            with clients.db.query_budget(max_queries=1, label="дерево комментариев"):
+                rows = clients.db.get_comment_tree(publish_post)
+            db_tree = CommentTreeIndex.from_rows(rows)
+            diff = compare_comment_trees(api_tree, db_tree, partial=validation_response.responseData.hasMoreComments)
+            assert diff.ok, f"Дерево комментариев в API расходится с базой: {diff.summary()}"
@@ -0,0 +1,98 @@
+import allure
+import pytest
+
+from src.clients.sql_client.explain import PlanReport, QueryPlan, find_issues
+
+TABLE_ROWS = {"posts": 1_000_000, "comments": 5_000_000, "users": 500}
+
+
+def node(node_type: str, relation: str = None, plans: list = None, **fields) -> dict:
+    """Узел плана EXPLAIN (FORMAT JSON) с ключами в написании PostgreSQL ("Plan Rows", "Actual Loops")."""
+    result = {"Node Type": node_type, "Plan Rows": fields.pop("plan_rows", 1)}
+    if relation:
+        result["Relation Name"] = relation
+    for name, value in fields.items():
+        result[name.replace("_", " ").title().replace("By", "by")] = value
+    if plans:
+        result["Plans"] = plans
+    return result
+
+
+@allure.feature("Query Plans")
+@allure.story("Plan Issues")
+class TestFindIssues:
+    @allure.title("Seq Scan большой таблицы с предложением индекса по условию Filter")
+    def test_seq_scan(self):
+        """Seq Scan во вложенном узле находится, маленькая таблица и Index Scan проблемой не считаются."""
+        plan = node("Nested Loop", plans=[
+            node("Seq Scan", "comments", filter="(post_id = 'c0a8012e-0000-0000-0000-000000000000'::uuid)",
+                 rows_removed_by_filter=4_999_990),
+            node("Seq Scan", "users", filter="(id = 1)"),
+            node("Index Scan", "posts", index_cond="(id = comments.post_id)"),
+        ])
+
+        issues = find_issues(plan, TABLE_ROWS)
+
+        assert len(issues) == 1
+        issue = issues[0]
+        assert (issue.kind, issue.relation, issue.table_rows, issue.rows_removed_by_filter) == (
+            "seq_scan", "comments", 5_000_000, 4_999_990)
+        assert issue.suggestion == "CREATE INDEX ON comments (post_id)"
+        assert str(issue).endswith("→ CREATE INDEX ON comments (post_id)")
+
+    @pytest.mark.parametrize("condition, suggestion", [
+        ("((comments.post_id = $1) AND (comments.parent_id IS NULL))", "CREATE INDEX ON comments (post_id)"),
+        ("((author_id = 42) AND (created_at >= '2026-01-01'::date))", "CREATE INDEX ON comments (author_id, created_at)"),
+        ("((post_id = $1) AND (post_id <> $2))", "CREATE INDEX ON comments (post_id)"),
+        ("(author_id = ANY ('{1,2}'::bigint[]))", "CREATE INDEX ON comments (author_id)"),
+        ("(lower((text)::text) ~~ '%spam%'::text)", None),
+        (None, None),
+    ])
+    @allure.title("Столбцы индекса берутся из условий сравнения в Filter")
+    def test_suggested_index(self, condition, suggestion):
+        """Столбцы идут в порядке условия без повторов; условия без сравнения столбца индекс не предлагают."""
+        plan = node("Seq Scan", "comments", filter=condition) if condition else node("Seq Scan", "comments")
+
+        assert find_issues(plan, TABLE_ROWS)[0].suggestion == suggestion
+
+    @allure.title("Расхождение оценки строк с фактом в EXPLAIN ANALYZE")
+    def test_row_estimate(self):
+        """Оценка в 10 раз и больше от факта — проблема; мелкие расхождения и узлы без выполнения — нет."""
+        plan = node("Hash Join", plan_rows=50, actual_rows=20_000, actual_loops=1, plans=[
+            node("Index Scan", "posts", plan_rows=1_000, actual_rows=900, actual_loops=1),
+            node("Index Scan", "comments", plan_rows=1, actual_rows=60, actual_loops=1),
+            node("Index Scan", "users", plan_rows=5_000, actual_rows=0, actual_loops=0),
+        ])
+
+        issues = find_issues(plan, TABLE_ROWS)
+
+        assert [(i.kind, i.node_type, i.plan_rows, i.actual_rows, i.ratio) for i in issues] == [
+            ("row_estimate", "Hash Join", 50.0, 20_000.0, 400.0)]
+        assert str(issues[0]) == "Hash Join: оценка 50 строк, факт 20000 (×400.0)"
+
+    @allure.title("Обобщённый план проверяется только на Seq Scan")
+    def test_generic_plan(self):
+        """Без Actual Rows (EXPLAIN без ANALYZE) оценка строк не сравнивается с фактом."""
+        plan = node("Seq Scan", "posts", plan_rows=1_000_000, filter="(author_id = $1)")
+
+        assert [issue.kind for issue in find_issues(plan, TABLE_ROWS)] == ["seq_scan"]
+        assert find_issues(plan, TABLE_ROWS, min_table_rows=2_000_000) == []
+
+
+@allure.feature("Query Plans")
+@allure.story("Plan Report")
+class TestPlanReport:
+    @allure.title("Недостающие индексы группируются по запросам")
+    def test_suggested_indexes(self):
+        """Один индекс, нужный нескольким запросам, выводится один раз со списком запросов."""
+        scan = node("Seq Scan", "comments", filter="(post_id = $1)")
+        plans = [QueryPlan(name, "builtin", "SELECT 1", analyzed=False, issues=find_issues(scan, TABLE_ROWS))
+                 for name in ("comments_of_post", "comment_count")]
+        report = PlanReport(TABLE_ROWS, plans + [QueryPlan("broken", "custom", "SELECT", False, error="boom")],
+                            10_000, 10.0)
+
+        assert report.suggested_indexes() == {
+            "CREATE INDEX ON comments (post_id)": ["comments_of_post", "comment_count"]}
+        table = report.format_table()
+        assert "  CREATE INDEX ON comments (post_id);  -- comments_of_post, comment_count" in table
+        assert "ошибка: boom" in table
@@ -0,0 +1,71 @@
+import allure
+
+from src.utils.latency_slo import LatencyBaseline, LatencyStats
+
+
+def latency(endpoint: str = "GET /api/v1/posts", p50: float = 10.0, p95: float = 20.0,
+            p99: float = 40.0) -> LatencyStats:
+    """Замер эндпоинта с заданными перцентилями."""
+    return LatencyStats(endpoint=endpoint, iterations=200, errors=0, p50_ms=p50, p95_ms=p95, p99_ms=p99,
+                        mean_ms=p50, max_ms=p99)
+
+
+@allure.feature("Latency SLO")
+@allure.story("Latency Baseline")
+class TestLatencyBaseline:
+    @allure.title("Замер в пределах допусков не считается регрессией")
+    def test_within_tolerance(self):
+        """Рост каждой метрики меньше её допуска."""
+        baseline = LatencyBaseline()
+        baseline.update(latency())
+
+        assert baseline.check(latency(p50=11.9, p95=25.9, p99=59.9)) == []
+
+    @allure.title("Рост метрики сверх допуска — регрессия")
+    def test_regression(self):
+        """p95 вырос на 50% при допуске 30%: регрессия с базовой линией и пределом метрики."""
+        baseline = LatencyBaseline()
+        baseline.update(latency())
+
+        regressions = baseline.check(latency(p95=30.0))
+
+        assert [(r.metric, r.baseline_ms, r.actual_ms, r.limit_ms) for r in regressions] == [
+            ("p95_ms", 20.0, 30.0, 26.0)]
+        assert "+50%" in str(regressions[0])
+
+    @allure.title("Рост меньше min_delta_ms не считается регрессией")
+    def test_min_delta(self):
+        """На быстром эндпоинте двукратный рост в пределах абсолютного порога — шум."""
+        baseline = LatencyBaseline(min_delta_ms=1.0)
+        baseline.update(latency(p50=0.2, p95=0.4, p99=0.5))
+
+        assert baseline.check(latency(p50=0.4, p95=0.8, p99=1.0)) == []
+        assert [r.metric for r in baseline.check(latency(p50=0.4, p95=1.5, p99=1.0))] == ["p95_ms"]
+
+    @allure.title("Допуски эндпоинта переопределяют общие и сохраняются при обновлении")
+    def test_endpoint_tolerances(self):
+        """Ключ tolerances эндпоинта действует при проверке и не затирается update."""
+        baseline = LatencyBaseline()
+        baseline.update(latency())
+        baseline.endpoints["GET /api/v1/posts"]["tolerances"] = {"p95_ms": 1.0}
+
+        assert baseline.check(latency(p95=39.0)) == []
+        baseline.update(latency(p95=25.0))
+        assert baseline.endpoints["GET /api/v1/posts"] == {
+            "p50_ms": 10.0, "p95_ms": 25.0, "p99_ms": 40.0, "tolerances": {"p95_ms": 1.0}}
+
+    @allure.title("Эндпоинт без базовой линии не проверяется")
+    def test_missing_endpoint(self):
+        """Метод check возвращает пустой список — отсутствие базовой линии отслеживает measure_endpoint."""
+        assert LatencyBaseline().check(latency(p95=1000.0)) == []
+
+    @allure.title("Базовая линия сохраняется и читается из файла")
+    def test_save_load(self, tmp_path):
+        """Метод load читает то, что записал save; без файла — допуски по умолчанию."""
+        path = str(tmp_path / "perf-baseline.json")
+        baseline = LatencyBaseline(tolerances={"p50_ms": 0.1, "p95_ms": 0.2, "p99_ms": 0.3}, min_delta_ms=2.0)
+        baseline.update(latency())
+        baseline.save(path)
+
+        assert LatencyBaseline.load(path) == baseline
+        assert LatencyBaseline.load(str(tmp_path / "missing.json")) == LatencyBaseline()
@@ -0,0 +1,47 @@
+import allure
+import pytest
+
+from src.models.api_model import RegistrationRequest, validate_password_complexity
+from src.utils.payload_pool import PayloadPool
+
+
+def take(pool: PayloadPool, kind: str, count: int) -> list:
+    """Первые count объектов вида kind (registration, publish, comment) из пула, как словари."""
+    return [getattr(pool, kind)().model_dump() for _ in range(count)]
+
+
+@allure.feature("Test Data")
+@allure.story("Payload Pool")
+class TestPayloadPool:
+    @pytest.mark.parametrize("kind", ["registration", "publish", "comment"])
+    @allure.title("Одинаковые seed и namespace воспроизводят последовательность")
+    def test_reproducible(self, kind):
+        """Последовательность совпадает и через границу порций; другой seed даёт другие данные."""
+        first = take(PayloadPool(seed=7, namespace="ns", chunk_size=5), kind, 12)
+
+        assert take(PayloadPool(seed=7, namespace="ns", chunk_size=5), kind, 12) == first
+        assert take(PayloadPool(seed=8, namespace="ns", chunk_size=5), kind, 12) != first
+
+    @allure.title("Email и username уникальны между порциями и namespace")
+    def test_unique_identities(self):
+        """При одном seed пулы с разными namespace не пересекаются, внутри пула повторов нет."""
+        registrations = (take(PayloadPool(seed=1, namespace="gw0-run", chunk_size=50), "registration", 500)
+                         + take(PayloadPool(seed=1, namespace="gw1-run", chunk_size=50), "registration", 500))
+
+        assert len({item["email"] for item in registrations}) == len(registrations)
+        assert len({item["username"] for item in registrations}) == len(registrations)
+
+    @allure.title("Пароли проходят проверку сложности, запросы — строгую валидацию")
+    def test_valid_registrations(self):
+        """Пароль каждого запроса удовлетворяет validate_password_complexity и совпадает с подтверждением."""
+        for item in take(PayloadPool(seed=3, namespace="ns", chunk_size=100), "registration", 1000):
+            assert validate_password_complexity(item["password"]) == item["passwordConfirmation"]
+            RegistrationRequest.model_validate(item)
+
+    @allure.title("Выданные объекты не переиспользуются")
+    def test_items_not_reused(self):
+        """Каждый вызов возвращает новый объект, в том числе после исчерпания порции."""
+        pool = PayloadPool(seed=5, namespace="ns", chunk_size=3)
+        posts = [pool.publish() for _ in range(7)]
+
+        assert len({id(post) for post in posts}) == 7
@@ -0,0 +1,82 @@
+import allure
+import pytest
+
+from src.config.api_endpoints import ApiEndpoints
+from src.models.api_model import LoginRequest
+from src.utils.payload_pool import payload_pool
+
+
+@allure.feature("Latency SLO")
+@allure.story("Endpoints Latency")
+@pytest.mark.perf
+class TestEndpointsLatency:
+    @allure.title("Задержка регистрации")
+    def test_register_latency(self, clients, measure_endpoint):
+        """Регистрация нового пользователя из пула данных на каждый вызов."""
+        measure_endpoint(f"POST {ApiEndpoints.AUTH_REGISTER}",
+                         lambda: clients.auth.register(payload_pool().registration()))
+
+    @allure.title("Задержка логина")
+    def test_login_latency(self, clients, user, measure_endpoint):
+        """Повторный логин одного пользователя."""
+        login_data = LoginRequest(email=user["email"], password=user["password"])
+        measure_endpoint(f"POST {ApiEndpoints.AUTH_LOGIN}", lambda: clients.auth.login(login_data))
+
+    @allure.title("Задержка получения профиля")
+    def test_profile_info_latency(self, clients, user, user_auth_token, measure_endpoint):
+        """Профиль текущего пользователя по его JWT."""
+        measure_endpoint(f"POST {ApiEndpoints.PROFILE_INFO}", clients.profile.get_profile_info)
+
+    @allure.title("Задержка списка постов")
+    def test_posts_list_latency(self, clients, user, user_auth_token, publish_post, measure_endpoint):
+        """Первая страница ленты по 20 постов."""
+        measure_endpoint(f"GET {ApiEndpoints.POSTS}",
+                         lambda: clients.posts.get_posts_list({"page": 0, "size": 20}))
+
+    @allure.title("Задержка получения поста")
+    def test_get_post_latency(self, clients, user, user_auth_token, publish_post, add_comment, measure_endpoint):
+        """Пост с одним комментарием: замер идёт раньше тестов, добавляющих комментарии к тому же посту."""
+        measure_endpoint(f"GET {ApiEndpoints.POST}", lambda: clients.posts.get_post(publish_post))
+
+    @allure.title("Задержка публикации поста")
+    def test_publish_latency(self, clients, user, user_auth_token, measure_endpoint):
+        """Публикация нового поста из пула данных на каждый вызов."""
+        measure_endpoint(f"POST {ApiEndpoints.POST_PUBLISH}",
+                         lambda: clients.posts.publish_post(payload_pool().publish()))
+
+    @allure.title("Задержка голосования за пост")
+    def test_vote_latency(self, clients, user, user_auth_token, publish_post, measure_endpoint):
+        """Повторный голос одного пользователя за один пост."""
+        measure_endpoint(f"POST {ApiEndpoints.POST_VOTE}", lambda: clients.posts.vote_post(publish_post, 1))
+
+    @allure.title("Задержка добавления комментария")
+    def test_add_comment_latency(self, clients, user, user_auth_token, publish_post, measure_endpoint):
+        """Новый комментарий к одному посту на каждый вызов."""
+        measure_endpoint(f"POST {ApiEndpoints.POST_ADD_COMMENT}",
+                         lambda: clients.posts.add_comment(publish_post, payload_pool().comment().text))
+
+    @allure.title("Задержка ответа на комментарий")
+    def test_reply_latency(self, clients, user, user_auth_token, add_comment, measure_endpoint):
+        """Новый ответ на один комментарий на каждый вызов."""
+        measure_endpoint(f"POST {ApiEndpoints.COMMENT_REPLY}",
+                         lambda: clients.comments.reply_to_comment(add_comment, payload_pool().comment().text))
+
+
+@allure.feature("Latency SLO")
+@allure.story("Admin Endpoints Latency")
+@pytest.mark.perf
+@pytest.mark.admin
+class TestAdminEndpointsLatency:
+    @allure.title("Задержка получения профиля пользователя администратором")
+    def test_admin_user_profile_latency(self, clients, admin_user, admin_auth_token, user, measure_endpoint):
+        """Профиль обычного пользователя по его id."""
+        measure_endpoint(f"POST {ApiEndpoints.ADMIN_PROFILE_INFO}",
+                         lambda: clients.admin.get_user_profile(user["user_id"]))
+
+    @allure.title("Задержка бана и разбана пользователя")
+    def test_ban_unban_latency(self, clients, admin_user, admin_auth_token, user, measure_endpoint):
+        """Бан и разбан замеряются по очереди; пользователь остаётся разблокированным."""
+        try:
+            measure_endpoint(f"POST {ApiEndpoints.ADMIN_BAN_USER}", lambda: clients.admin.ban_user(user["email"], 40))
+        finally:
+            measure_endpoint(f"POST {ApiEndpoints.ADMIN_UNBAN_USER}", lambda: clients.admin.unban_user(user["email"]))
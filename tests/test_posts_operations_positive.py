@@ -1,10 +1,10 @@
 import allure
 import pytest
-from faker import Faker
+from fake_data import fake
 
-from src.models.api_model import PublishRequest
+from src.load.reconciliation import Reconciler
+from src.utils.payload_pool import payload_pool
 
-fake = Faker()
 
 @allure.feature("Post Controller")
 @allure.story("Post Operations")
@@ -14,7 +14,7 @@ class TestPosts:
     @allure.title("Публикация нового поста")
     def test_publish_post(self, clients, user):
         """Тест на публикацию нового поста и проверку его создания в базе."""
-        test_data = PublishRequest(title=fake.text(15), content=fake.text(25))
+        test_data = payload_pool().publish()
 
         validation_response = clients.posts.publish_post(test_data)
 
@@ -72,3 +72,22 @@ class TestPosts:
 
         assert validation_response.responseData is not None, "responseData отсутствует в ответе API"
 
+
+    @allure.title("Обход всех страниц ленты постов")
+    def test_iter_posts(self, clients, publish_post):
+        """Тест на постраничный обход ленты с фоновой подгрузкой: новый пост найден.
+
+        Другие тесты (и воркеры xdist) публикуют посты во время обхода и сдвигают страницы, поэтому
+        повторы постов между страницами здесь не проверяются.
+        """
+        post_ids = {str(post.id) for post in clients.posts.iter_posts(size=50, prefetch=2)}
+
+        assert publish_post in post_ids, "Опубликованный пост не найден в ленте"
+
+    @allure.title("voteScore и количество комментариев поста совпадают с базой")
+    def test_post_aggregates_match_db(self, clients, publish_post):
+        """Тест на сверку агрегатов поста из API с суммой голосов и числом комментариев в базе."""
+        report = Reconciler(clients.db, concurrency=1, token=clients.api.token).run_sync([publish_post])
+
+        assert report.checked == 1, f"Пост не проверен: {report.errors}"
+        assert report.ok, f"Агрегаты поста расходятся с базой:\n{report.summary()}"
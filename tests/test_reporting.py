@@ -0,0 +1,127 @@
+import allure
+import allure_commons
+import pytest
+
+from src.utils.reporting import StepReporter
+
+
+class FakeListener:
+    """Слушатель шагов Allure, который запоминает заголовки и параметры начатых шагов."""
+
+    def __init__(self):
+        self.steps = []
+        self.open = 0
+        self.max_open = 0
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        """Запомнить начатый шаг."""
+        self.steps.append((title, params))
+        self.open += 1
+        self.max_open = max(self.max_open, self.open)
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        """Закрыть шаг."""
+        self.open -= 1
+
+
+@pytest.fixture
+def listener():
+    """Регистрирует FakeListener в plugin_manager allure_commons на время теста."""
+    fake = FakeListener()
+    allure_commons.plugin_manager.register(fake)
+    yield fake
+    allure_commons.plugin_manager.unregister(fake)
+
+
+def make_controller(reporter: StepReporter):
+    """Контроллер с шагом верхнего уровня и вложенным шагом клиента, как у PostsController и BaseClient."""
+    class Controller:
+        @reporter.step("Запрос к {path}")
+        def request(self, path, body=None):
+            return path
+
+        @reporter.step("Получение поста {post_id}")
+        def get_post(self, post_id):
+            return self.request(f"/posts/{post_id}")
+
+    return Controller()
+
+
+@allure.feature("Reporting")
+@allure.story("Step Reporter")
+class TestStepReporter:
+    @allure.title("Шаг записывается с заголовком и параметрами")
+    def test_step_rendered(self, listener):
+        """Заголовок форматируется по аргументам, self в параметры не попадает."""
+        controller = make_controller(StepReporter(enabled=True, sample_every=1, max_length=200))
+
+        assert controller.get_post("42") == "/posts/42"
+        assert [title for title, _ in listener.steps] == ["Получение поста '42'", "Запрос к '/posts/42'"]
+        assert listener.steps[1][1] == {"path": "'/posts/42'", "body": "None"}
+        assert listener.max_open == 2 and listener.open == 0
+
+    @allure.title("Длинные аргументы сокращаются до max_length")
+    def test_step_truncated(self, listener):
+        """Заголовок и значение параметра не длиннее max_length."""
+        controller = make_controller(StepReporter(enabled=True, sample_every=1, max_length=20))
+
+        controller.request("/" + "x" * 100, body="y" * 100)
+
+        title, params = listener.steps[0]
+        assert len(title) == 20 and title.endswith("...")
+        assert all(len(value) <= 20 for value in params.values())
+
+    @allure.title("Отключённые шаги не записываются")
+    def test_disabled(self, listener):
+        """enabled=False и контекст disabled() не создают шагов, но вызов выполняется."""
+        reporter = StepReporter(enabled=True, sample_every=1, max_length=200)
+        controller = make_controller(reporter)
+
+        with reporter.disabled():
+            assert controller.get_post("1") == "/posts/1"
+        assert reporter.enabled
+        assert make_controller(StepReporter(enabled=False)).get_post("2") == "/posts/2"
+        assert listener.steps == []
+
+    @allure.title("Шаги не записываются в подавленном потоке")
+    def test_suppressed(self, listener):
+        """suppressed() отключает шаги только внутри блока."""
+        reporter = StepReporter(enabled=True, sample_every=1, max_length=200)
+        controller = make_controller(reporter)
+
+        with reporter.suppressed():
+            controller.get_post("1")
+        controller.get_post("2")
+
+        assert [title for title, _ in listener.steps] == ["Получение поста '2'", "Запрос к '/posts/2'"]
+
+    @allure.title("Выборка по вызовам верхнего уровня")
+    def test_sampling(self, listener):
+        """При sample_every=3 записывается 1 из 3 вызовов вместе с вложенными шагами, остальные — целиком нет."""
+        controller = make_controller(StepReporter(enabled=True, sample_every=3, max_length=200))
+
+        for post_id in range(6):
+            controller.get_post(str(post_id))
+
+        assert [title for title, _ in listener.steps] == [
+            "Получение поста '0'", "Запрос к '/posts/0'", "Получение поста '3'", "Запрос к '/posts/3'"]
+
+    @allure.title("Глубина вложенности восстанавливается после исключения")
+    def test_depth_after_error(self, listener):
+        """Исключение внутри шага закрывает его и не ломает выборку следующих вызовов."""
+        reporter = StepReporter(enabled=True, sample_every=2, max_length=200)
+
+        @reporter.step("Падающий шаг")
+        def failing():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            failing()
+        controller = make_controller(reporter)
+        controller.get_post("1")
+        controller.get_post("2")
+
+        assert listener.open == 0
+        assert [title for title, _ in listener.steps] == ["Падающий шаг", "Получение поста '2'", "Запрос к '/posts/2'"]
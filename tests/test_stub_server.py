@@ -0,0 +1,109 @@
+import uuid
+from typing import Optional
+
+import allure
+import pytest
+import requests
+
+from src.clients.http_client.auth_controller import AuthController
+from src.clients.http_client.base_client import BaseClient
+from src.clients.http_client.profile_controller import ProfileController
+from src.config.api_endpoints import ApiEndpoints
+from src.models.api_model import LoginRequest
+from src.stub.server import DEFAULT_PATHS, StubServer
+from src.utils.payload_pool import payload_pool
+
+
+def endpoint(name: str, **params) -> str:
+    """Путь эндпоинта ApiEndpoints с подставленными параметрами (пути по умолчанию, если .env не задан)."""
+    return (getattr(ApiEndpoints, name) or DEFAULT_PATHS[name]).format(**params)
+
+
+@pytest.fixture(scope="module")
+def stub():
+    """Заглушка nanoreddit с пользователем и администратором на время модуля."""
+    with StubServer() as server:
+        user = server.store.register("user@stub.example.com", "stub_user", "Passw0rd!")
+        admin = server.store.register("admin@stub.example.com", "stub_admin", "Passw0rd!")
+        server.store.set_role(admin.id, "ADMIN")
+        server.tokens = {"user": server.store.issue_token(user), "admin": server.store.issue_token(admin)}
+        yield server
+
+
+def call(stub, method: str, path: str, token: Optional[str] = None, **kwargs) -> requests.Response:
+    """Запрос к заглушке с необязательным JWT."""
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    return requests.request(method, stub.url + path, headers=headers, timeout=5, **kwargs)
+
+
+@allure.feature("Stub Server")
+@allure.story("Errors And Pagination")
+class TestStubServer:
+    @allure.title("Регистрация, логин и профиль через контроллеры")
+    def test_register_login_profile(self, stub):
+        """Зарегистрированный пользователь логинится и получает свой профиль по выданному JWT."""
+        api = BaseClient()
+        api.base_url = stub.url
+        auth, profile = AuthController(api), ProfileController(api)
+        registration = payload_pool().registration()
+        try:
+            assert auth.register(registration).status == "ok"
+            assert auth.login(LoginRequest(email=registration.email, password=registration.password)).status == "ok"
+            assert profile.get_profile_info().responseData.email == registration.email
+        finally:
+            api.close_session()
+
+    @allure.title("401 без токена, с чужой подписью и при неверном пароле")
+    def test_unauthorized(self, stub):
+        """Защищённые маршруты требуют валидный JWT, логин — верный пароль."""
+        header, payload, _ = stub.tokens["user"].split(".")
+        forged = f"{header}.{payload}.c2lnbmF0dXJl"
+
+        assert call(stub, "GET", endpoint("POSTS")).status_code == 401
+        assert call(stub, "GET", endpoint("POSTS"), token=forged).status_code == 401
+        response = call(stub, "POST", endpoint("AUTH_LOGIN"),
+                        json={"email": "user@stub.example.com", "password": "wrong"})
+        assert response.status_code == 401
+        assert response.json()["status"] == "error"
+
+    @allure.title("403 для администраторских маршрутов без роли ADMIN")
+    def test_forbidden(self, stub):
+        """Пользователь с ролью USER не получает профиль другого пользователя, администратор — получает."""
+        path = endpoint("ADMIN_PROFILE_INFO", user_id=1)
+
+        assert call(stub, "POST", path, token=stub.tokens["user"]).status_code == 403
+        assert call(stub, "POST", path, token=stub.tokens["admin"]).status_code == 200
+
+    @allure.title("404 для несуществующих поста, пользователя и маршрута, 405 для чужого метода")
+    def test_not_found(self, stub):
+        """Ошибки приходят в конверте ApiResponse со статусом error."""
+        token = stub.tokens["admin"]
+
+        response = call(stub, "GET", endpoint("POST", post_id=uuid.uuid4()), token=token)
+        assert response.status_code == 404
+        assert response.json() == {"status": "error", "error": "Post not found", "responseData": None}
+        assert call(stub, "POST", endpoint("ADMIN_PROFILE_INFO", user_id=10**6), token=token).status_code == 404
+        assert call(stub, "GET", "/api/v1/unknown", token=token).status_code == 404
+        assert call(stub, "DELETE", endpoint("POSTS"), token=token).status_code == 405
+
+    @allure.title("Порядок и границы страниц ленты")
+    def test_posts_pagination(self, stub):
+        """По умолчанию новые посты первыми, sort=...,asc — старые первыми; страницы не пересекаются."""
+        token = stub.tokens["user"]
+        titles = [f"Stub pagination post {index}" for index in range(5)]
+        for title in titles:
+            response = call(stub, "POST", endpoint("POST_PUBLISH"), token=token,
+                            json={"title": title, "content": "Stub pagination content"})
+            assert response.status_code == 200
+
+        def page(number: int, **params) -> dict:
+            response = call(stub, "GET", endpoint("POSTS"), token=token, params={"page": number, "size": 2, **params})
+            return response.json()["responseData"]
+
+        first = page(0)
+        assert first["totalElements"] == 5 and first["totalPages"] == 3
+        newest_first = [post["title"] for number in range(3) for post in page(number)["content"]]
+        assert newest_first == titles[::-1]
+        oldest_first = [post["title"] for number in range(3) for post in page(number, sort="createdAt,asc")["content"]]
+        assert oldest_first == titles
+        assert page(3)["content"] == []
@@ -0,0 +1,48 @@
+import allure
+import pytest
+
+from src.clients.http_client.base_client import BaseClient
+from src.stub.server import StubServer
+
+
+@pytest.fixture(scope="module")
+def stub():
+    """Заглушка nanoreddit на время модуля."""
+    with StubServer() as server:
+        yield server
+
+
+def connection_pools(client: BaseClient) -> list:
+    """Пулы urllib3 адаптера клиента."""
+    pools = client.adapter.poolmanager.pools
+    return [pools[key] for key in pools.keys()]
+
+
+@allure.feature("HTTP Transport")
+@allure.story("Connection Warmup")
+class TestWarmup:
+    @allure.title("Прогретые соединения используются запросами сессии")
+    def test_warm_connections_reused(self, stub):
+        """Прогрев открывает соединения в том же пуле, что и запросы сессии: новых соединений запросы не открывают."""
+        client = BaseClient(pool_maxsize=10)
+        client.base_url = stub.url
+        try:
+            assert client.warmup(4) == 4
+            for _ in range(3):
+                assert client.session.get(stub.url + "/api/v1/posts", timeout=5).status_code == 401
+            pools = connection_pools(client)
+            assert len(pools) == 1
+            assert pools[0].num_connections == 4
+        finally:
+            client.close_session()
+
+    @allure.title("Прогрев не открывает больше соединений, чем размер пула")
+    def test_warmup_limited_by_pool_size(self, stub):
+        """Соединения сверх pool_maxsize не сохранились бы в пуле, поэтому не открываются."""
+        client = BaseClient(pool_maxsize=2)
+        client.base_url = stub.url
+        try:
+            assert client.warmup(5) == 2
+            assert [pool.num_connections for pool in connection_pools(client)] == [2]
+        finally:
+            client.close_session()
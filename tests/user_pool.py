@@ -0,0 +1,194 @@
+import base64
+import json
+import os
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+from src.config.env import load_env
+
+load_env()
+
+USER_POOL_PATH = os.getenv("USER_POOL_PATH", os.path.join(os.path.dirname(__file__), ".user-pool.json"))
+# Токен обновляется заранее, если до его истечения осталось меньше этого количества секунд.
+TOKEN_REFRESH_MARGIN = 300
+# Аренда другого прогона старше этого количества секунд считается брошенной, даже если процесс с её pid жив:
+# pid завершившегося воркера мог достаться другому процессу.
+LEASE_TTL = float(os.getenv("USER_POOL_LEASE_TTL", "3600"))
+# Общий id прогона для всех воркеров xdist (без xdist — pid процесса pytest).
+RUN_ID = os.getenv("PYTEST_XDIST_TESTRUNUID", str(os.getpid()))
+
+
+def decode_jwt_expiry(token: str) -> Optional[float]:
+    """Достать время истечения (exp, unix-время) из payload JWT без проверки подписи."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+    except (IndexError, ValueError):
+        return None
+    return float(exp) if exp is not None else None
+
+
+def _pid_alive(pid: int) -> bool:
+    if os.name == "nt":
+        # os.kill(pid, 0) на Windows отправляет CTRL_C_EVENT; брошенные аренды снимаются по LEASE_TTL.
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _lease_expired(entry: Dict[str, Any], now: float) -> bool:
+    """Свободен ли аккаунт: аренды нет, её процесс завершился или аренда другого прогона устарела."""
+    pid = entry.get("leased_by")
+    if pid is None or not _pid_alive(pid):
+        return True
+    return entry.get("lease_run") != RUN_ID and now - (entry.get("leased_at") or 0.0) > LEASE_TTL
+
+
+@contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    """Эксклюзивная межпроцессная блокировка файла path (fcntl на Unix, msvcrt на Windows)."""
+    with open(path, "a+") as lock:
+        if os.name == "nt":
+            import msvcrt
+
+            while True:
+                try:
+                    msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+            try:
+                yield
+            finally:
+                lock.seek(0)
+                msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+class UserPool:
+    """Пул заранее зарегистрированных и авторизованных пользователей, сохраняемый между прогонами.
+
+    Фикстуры берут аккаунт в аренду (lease) и возвращают его (release), вместо того чтобы каждый раз
+    регистрировать пользователя и логиниться (хеширование пароля на сервере — самая дорогая часть фикстур).
+    JWT хранится вместе с временем истечения из токена и обновляется логином, только когда истекает.
+
+    Пул хранится в JSON-файле, доступ к нему сериализуется файловой блокировкой, поэтому воркеры xdist
+    не получают один и тот же аккаунт. Аренда процесса, который завершился не вернув аккаунт, снимается;
+    аренда другого прогона снимается и по истечении LEASE_TTL (USER_POOL_LEASE_TTL), если pid уже занят
+    чужим процессом.
+    """
+
+    def __init__(self, db, register: Callable[[Any], Dict[str, Any]], login: Callable[[Any, str, str], str],
+                 path: str = USER_POOL_PATH) -> None:
+        from src.clients.http_client.auth_controller import AuthController
+        from src.clients.http_client.base_client import BaseClient
+
+        self.path = path
+        self.db = db
+        self.api = BaseClient()
+        self._clients = SimpleNamespace(auth=AuthController(self.api), db=db)
+        self._register = register
+        self._login = login
+        self._validated = False
+
+    @contextmanager
+    def _locked(self) -> Iterator[List[Dict[str, Any]]]:
+        """Прочитать пул под эксклюзивной блокировкой и сохранить изменения при выходе."""
+        with _file_lock(f"{self.path}.lock"):
+            entries = self.load(self.path)
+            yield entries
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"users": entries}, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+
+    @staticmethod
+    def load(path: str = USER_POOL_PATH) -> List[Dict[str, Any]]:
+        """Прочитать записи пула из файла (пустой список, если файла нет)."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f).get("users", [])
+        except FileNotFoundError:
+            return []
+
+    @classmethod
+    def persisted_user_ids(cls, path: str = USER_POOL_PATH) -> Set[int]:
+        """Id пользователей пула — их не нужно удалять при общей очистке базы."""
+        return {entry["user_id"] for entry in cls.load(path)}
+
+    def _validate(self, entries: List[Dict[str, Any]]) -> None:
+        """Убрать из пула аккаунты, которых больше нет в базе (или у которых изменились id или роль)."""
+        db_users = {user.email: user for user in self.db.get_users_by_emails([e["email"] for e in entries])}
+        valid = []
+        for entry in entries:
+            db_user = db_users.get(entry["email"])
+            if db_user is not None and db_user.id == entry["user_id"] and db_user.role == entry["role"]:
+                valid.append(entry)
+        entries[:] = valid
+        self._validated = True
+
+    def _refresh_token(self, entry: Dict[str, Any]) -> None:
+        """Перелогиниться, если токена нет или он скоро истечёт."""
+        expires_at = entry.get("token_expires_at")
+        if entry.get("token") and (expires_at is None or expires_at - time.time() > TOKEN_REFRESH_MARGIN):
+            return
+        entry["token"] = self._login(self._clients, entry["email"], entry["password"])
+        entry["token_expires_at"] = decode_jwt_expiry(entry["token"])
+
+    def _create(self, role: str) -> Dict[str, Any]:
+        """Зарегистрировать новый аккаунт для пула."""
+        entry = self._register(self._clients)
+        if role == "ADMIN":
+            assert self.db.set_admin_role(entry["user_id"]), "Не удалось назначить роль ADMIN"
+        entry["role"] = role
+        entry["token"] = None
+        return entry
+
+    def lease(self, role: str = "USER") -> Dict[str, Any]:
+        """Взять аккаунт с ролью role в аренду; если свободных нет — зарегистрировать новый."""
+        lease = {"leased_by": os.getpid(), "lease_run": RUN_ID, "leased_at": time.time()}
+        with self._locked() as entries:
+            if not self._validated:
+                self._validate(entries)
+            entry = next((e for e in entries if e["role"] == role and _lease_expired(e, lease["leased_at"])), None)
+            if entry is not None:
+                entry.update(lease)
+        if entry is None:
+            entry = self._create(role)
+            entry.update(lease)
+            with self._locked() as entries:
+                entries.append(entry)
+        self._refresh_token(entry)
+        with self._locked() as entries:
+            for stored in entries:
+                if stored["email"] == entry["email"]:
+                    stored.update(entry)
+        return dict(entry)
+
+    def release(self, entry: Dict[str, Any]) -> None:
+        """Вернуть аккаунт в пул: удалить созданные им данные, снять бан и аренду."""
+        self.db.clear_users_data([entry["user_id"]], keep_users=True)
+        self.db.unban_user(entry["user_id"])
+        with self._locked() as entries:
+            for stored in entries:
+                if stored["email"] == entry["email"]:
+                    stored.update(leased_by=None, lease_run=None, leased_at=None)
+
+    def close(self) -> None:
+        """Закрыть HTTP-сессию пула."""
+        self.api.close_session()